@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+CX 리스트 정규화 마이크로벤치마크
+
+기존 방식(df.iterrows + 행마다 pd.notna/strptime)과 services/cx_reader.normalize_cx_frame
+(컬럼 단위 일괄 처리)의 처리 시간을 같은 가상 데이터로 비교합니다.
+
+사용 예:
+  python benchmark/bench_cx_normalize.py --rows 50000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.cx_reader import CX_COLUMNS, normalize_cx_frame
+
+def generate_frame(rows, seed=42):
+    """요청날짜 형식/빈 값/접두어가 섞인 가상 CX 리스트"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    data = []
+    for index in range(1, rows + 1):
+        day = base + timedelta(days=rng.randrange(365))
+        date_value = rng.choice([day, day.strftime('%Y-%m-%d'), day.strftime('%Y/%m/%d'), day.strftime('%m/%d/%Y'), None])
+        data.append({
+            'NO': index,
+            '요청날짜': date_value,
+            '담당자': rng.choice(['김담당', '이담당', '박담당', None]),
+            '주문번호': None if rng.random() < 0.02 else f"AMT{rng.randrange(10**9):09d}",
+            '고객명': f"고객{index}",
+            '요청분류': rng.choice(['객실변경', '일정변경', '취소요청']),
+            '요청사유': 'cx_list.xlsx_고객 요청',
+            '요청사항': rng.choice(['cx_list.xlsx_객실 타입 변경 요청', '조식 추가 요청', None])
+        })
+    return pd.DataFrame(data, columns=list(CX_COLUMNS))
+
+def legacy_format_date(date_value):
+    """기존 format_date_to_yyyy_mm_dd (행마다 호출)"""
+    if not date_value or pd.isna(date_value):
+        return ""
+    try:
+        if hasattr(date_value, 'strftime'):
+            return date_value.strftime('%Y-%m-%d')
+        date_str = str(date_value)
+        if re.match(r'\d{4}-\d{2}-\d{2}$', date_str):
+            return date_str
+        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y']:
+            try:
+                return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return date_str
+    except Exception:
+        return str(date_value)
+
+def legacy_normalize(df):
+    """기존 read_cx_excel_data의 행 단위 처리 (+ 메일 생성 시 하던 접두어 제거)"""
+    excel_data = []
+    for index, row in df.iterrows():
+        order_number = str(row['주문번호']).strip() if pd.notna(row['주문번호']) else ""
+        if order_number and order_number != 'nan':
+            excel_data.append({
+                'no': row['NO'] if pd.notna(row['NO']) else "",
+                'request_date': legacy_format_date(row['요청날짜']),
+                'manager': row['담당자'] if pd.notna(row['담당자']) else "",
+                'order_number': order_number,
+                'customer_name': row['고객명'] if pd.notna(row['고객명']) else "",
+                'request_category': row['요청분류'] if pd.notna(row['요청분류']) else "",
+                'request_reason': (row['요청사유'] if pd.notna(row['요청사유']) else "").replace('cx_list.xlsx_', ''),
+                'request_content': (row['요청사항'] if pd.notna(row['요청사항']) else "").replace('cx_list.xlsx_', '')
+            })
+    return excel_data
+
+def measure(func, df, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(df)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="CX 리스트 정규화 마이크로벤치마크")
+    parser.add_argument('--rows', type=int, default=50000, help="가상 행 수")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    df = generate_frame(args.rows, args.seed)
+    legacy_seconds, legacy_records = measure(legacy_normalize, df, args.repeat)
+    vector_seconds, vector_records = measure(normalize_cx_frame, df, args.repeat)
+
+    mismatched = sum(1 for old, new in zip(legacy_records, vector_records) if old != new)
+    print(f"===== CX 리스트 정규화 ({args.rows}행) =====")
+    print(f"기존 (iterrows): {legacy_seconds * 1000:.1f}ms, {len(legacy_records)}건")
+    print(f"컬럼 단위 처리: {vector_seconds * 1000:.1f}ms, {len(vector_records)}건")
+    print(f"속도 향상: {legacy_seconds / vector_seconds:.1f}배" if vector_seconds > 0 else "속도 향상: -")
+    print(f"결과 불일치: {mismatched + abs(len(legacy_records) - len(vector_records))}건")
+
+if __name__ == "__main__":
+    main()
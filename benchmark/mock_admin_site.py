@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+관리자 사이트(adm.allmytour.com) 로컬 모의 서버 (벤치마크/성능 측정용)
+
+- 로그인 폼(userId/userPasswd) → 로그인 후 예약목록으로 이동
+- /orders 검색 페이지: 실제 사이트와 같은 마크업
+  (tr[data-order_num], div.order_title, 14번째 td 투숙자 셀, form.send_confirm input.confirm_input)
+- 응답 지연/실패 비율을 설정할 수 있음
+
+단독 실행: python benchmark/mock_admin_site.py --port 8765 --orders 100 --latency-ms 200
+"""
+import argparse
+import html
+import random
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+SESSION_COOKIE = "mock_admin_session"
+
+HOTELS = ["그랜드 하얏트 서울", "롯데호텔 제주", "파라다이스 부산", "신라스테이 광화문", "켄싱턴 설악"]
+ROOMS = ["디럭스 더블", "스탠다드 트윈", "패밀리 스위트", "오션뷰 킹"]
+PRODUCTS = ["조식 포함", "룸온리", "얼리체크인 패키지"]
+GUESTS = ["김민수", "이지은", "박서준", "최유진", "정하늘"]
+
+def generate_orders(count, start_number=202500000001, seed=42, base_date=None):
+    """가상 주문 생성. 반환: {주문번호: 예약 정보}"""
+    rng = random.Random(seed)
+    base_date = base_date or datetime.now()
+    orders = {}
+    for i in range(count):
+        order_number = str(start_number + i)
+        checkin = base_date + timedelta(days=rng.randint(1, 60))
+        nights = rng.randint(1, 4)
+        orders[order_number] = {
+            'order_number': order_number,
+            'request_date': (base_date - timedelta(days=rng.randint(0, 7))).strftime('%Y-%m-%d'),
+            'checkin': checkin.strftime('%Y-%m-%d'),
+            'checkout': (checkin + timedelta(days=nights)).strftime('%Y-%m-%d'),
+            'hotel_name': rng.choice(HOTELS),
+            'room_name': rng.choice(ROOMS),
+            'product_name': rng.choice(PRODUCTS),
+            'guest_name': rng.choice(GUESTS),
+            'guest_phone': f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            'room_count': str(rng.randint(1, 3)),
+            'book_no': f"CFM{rng.randint(100000, 999999)}"
+        }
+    return orders
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>관리자 로그인</title>
+<link rel="stylesheet" href="/static/app.css"></head>
+<body>
+<img src="/static/logo.png" alt="logo">
+<form method="post" action="/login">
+  <input type="text" name="userId">
+  <input type="password" name="userPasswd">
+  <input type="submit" value="LOGIN">
+</form>
+{error}
+</body></html>"""
+
+ORDERS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>예약목록</title>
+<link rel="stylesheet" href="/static/app.css"></head>
+<body>
+<img src="/static/logo.png" alt="logo">
+<table class="order_list">
+<tbody>
+{rows}
+</tbody>
+</table>
+{no_data}
+</body></html>"""
+
+def render_order_row(order):
+    """실제 예약목록과 같은 위치에 값을 배치한 행 (td 13번 = 투숙자, td 8번 = 객실수)"""
+    e = {k: html.escape(v) for k, v in order.items()}
+    cells = [
+        '<td><input type="checkbox"></td>',
+        f'<td><a class="blue_link" href="/orders/{e["order_number"]}">{e["order_number"]}</a></td>',
+        '<td><div class="order_title">'
+        f'<div><button type="button">1</button> {e["hotel_name"]}</div>'
+        f'<div>● {e["room_name"]}</div>'
+        f'<div>{e["product_name"]} <a href="#">LMS확인</a></div>'
+        '</div></td>',
+        f'<td>{e["request_date"]}</td>',
+        '<td>올마이투어</td>',
+        '<td>결제완료</td>',
+        '<td>확정</td>',
+        f'<td>{e["checkin"]}</td>',
+        f'<td><div>{e["room_count"]}</div></td>',
+        '<td>150,000</td>',
+        '<td>0</td>',
+        '<td>150,000</td>',
+        '<td>카드</td>',
+        f'<td><div>{e["guest_name"]}</div><div>{e["guest_phone"]}</div></td>',
+        '<td><form class="send_confirm">'
+        f'<input type="text" class="confirm_input" value="{e["book_no"]} 10:20:30">'
+        '</form></td>'
+    ]
+    return (f'<tr data-order_num="{e["order_number"]}" data-checkin="{e["checkin"]}" '
+            f'data-checkout="{e["checkout"]}">{"".join(cells)}</tr>')
+
+class MockAdminSite:
+    """모의 관리자 사이트 (ThreadingHTTPServer를 백그라운드 스레드로 실행)"""
+
+    def __init__(self, orders, host="127.0.0.1", port=8765, latency_ms=0, latency_jitter_ms=0,
+                 failure_rate=0.0, asset_latency_ms=100, user_id=None, password=None, seed=None):
+        self.orders = orders
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.failure_rate = failure_rate
+        self.asset_latency_ms = asset_latency_ms
+        self.user_id = user_id
+        self.password = password
+        self.sessions = set()
+        self.stats = {'orders_requests': 0, 'failures': 0, 'logins': 0, 'asset_requests': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        site = self
+
+        class Handler(MockAdminHandler):
+            pass
+        Handler.site = site
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"모의 관리자 사이트 시작: {self.base_url} (주문 {len(self.orders)}건, 지연 {self.latency_ms}ms, 실패율 {self.failure_rate:.0%})")
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def response_delay(self):
+        jitter = self._rng.uniform(-self.latency_jitter_ms, self.latency_jitter_ms) if self.latency_jitter_ms else 0
+        return max(0.0, (self.latency_ms + jitter) / 1000.0)
+
+    def should_fail(self):
+        with self._lock:
+            return self.failure_rate > 0 and self._rng.random() < self.failure_rate
+
+    def check_credentials(self, user_id, password):
+        if not user_id or not password:
+            return False
+        if self.user_id is not None and user_id != self.user_id:
+            return False
+        if self.password is not None and password != self.password:
+            return False
+        return True
+
+    def new_session(self):
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.sessions.add(token)
+        return token
+
+    def search(self, query):
+        """검색 조건에 맞는 주문 목록 (주문번호 검색 또는 이용일 기간 검색 + 페이지)"""
+        keyword = query.get('keyword', [''])[0].strip()
+        if keyword:
+            order = self.orders.get(keyword)
+            return [order] if order else []
+
+        start_date = query.get('startDate', [''])[0]
+        end_date = query.get('endDate', [''])[0]
+        matched = [
+            order for order in self.orders.values()
+            if (not start_date or order['checkin'] >= start_date) and (not end_date or order['checkin'] <= end_date)
+        ]
+        try:
+            per_page = max(1, int(query.get('perPage', ['20'])[0]))
+            page = max(1, int(query.get('page', ['1'])[0]))
+        except ValueError:
+            per_page, page = 20, 1
+        return matched[(page - 1) * per_page:page * per_page]
+
+class MockAdminHandler(BaseHTTPRequestHandler):
+    site = None
+
+    def log_message(self, format, *args):
+        pass  # 요청 로그 출력 생략 (벤치마크 출력 보호)
+
+    def _session_token(self):
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def _logged_in(self):
+        return self._session_token() in self.site.sessions
+
+    def _send(self, status, body="", content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location, headers=None):
+        self._send(302, "", headers=dict(headers or {}, Location=location))
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip('/') or '/'
+
+        if path.startswith('/static/'):
+            # 이미지/CSS (빠른 로딩 프로필 효과 측정용 지연 포함)
+            self.site.count('asset_requests')
+            time.sleep(self.site.asset_latency_ms / 1000.0)
+            if path.endswith('.css'):
+                self._send(200, "body { font-family: sans-serif; }", "text/css")
+            else:
+                self._send(200, b"\x89PNG\r\n\x1a\n", "image/png", {'Cache-Control': 'max-age=3600'})
+            return
+
+        if path == '/':
+            self._redirect('/orders' if self._logged_in() else '/login')
+        elif path == '/login':
+            self._send(200, LOGIN_PAGE.format(error=""))
+        elif path == '/orders':
+            if not self._logged_in():
+                self._redirect('/login')
+                return
+            self.site.count('orders_requests')
+            time.sleep(self.site.response_delay())
+            # 실패 주입은 검색 요청에만 적용 (로그인 직후 예약목록 진입은 정상 응답)
+            if parsed.query and self.site.should_fail():
+                self.site.count('failures')
+                self._send(500, "<html><body>Internal Server Error</body></html>")
+                return
+            orders = self.site.search(parse_qs(parsed.query))
+            rows = "\n".join(render_order_row(order) for order in orders)
+            no_data = "" if orders else '<div class="no_data">검색 결과가 없습니다.</div>'
+            self._send(200, ORDERS_PAGE.format(rows=rows, no_data=no_data))
+        else:
+            self._send(404, "<html><body>Not Found</body></html>")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') != '/login':
+            self._send(404, "<html><body>Not Found</body></html>")
+            return
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        user_id = form.get('userId', [''])[0]
+        password = form.get('userPasswd', [''])[0]
+        if not self.site.check_credentials(user_id, password):
+            self._send(200, LOGIN_PAGE.format(error='<p class="error">아이디 또는 비밀번호가 올바르지 않습니다.</p>'))
+            return
+        self.site.count('logins')
+        token = self.site.new_session()
+        # 로그인 후 이동 (실제 사이트와 같이 루트 → 예약목록)
+        self._redirect('/', {'Set-Cookie': f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+
+def main():
+    parser = argparse.ArgumentParser(description="관리자 사이트 로컬 모의 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--orders', type=int, default=100, help="가상 주문 수")
+    parser.add_argument('--latency-ms', type=float, default=0, help="/orders 응답 지연 (ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="응답 지연 편차 (±ms)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="/orders 검색 500 응답 비율 (0~1)")
+    parser.add_argument('--asset-latency-ms', type=float, default=100, help="이미지/CSS 응답 지연 (ms)")
+    args = parser.parse_args()
+
+    site = MockAdminSite(
+        generate_orders(args.orders), host=args.host, port=args.port, latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms, failure_rate=args.failure_rate, asset_latency_ms=args.asset_latency_ms
+    ).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
+        print(f"모의 관리자 사이트 종료: {site.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+RPA 처리량 벤치마크 (모의 관리자 사이트 대상)
+
+가상 주문 N건으로 CX 엑셀과 임시 설정을 만들고 cxlist_rpa_v2.1.py를 실행하여
+분당 처리 건수, 주문별 처리 시간(p50/p95), 최대 메모리(RSS, Chrome 포함)를 보고합니다.
+
+사용 예:
+  python benchmark/run_benchmark.py --orders 50 --workers 2 --latency-ms 200
+  python benchmark/run_benchmark.py --orders 50 --fast-profile both   # 빠른 로딩 프로필 비교
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from mock_admin_site import MockAdminSite, generate_orders
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RPA_SCRIPT = os.path.join(PROJECT_ROOT, 'cxlist_rpa_v2.1.py')
+BASE_CONFIG = os.path.join(PROJECT_ROOT, 'cx_claim_config.json')
+LOCK_FILE = os.path.join(PROJECT_ROOT, 'cx_claim_scheduler.lock')
+
+START_PATTERN = re.compile(r'\d+/\d+ 처리 시작: 주문번호 (\S+) ---')
+RESULT_PATTERN = re.compile(r'^결과 기록: (\S+)\t.*\t(\S+)\t')
+# RPA 종료 시 출력되는 대기 구간별 통계 (report_wait_stats)
+WAIT_STAT_PATTERN = re.compile(r'대기 통계 \[(\S+)\] (\d+)회, 평균 ([\d.]+)초, 최대 ([\d.]+)초')
+
+def write_cx_excel(orders, path):
+    """가상 주문으로 CX 엑셀(list 시트) 생성"""
+    rows = [{
+        'NO': index,
+        '요청날짜': order['request_date'],
+        '담당자': '벤치마크',
+        '주문번호': order['order_number'],
+        '고객명': order['guest_name'],
+        '요청분류': '객실변경',
+        '요청사유': '고객 요청',
+        '요청사항': '객실 타입 변경 요청'
+    } for index, order in enumerate(orders.values(), 1)]
+    pd.DataFrame(rows).to_excel(path, sheet_name='list', index=False)
+
+def write_benchmark_config(work_dir, site, excel_path, args, fast_profile):
+    """기본 설정을 복사해 모의 사이트/임시 디렉토리/벤치마크 옵션으로 덮어쓴 설정 파일 생성"""
+    with open(BASE_CONFIG, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    config['login'] = {'url': site.base_url, 'user_id': 'benchmark', 'password': 'benchmark'}
+    config['urls'] = {'base_url': site.base_url, 'orders_page': '/orders'}
+    config['file_paths'] = {
+        'cx_excel': excel_path,
+        'claim_list_dir': os.path.join(work_dir, 'claim_list'),
+        'results_dir': os.path.join(work_dir, 'results'),
+        'logs_dir': os.path.join(work_dir, 'logs')
+    }
+    config.setdefault('excel_settings', {})['test_mode'] = {'enabled': False}
+    config.setdefault('worker_pool', {})['workers'] = args.workers
+    config.setdefault('extraction', {})['mode'] = args.mode
+    config.setdefault('batch_lookup', {})['enabled'] = args.batch
+    # 이전 실행 결과 재사용 방지
+    config.setdefault('reservation_cache', {})['enabled'] = False
+    config.setdefault('journal', {})['enabled'] = False
+    config.setdefault('fast_profile', {})['enabled'] = fast_profile
+
+    config_path = os.path.join(work_dir, 'benchmark_config.json')
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+    return config_path
+
+def process_tree_rss(root_pid):
+    """프로세스 트리(RPA + chromedriver + Chrome) 전체 RSS (바이트, Linux /proc 기반)"""
+    children = {}
+    rss = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+            rss[int(entry)] = int(fields[21]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * (len(ordered) - 1)))))
+    return ordered[index]
+
+def run_rpa(config_path, timeout):
+    """RPA 실행 후 stdout을 시각과 함께 수집하고 최대 RSS를 측정합니다."""
+    env = dict(os.environ, CONFIG_FILE_PATH=config_path, PYTHONUNBUFFERED='1', PYTHONIOENCODING='utf-8')
+    env.pop('BROWSER_POOL_ADDRESSES', None)
+    env.pop('JOURNAL_FILE_PATH', None)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, RPA_SCRIPT], cwd=PROJECT_ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding='utf-8', errors='replace'
+    )
+
+    peak = {'rss': 0}
+    sampling = threading.Event()
+
+    def sample_rss():
+        while not sampling.is_set():
+            if os.path.isdir('/proc'):
+                peak['rss'] = max(peak['rss'], process_tree_rss(process.pid))
+            sampling.wait(0.2)
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    watchdog = threading.Timer(timeout, process.kill)
+    watchdog.start()
+
+    order_started = {}
+    latencies = {}
+    statuses = {}
+    wait_stats = {}
+    try:
+        for line in process.stdout:
+            now = time.perf_counter()
+            line = line.rstrip('\n')
+            wait_match = WAIT_STAT_PATTERN.search(line)
+            if wait_match:
+                name, count, average, maximum = wait_match.groups()
+                wait_stats[name] = {'count': int(count), 'avg_seconds': float(average), 'max_seconds': float(maximum)}
+                continue
+            start_match = START_PATTERN.search(line)
+            if start_match:
+                # 재시도 대기열로 다시 처리되는 경우 마지막 시작 시각 기준
+                order_started[start_match.group(1)] = now
+                continue
+            result_match = RESULT_PATTERN.search(line)
+            if result_match:
+                order_number, status = result_match.groups()
+                if order_number in order_started:
+                    latencies[order_number] = now - order_started[order_number]
+                statuses[status] = statuses.get(status, 0) + 1
+        process.wait()
+    finally:
+        if time.perf_counter() - started >= timeout:
+            print(f"시간 초과 ({timeout}초) - RPA 강제 종료")
+        watchdog.cancel()
+        sampling.set()
+        sampler.join()
+
+    return {
+        'elapsed': time.perf_counter() - started,
+        'exit_code': process.returncode,
+        'latencies': list(latencies.values()),
+        'statuses': statuses,
+        'wait_stats': wait_stats,
+        'page_load': wait_stats.get('page_load'),
+        'peak_rss_mb': peak['rss'] / (1024 * 1024)
+    }
+
+def run_benchmark(args, fast_profile):
+    orders = generate_orders(args.orders, seed=args.seed)
+    site = MockAdminSite(
+        orders, port=args.port, latency_ms=args.latency_ms, latency_jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate, asset_latency_ms=args.asset_latency_ms, seed=args.seed
+    ).start()
+    try:
+        with tempfile.TemporaryDirectory(prefix='cx_claim_benchmark_') as work_dir:
+            excel_path = os.path.join(work_dir, 'cx_list_benchmark.xlsx')
+            write_cx_excel(orders, excel_path)
+            config_path = write_benchmark_config(work_dir, site, excel_path, args, fast_profile)
+            result = run_rpa(config_path, args.timeout)
+    finally:
+        site.stop()
+
+    processed = sum(result['statuses'].values())
+    result.update({
+        'fast_profile': fast_profile,
+        'orders': args.orders,
+        'processed': processed,
+        'orders_per_minute': processed / result['elapsed'] * 60 if result['elapsed'] > 0 else 0.0,
+        'p50_seconds': percentile(result['latencies'], 0.50),
+        'p95_seconds': percentile(result['latencies'], 0.95),
+        'site_stats': dict(site.stats)
+    })
+    del result['latencies']
+    return result
+
+def format_page_load(page_load):
+    if not page_load:
+        return "기록 없음"
+    return f"평균 {page_load['avg_seconds']:.3f}초, 최대 {page_load['max_seconds']:.3f}초 ({page_load['count']}회)"
+
+def print_report(results):
+    print("\n===== 벤치마크 결과 =====")
+    for result in results:
+        label = "빠른 로딩 프로필 사용" if result['fast_profile'] else "기본 프로필"
+        print(f"[{label}]")
+        print(f"  처리: {result['processed']}/{result['orders']}건, 소요 {result['elapsed']:.1f}초 (종료 코드 {result['exit_code']})")
+        print(f"  처리량: {result['orders_per_minute']:.1f}건/분")
+        print(f"  주문별 처리 시간: p50 {result['p50_seconds']:.2f}초, p95 {result['p95_seconds']:.2f}초")
+        print(f"  페이지 로드: {format_page_load(result['page_load'])}")
+        print(f"  최대 메모리(RSS): {result['peak_rss_mb']:.1f}MB")
+        print(f"  결과 상태: {result['statuses']}")
+        print(f"  모의 사이트: {result['site_stats']}")
+
+    # --fast-profile both: 프로필별 페이지 로드 시간 비교
+    by_profile = {result['fast_profile']: result for result in results}
+    if len(by_profile) == 2:
+        default_load, fast_load = by_profile[False]['page_load'], by_profile[True]['page_load']
+        print("\n===== 페이지 로드 시간 비교 =====")
+        print(f"  기본 프로필:         {format_page_load(default_load)}")
+        print(f"  빠른 로딩 프로필:    {format_page_load(fast_load)}")
+        if default_load and fast_load and default_load['avg_seconds'] > 0:
+            change = (1 - fast_load['avg_seconds'] / default_load['avg_seconds']) * 100
+            print(f"  평균 단축률: {change:.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 관리자 사이트 대상 RPA 처리량 벤치마크")
+    parser.add_argument('--orders', type=int, default=20, help="가상 주문 수")
+    parser.add_argument('--workers', type=int, default=1, help="worker_pool.workers")
+    parser.add_argument('--mode', choices=['browser', 'http'], default='browser', help="extraction.mode")
+    parser.add_argument('--batch', action='store_true', help="batch_lookup.enabled")
+    parser.add_argument('--fast-profile', choices=['off', 'on', 'both'], default='off',
+                        help="빠른 로딩 프로필 (both: 미사용/사용 순서로 두 번 실행해 비교)")
+    parser.add_argument('--port', type=int, default=0, help="모의 사이트 포트 (0: 자동)")
+    parser.add_argument('--latency-ms', type=float, default=100, help="/orders 응답 지연 (ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="응답 지연 편차 (±ms)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="/orders 검색 500 응답 비율 (0~1)")
+    parser.add_argument('--asset-latency-ms', type=float, default=100, help="이미지/CSS 응답 지연 (ms)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=1800, help="실행 제한 시간 (초)")
+    parser.add_argument('--json-out', help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    if os.path.exists(LOCK_FILE):
+        print(f"다른 RPA 실행이 진행 중입니다 (Lock 파일: {LOCK_FILE}). 종료 후 다시 실행하세요.")
+        sys.exit(1)
+
+    profiles = {'off': [False], 'on': [True], 'both': [False, True]}[args.fast_profile]
+    results = [run_benchmark(args, fast_profile) for fast_profile in profiles]
+    print_report(results)
+
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json_out}")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,34 @@
 import os
 import time
 import json
-import pandas as pd
+import queue
+import atexit
+import random
+import signal
+import sqlite3
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 import re
 from datetime import datetime, timedelta
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 # from webdriver_manager.chrome import ChromeDriverManager  # 시스템 ChromeDriver 사용으로 주석 처리
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from html.parser import HTMLParser
+import requests
+from requests.adapters import HTTPAdapter
+from services.chrome_setup import create_chrome_driver
+from services import admin_login
+from services.template_engine import TemplateError, compile_template
+from services.progress_channel import ProgressReporter
+from services.cx_reader import DEFAULT_CHUNK_SIZE, iter_cx_records
 
 # ✅ 1. [설정 파일 로드]
 # 실행기(UI)에서 내려주는 임시 설정 파일 우선 사용 (환경변수)
@@ -61,9 +76,41 @@ os.makedirs(result_dir, exist_ok=True)
 os.makedirs(claim_dir, exist_ok=True)
 
 # 전역 변수
+driver = None
 main_window = None
 log_file = None
 result_file = None
+# 병렬 워커용 추가 드라이버 목록 (종료 시 일괄 정리)
+worker_drivers = []
+# 브라우저 풀에서 연결한 드라이버 (종료 시 브라우저는 유지)
+attached_drivers = []
+# 실행 중인 워커 스레드와 중지 신호 (종료 시 워커가 다음 주문을 꺼내지 않도록 하고 끝날 때까지 대기)
+worker_threads = []
+worker_stop_event = threading.Event()
+# HTTP 추출 모드용 세션 (Selenium 로그인 쿠키 공유)
+http_session = None
+# 일괄 조회 모드용 주문번호 → 예약 정보 인덱스
+reservation_index = {}
+lookup_stats = {'saved': 0}  # 같은 주문번호 행에서 재사용하여 생략한 예약 조회 수
+rate_limiter = None
+circuit_breaker = None
+governance_stats = {'retries': 0}
+# 주문별 단계 소요 시간 지표 (JSONL, 실행별 파일)
+order_metrics = None
+# 예약 정보 디스크 캐시 (reservation_cache.enabled 시 사용)
+reservation_cache = None
+# 체크포인트 저널 (실행 재개용)
+checkpoint_journal = None
+# 클레임 엑셀 작성 스레드 (스크래핑 스레드가 xlsx 저장을 기다리지 않도록 분리)
+claim_writer = None
+# 출력 단계 파이프라인 (조회가 끝난 주문의 엑셀/메일 파일 작성)
+output_pipeline = None
+# 주문 행별 최종 결과 건수 (엑셀 작성 완료 콜백에서도 집계)
+run_stats = {}
+# 워커(스레드)별 드라이버/워커 ID 보관
+_worker_context = threading.local()
+# 처리 통계 집계 보호용 Lock
+_log_lock = threading.Lock()
 # 프로젝트별 독립적인 Lock 파일 (동시 실행 방지)
 try:
     script_dir = os.path.dirname(__file__)
@@ -104,19 +151,170 @@ def remove_lock_file():
     except:
         pass
 
+# ✅ 출력 파일명 할당기 ("{접두어}_{번호:03}{접미어}" 형식, 디렉토리는 처음 한 번만 스캔)
+class FilenameAllocator:
+    """디렉토리별로 (접두어, 접미어) → 마지막 번호를 메모리에 두고 다음 번호를 O_EXCL로 선점합니다."""
+    INDEX_PATTERN = re.compile(r'_(\d{3,})')
+    # 작성 중인 파일의 선점 표시 (완성되면 최종 파일명으로 교체)
+    PART_SUFFIX = '.part'
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def _scan(self, directory):
+        """디렉토리를 한 번 훑어 기존 파일명(작성 중인 .part 포함)의 번호 후보를 모두 등록"""
+        counters = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(self.PART_SUFFIX):
+                        name = name[:-len(self.PART_SUFFIX)]
+                    # 번호 위치를 특정할 수 없으므로 "_숫자3자리 이상"마다 (앞, 번호, 뒤)로 등록
+                    for match in self.INDEX_PATTERN.finditer(name):
+                        key = (name[:match.start()], name[match.end():])
+                        counters[key] = max(counters.get(key, 0), int(match.group(1)))
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+        return counters
+
+    def allocate(self, directory, prefix, suffix, partial=False):
+        """다음 번호의 빈 파일을 만들어 경로를 반환 (다른 워커/프로세스와 겹치면 다음 번호 시도)
+        partial=True면 "{경로}.part"만 선점하고 최종 경로를 반환 → write_claimed_file로 작성"""
+        with self._lock:
+            counters = self._counters.get(directory)
+            if counters is None:
+                counters = self._counters[directory] = self._scan(directory)
+            index = counters.get((prefix, suffix), 0) + 1
+            while True:
+                path = os.path.join(directory, f"{prefix}_{index:03}{suffix}")
+                claim_path = path + self.PART_SUFFIX if partial else path
+                try:
+                    os.close(os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    index += 1
+                    continue
+                if partial and os.path.exists(path):
+                    # 다른 프로세스가 이미 완성한 번호
+                    os.remove(claim_path)
+                    index += 1
+                    continue
+                counters[(prefix, suffix)] = index
+                return path
+
+def discard_claimed_file(path):
+    """선점만 하고 완성하지 못한 "{경로}.part" 삭제"""
+    try:
+        os.remove(path + FilenameAllocator.PART_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+def write_claimed_file(path, write):
+    """선점한 "{경로}.part"에 write(임시 경로)로 작성한 뒤 최종 경로로 교체 (실패 시 .part 삭제)
+    최종 파일명에는 완성된 파일만 생기므로 빈 파일/작성 중 파일이 결과로 남지 않음"""
+    part_path = path + FilenameAllocator.PART_SUFFIX
+    try:
+        write(part_path)
+        os.replace(part_path, path)
+    except BaseException:
+        discard_claimed_file(path)
+        raise
+
+filename_allocator = FilenameAllocator()
+
 # ✅ 자동 인덱스 파일명 생성 함수
 def generate_log_filename(base_dir, prefix, today):
-    index = 1
-    while True:
-        file_name = f"{prefix}_{index:03}_{today}.txt"
-        full_path = os.path.join(base_dir, file_name)
-        if not os.path.exists(full_path):
-            return full_path
-        index += 1
+    return filename_allocator.allocate(base_dir, prefix, f"_{today}.txt")
 
 # ✅ 로그 및 결과 파일명 자동 생성
 log_file = generate_log_filename(log_dir, "발송여부", today)
 result_file = generate_log_filename(result_dir, "에러로그", today)
+# 주문별 처리 결과 (기계 판독용 JSONL, 발송여부 로그와 같은 번호)
+result_stream_file = os.path.splitext(log_file)[0] + "_results.jsonl"
+
+# ✅ 비동기 로그 기록기 (호출마다 파일을 열고 닫지 않고 백그라운드 스레드가 묶어서 기록)
+class AsyncLogWriter:
+    """(파일 경로, 줄)을 큐에 넣으면 백그라운드 스레드가 flush_interval초 또는 batch_size줄마다 묶어서 기록"""
+
+    def __init__(self, flush_interval=1.0, batch_size=200):
+        self.flush_interval = float(flush_interval)
+        self.batch_size = max(1, int(batch_size))
+        self._queue = queue.Queue()
+        self._files = {}
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, path, line):
+        self._queue.put((path, line))
+
+    def flush(self, timeout=5.0):
+        """지금까지 넣은 줄이 모두 디스크에 기록될 때까지 대기"""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """남은 줄을 기록하고 파일을 닫음 (프로세스 종료 시 호출)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        pending = []
+        last_flush = time.monotonic()
+        while True:
+            # 쌓인 줄이 있으면 flush_interval까지만 대기, 없으면 다음 줄이 올 때까지 대기
+            timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush)) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+            if isinstance(item, tuple):
+                pending.append(item)
+                if len(pending) < self.batch_size:
+                    continue
+            self._write_batch(pending)
+            pending = []
+            last_flush = time.monotonic()
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                break
+        for f in self._files.values():
+            f.close()
+
+    def _write_batch(self, pending):
+        touched = set()
+        for path, line in pending:
+            try:
+                f = self._files.get(path)
+                if f is None:
+                    f = self._files[path] = open(path, 'a', encoding='utf-8')
+                f.write(line + '\n')
+                touched.add(path)
+            except Exception as e:
+                print(f"로그 기록 실패 ({path}): {e}")
+        for path in touched:
+            try:
+                self._files[path].flush()
+            except Exception:
+                pass
+
+log_writer = AsyncLogWriter(
+    config.get('logging', {}).get('flush_interval', 1.0),
+    config.get('logging', {}).get('flush_batch_size', 200)
+)
+atexit.register(log_writer.close)
+
+# ✅ 실시간 진행 상황 채널 (웹 실행 시 실행기가 PROGRESS_ADDRESS로 수신 소켓 주소 전달)
+progress_reporter = ProgressReporter(os.environ.get('PROGRESS_ADDRESS'))
+atexit.register(progress_reporter.close)
 
 # ✅ 안전한 타이밍 접근자
 def get_timing(name, default_seconds):
@@ -128,84 +326,66 @@ def get_timing(name, default_seconds):
 # ✅ 로그 파일에 기록
 def log_debug(message):
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_content = f"[{timestamp}] {message}"
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(log_content + '\n')
+    log_writer.write(log_file, f"[{timestamp}] {message}")
     print(message)
 
-# ✅ 결과 파일에 기록
+# ✅ 결과 파일에 기록 (모든 워커의 결과가 하나의 JSONL 파일로 합쳐짐)
 def log_result(order_number, email_subject, status, timestamp):
-    result_content = f"{order_number}\t{email_subject}\t{status}\t{timestamp}"
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(result_content + '\n')
-    log_debug(f"결과 기록: {result_content}")
+    with stage_timer("result_log"):
+        log_writer.write(result_stream_file, json.dumps({
+            'order_number': order_number,
+            'subject': email_subject,
+            'status': status,
+            'timestamp': timestamp,
+            'worker_id': current_worker_id()
+        }, ensure_ascii=False))
+        log_debug(f"결과 기록: {order_number}\t{email_subject}\t{status}\t{timestamp}")
 
 # ✅ 에러 로그 기록
 def log_error(message):
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    error_content = f"[{timestamp}] ERROR: {message}"
-    with open(result_file, 'a', encoding='utf-8') as f:
-        f.write(error_content + '\n')
+    log_writer.write(result_file, f"[{timestamp}] ERROR: {message}")
     print(f"ERROR: {message}")
 
-# ✅ 공통 Selenium 헬퍼 (서버 안정화용)
-def wait_for_presence(driver, locator, timeout=30):
-    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+# ✅ 종료 신호 처리 (실행기 stop_project의 SIGTERM → 로그 기록 후 정리 단계 진행)
+def handle_sigterm(signum, frame):
+    print("종료 신호 수신 - 로그 기록 후 종료합니다.")
+    log_writer.flush()
+    raise SystemExit(128 + signum)
 
-def wait_for_clickable(driver, locator, timeout=30):
-    return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+# ✅ 현재 워커의 드라이버 반환 (워커 풀 미사용 시 메인 드라이버)
+def current_driver():
+    return getattr(_worker_context, 'driver', None) or driver
 
-def type_safely(driver, locator, text, clear=True, timeout=30):
-    element = wait_for_presence(driver, locator, timeout)
-    try:
-        if clear:
-            element.clear()
-        element.send_keys(text)
-        return True
-    except StaleElementReferenceException:
-        element = wait_for_presence(driver, locator, timeout)
-        if clear:
-            element.clear()
-        element.send_keys(text)
-        return True
-    except Exception as e:
-        log_error(f"입력 실패 {locator}: {e}")
-        return False
+def current_worker_id():
+    return getattr(_worker_context, 'worker_id', 0)
 
-def click_safely(driver, locators, retries=3, scroll=True):
-    for attempt in range(retries):
-        try:
-            # 매 시도마다 새로 조회
-            for by, sel in locators:
-                elems = driver.find_elements(by, sel)
-                if elems:
-                    el = elems[0]
-                    if scroll:
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-                    # JS 클릭(레이어 가림 회피)
-                    driver.execute_script("arguments[0].click();", el)
-                    return True
-            time.sleep(0.3)
-        except StaleElementReferenceException:
-            time.sleep(0.3)
-            continue
-        except Exception:
-            time.sleep(0.3)
-            continue
-    return False
+# ✅ 이벤트 기반 대기 레이어 (고정 sleep 대신 DOM 조건 대기 + 실제 대기 시간 기록)
+wait_durations = {}
 
-def submit_form_safely(driver, from_element):
+def record_wait(name, elapsed):
+    with _log_lock:
+        wait_durations.setdefault(name, []).append(elapsed)
+
+def timed_wait(name, driver, condition, timeout, poll_frequency=0.1):
+    """condition이 참이 될 때까지 최대 timeout초 대기하고 소요 시간을 기록합니다."""
+    started = time.perf_counter()
     try:
-        form = from_element.find_element(By.XPATH, "ancestor::form")
-        driver.execute_script("arguments[0].submit()", form)
-        return True
-    except Exception:
-        try:
-            from_element.send_keys(Keys.ENTER)
-            return True
-        except Exception as e:
-            log_error(f"폼 제출 실패: {e}")
-            return False
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    finally:
+        record_wait(name, time.perf_counter() - started)
+
+def wait_for_page_ready(driver, name="page_ready", timeout=None):
+    """document.readyState == 'complete' 대기 (시간 초과 시 False)"""
+    return admin_login.wait_for_page_ready(
+        driver, name, timeout if timeout is not None else get_timing('page_ready_wait', 10), wait=timed_wait
+    )
+
+def report_wait_stats():
+    """대기 구간별 횟수/평균/최대 소요 시간 기록"""
+    for name, durations in sorted(wait_durations.items()):
+        average = sum(durations) / len(durations)
+        log_debug(f"대기 통계 [{name}] {len(durations)}회, 평균 {average:.3f}초, 최대 {max(durations):.3f}초")
 
 # ✅ 실행 시작 로그
 def log_start():
@@ -214,6 +394,8 @@ def log_start():
     log_debug(f"실행 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     log_debug(f"로그 파일: {log_file}")
     log_debug(f"에러 로그 파일: {result_file}")
+    log_debug(f"처리 결과 파일: {result_stream_file}")
+    log_debug(f"빠른 로딩 프로필: {'사용' if config.get('fast_profile', {}).get('enabled', False) else '미사용'}")
     log_debug("=" * 60)
 
 # ✅ 파일명 특수문자 제거 함수
@@ -246,75 +428,25 @@ def clean_book_no(book_no):
     book_no = re.sub(r'\s+\d{2}:\d{2}:\d{2}$',  '', str(book_no))
     return book_no.strip()
 
-# ✅ 날짜 형식 변환 함수
-def format_date_to_yyyy_mm_dd(date_value):
-    """날짜를 YYYY-MM-DD 형식으로 변환합니다."""
-    if not date_value or pd.isna(date_value):
-        return ""
-    
-    try:
-        # pandas datetime 객체인 경우
-        if hasattr(date_value, 'strftime'):
-            return date_value.strftime('%Y-%m-%d')
-        
-        # 문자열인 경우
-        date_str = str(date_value)
-        
-        # 이미 YYYY-MM-DD 형식인 경우
-        if re.match(r'\d{4}-\d{2}-\d{2}$', date_str):
-            return date_str
-        
-        # 다른 형식의 날짜를 파싱하여 YYYY-MM-DD로 변환
-        try:
-            # 다양한 날짜 형식 시도
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y']:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-        except:
-            pass
-        
-        return date_str
-    except:
-        return str(date_value)
-
 # ✅ 3. [엑셀 파일 읽기]
 def read_cx_excel_data(excel_file_path, sheet_name, test_mode=None):
-    """cx_list.xlsx 파일에서 데이터를 읽어옵니다."""
+    """CX 리스트 파일(.xlsx/.xls/.csv)에서 필요한 컬럼만 청크 단위로 읽어 처리 데이터를 만듭니다."""
     try:
         print(f"3-0. 엑셀 파일 읽기: {excel_file_path}")
         
-        # 엑셀 파일 읽기
-        df = pd.read_excel(excel_file_path, sheet_name=sheet_name)
-        print(f"3-0-1. 엑셀 파일 읽기 완료: {len(df)}개 행")
-        print(f"3-0-2. 컬럼명: {list(df.columns)}")
-        
-        # 테스트 모드 적용
+        # 테스트 모드: 지정한 행 범위만 읽음 (엑셀 행 번호 기준, 1행은 헤더)
+        start_row, end_row = None, None
         if test_mode and test_mode.get('enabled', False):
-            start_row = test_mode.get('start_row', 2) - 2  # 2행을 0으로 하는 상대 인덱스
-            end_row = test_mode.get('end_row', len(df) + 1) - 1  # 2행 기준 상대 인덱스
-            df = df.iloc[start_row:end_row]
-            print(f"3-0-3. 테스트 모드 적용: {test_mode['start_row']}~{test_mode['end_row']}행 ({len(df)}개)")
+            start_row = test_mode.get('start_row', 2)
+            end_row = test_mode.get('end_row')
+            print(f"3-0-3. 테스트 모드 적용: {start_row}~{end_row or '끝'}행")
         
-        # 데이터 추출
+        # 데이터 추출 (읽기 전용 스트리밍, chunk_size행씩 컬럼 단위로 정리: 날짜 YYYY-MM-DD, 파일명 접두어 제거)
+        chunk_size = config['excel_settings'].get('chunk_size', DEFAULT_CHUNK_SIZE)
         excel_data = []
-        for index, row in df.iterrows():
-            order_number = str(row['주문번호']).strip() if pd.notna(row['주문번호']) else ""
-            
-            if order_number and order_number != 'nan':
-                excel_data.append({
-                    'no': row['NO'] if pd.notna(row['NO']) else "",
-                    'request_date': format_date_to_yyyy_mm_dd(row['요청날짜']),
-                    'manager': row['담당자'] if pd.notna(row['담당자']) else "",
-                    'order_number': order_number,
-                    'customer_name': row['고객명'] if pd.notna(row['고객명']) else "",
-                    'request_category': row['요청분류'] if pd.notna(row['요청분류']) else "",
-                    'request_reason': row['요청사유'] if pd.notna(row['요청사유']) else "",
-                    'request_content': row['요청사항'] if pd.notna(row['요청사항']) else ""
-                })
-                print(f"3-0-4. 데이터 {len(excel_data)}: 주문번호={order_number}, 담당자={row['담당자']}")
+        for records in iter_cx_records(excel_file_path, sheet_name, chunk_size, start_row, end_row):
+            excel_data.extend(records)
+            print(f"3-0-4. 데이터 {len(excel_data)}개 읽음")
         
         print(f"3-0-5. 최종 처리 데이터: {len(excel_data)}개")
         return excel_data
@@ -324,217 +456,944 @@ def read_cx_excel_data(excel_file_path, sheet_name, test_mode=None):
         log_error(f"엑셀 파일 읽기 실패: {e}")
         return []
 
+def group_cx_data_by_order(cx_data_list):
+    """같은 주문번호의 행을 묶습니다. 반환: [(주문번호, [(행 순번, cx_data), ...]), ...] (첫 등장 순서 유지)"""
+    groups = {}
+    for i, cx_data in enumerate(cx_data_list, 1):
+        groups.setdefault(cx_data['order_number'], []).append((i, cx_data))
+    
+    duplicated = sum(1 for rows in groups.values() if len(rows) > 1)
+    if duplicated:
+        print(f"3-0-6. 중복 주문번호 병합: {len(cx_data_list)}개 행 → 고유 주문 {len(groups)}건 (중복 주문 {duplicated}건)")
+    return list(groups.items())
+
 # ✅ 4. [주문번호로 검색]
+def build_orders_url(keyword="", per_page=20, start_date="", end_date="", search_type="orderNum", page=None):
+    """예약목록 검색 URL 생성 (모든 파라미터 포함)"""
+    page_query = f"&{get_batch_lookup_config().get('page_param', 'page')}={page}" if page else ""
+    return (
+        f"{config['urls']['base_url']}/orders?"
+        f"appointDayType=&"
+        f"exChannelId=&"
+        f"nationIdx=&"
+        f"addr1Idx=&"
+        f"gradeType=&"
+        f"perPage={per_page}&"
+        f"orderChannelIdx=&"
+        f"ratepalnSaleType=&"
+        f"saleType=&"
+        f"payStatus=&"
+        f"orderProductStatus=&"
+        f"orderRateplanType=&"
+        f"dateType=useDate&"
+        f"startDate={start_date}&"
+        f"endDate={end_date}&"
+        f"searchType={search_type}&"
+        f"keyword={keyword}"
+        f"{page_query}"
+    )
+
+ORDER_ROW_STATE_SCRIPT = """
+var orderNumber = arguments[0];
+if (document.querySelector("tr[data-order_num='" + orderNumber + "']") ||
+    document.querySelector("a.blue_link[href='/orders/" + orderNumber + "']")) {
+    return 'found';
+}
+if (document.readyState !== 'complete') {
+    return null;
+}
+return document.querySelector(arguments[1]) ? 'empty' : 'loaded';
+"""
+
+def wait_for_order_row(web_driver, order_number):
+    """검색 결과 상태 반환: found(행 존재) / empty(결과 없음 표시) / loaded(행 없음) / timeout"""
+    no_result_selector = get_extraction_config().get('no_result_selector', '.no_data')
+    try:
+        return timed_wait("search_result", web_driver,
+                          lambda d: d.execute_script(ORDER_ROW_STATE_SCRIPT, order_number, no_result_selector),
+                          get_timing('search_result_wait', 10))
+    except TimeoutException:
+        return "timeout"
+
 def search_order_by_number(order_number):
     """주문번호로 검색하여 검색결과 페이지로 이동합니다."""
     try:
         print(f"4-1. 주문번호 검색: {order_number}")
         
         # 검색 URL 생성 (모든 파라미터 포함)
-        search_url = (
-            f"{config['urls']['base_url']}/orders?"
-            f"appointDayType=&"
-            f"exChannelId=&"
-            f"nationIdx=&"
-            f"addr1Idx=&"
-            f"gradeType=&"
-            f"perPage=20&"
-            f"orderChannelIdx=&"
-            f"ratepalnSaleType=&"
-            f"saleType=&"
-            f"payStatus=&"
-            f"orderProductStatus=&"
-            f"orderRateplanType=&"
-            f"dateType=useDate&"
-            f"startDate=&"
-            f"endDate=&"
-            f"searchType=orderNum&"
-            f"keyword={order_number}"
-        )
+        search_url = build_orders_url(keyword=order_number)
         print(f"4-1-1. 검색 URL: {search_url}")
         
-        # 검색 페이지로 이동
-        driver.get(search_url)
-        time.sleep(get_timing('page_load_wait', 2))
+        # 검색 페이지로 이동 (페이지 로드 시간 기록)
+        web_driver = current_driver()
+        load_started = time.perf_counter()
+        web_driver.get(search_url)
+        record_wait("page_load", time.perf_counter() - load_started)
         print(f"4-1-2. 검색 페이지 이동 완료")
+        if "login" in web_driver.current_url.lower():
+            raise TransientSiteError("로그인 페이지로 이동됨 (세션 만료)", kind="login")
         
-        # 검색 결과 페이지 안정화 대기
-        time.sleep(2)
-        print(f"4-1-3. 검색 후 페이지 제목: {driver.title}")
+        # 검색 결과 행 또는 '결과 없음' 표시가 나타날 때까지 대기
+        result_state = wait_for_order_row(web_driver, order_number)
+        print(f"4-1-3. 검색 결과 상태: {result_state}")
+        if result_state == "timeout":
+            raise TransientSiteError("검색 결과 대기 시간 초과")
         
         return True
         
+    except TransientSiteError:
+        raise
     except Exception as e:
         print(f"4-1. 주문번호 검색 실패: {e}")
         log_error(f"주문번호 {order_number} 검색 실패: {e}")
-        return False
+        raise TransientSiteError(str(e))
 
 # ✅ 5. [HTML 요소에서 데이터 추출]
+# 행 탐색과 모든 필드 읽기를 브라우저 안에서 한 번에 수행 (WebDriver 왕복 1회)
+RESERVATION_ROW_SCRIPT = """
+var orderNumber = arguments[0];
+var row = document.querySelector("tr[data-order_num='" + orderNumber + "']");
+if (!row) {
+    var link = document.querySelector("a.blue_link[href='/orders/" + orderNumber + "']");
+    row = link ? link.closest('tr') : null;
+}
+if (!row) {
+    return null;
+}
+function text(el) {
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+}
+var title = row.querySelector('div.order_title');
+var divs = title ? title.querySelectorAll('div') : [];
+var cells = row.querySelectorAll('td');
+var guestDivs = cells.length > 13 ? cells[13].querySelectorAll('div') : [];
+var confirmInput = row.querySelector('form.send_confirm input.confirm_input');
+return {
+    checkin: row.getAttribute('data-checkin') || '',
+    checkout: row.getAttribute('data-checkout') || '',
+    hotel_text: text(divs[0]),
+    room_text: text(divs[1]),
+    product_text: text(divs[2]),
+    guest_name: text(guestDivs[0]),
+    guest_phone: text(guestDivs[1]),
+    room_count: cells.length > 8 ? text(cells[8].querySelector('div')) : '',
+    book_no: confirmInput ? (confirmInput.value || '') : ''
+};
+"""
+
+def build_reservation_data(raw):
+    """행에서 읽은 원본 값(raw)을 예약 정보 형식으로 정리합니다."""
+    checkin = raw.get('checkin') or ""
+    checkout = raw.get('checkout') or ""
+    hotel_text = (raw.get('hotel_text') or "").strip()
+    return {
+        'checkin': checkin,
+        'checkout': checkout,
+        'nights': calculate_nights(checkin, checkout) if checkin and checkout else "",
+        # 숙소명 (앞의 버튼 숫자 제거), 객실명 (● 제거), 상품명 (LMS확인 링크 제거)
+        'hotel_name': re.sub(r'^\d+\s*', '', hotel_text),
+        'room_name': (raw.get('room_text') or "").strip().replace('●', '').strip(),
+        'product_name': (raw.get('product_text') or "").strip().replace('LMS확인', '').strip(),
+        'guest_name': (raw.get('guest_name') or "").strip(),
+        'guest_phone': (raw.get('guest_phone') or "").strip(),
+        'room_count': (raw.get('room_count') or "").strip(),
+        'book_no': clean_book_no(raw.get('book_no') or "")
+    }
+
 def extract_reservation_data(order_number):
     """검색 결과 페이지에서 예약 정보를 추출합니다."""
     try:
         print(f"5-1. 예약 정보 추출: {order_number}")
         
-        # 주문번호가 포함된 행 찾기
-        order_row = None
-        try:
-            # data-order_num 속성으로 찾기
-            order_row = driver.find_element(By.CSS_SELECTOR, f"tr[data-order_num='{order_number}']")
-        except:
-            # 주문번호 링크로 찾기
-            try:
-                order_link = driver.find_element(By.CSS_SELECTOR, f"a.blue_link[href='/orders/{order_number}']")
-                order_row = order_link.find_element(By.XPATH, "./ancestor::tr")
-            except:
-                print(f"5-1-1. 주문번호 {order_number} 행을 찾을 수 없습니다.")
-                return None
-        
-        if not order_row:
-            print(f"5-1-2. 주문번호 {order_number} 데이터를 찾을 수 없습니다.")
+        raw = current_driver().execute_script(RESERVATION_ROW_SCRIPT, order_number)
+        if not raw:
+            print(f"5-1-1. 주문번호 {order_number} 행을 찾을 수 없습니다.")
             return None
         
-        # 데이터 추출
-        data = {}
+        # 필드 정리 (숙소/객실/상품명 정리, 박수 계산, Book NO 시간 제거)
+        data = build_reservation_data(raw)
         
-        # 체크인/체크아웃 날짜
-        try:
-            checkin = order_row.get_attribute('data-checkin')
-            checkout = order_row.get_attribute('data-checkout')
-            data['checkin'] = checkin if checkin else ""
-            data['checkout'] = checkout if checkout else ""
-            data['nights'] = calculate_nights(checkin, checkout) if checkin and checkout else ""
-        except Exception as e:
-            print(f"5-1-3. 체크인/체크아웃 추출 실패: {e}")
-            data['checkin'] = ""
-            data['checkout'] = ""
-            data['nights'] = ""
+        print(f"5-1-8. 추출 완료: {data}")
+        return data
         
-        # 숙소명, 객실명, 상품명
-        try:
-            order_title = order_row.find_element(By.CSS_SELECTOR, "div.order_title")
-            divs = order_title.find_elements(By.TAG_NAME, "div")
-            
-            if len(divs) >= 1:
-                # 숙소명 (버튼 제거 후 텍스트 추출)
-                hotel_text = divs[0].text.strip()
-                # 버튼 텍스트 제거 (숫자나 아이콘)
-                hotel_text = re.sub(r'^\d+\s*', '', hotel_text)  # 앞의 숫자 제거
-                data['hotel_name'] = hotel_text
-            else:
-                data['hotel_name'] = ""
-            
-            if len(divs) >= 2:
-                # 객실명 (● 제거)
-                room_text = divs[1].text.strip()
-                data['room_name'] = room_text.replace('●', '').strip()
-            else:
-                data['room_name'] = ""
-            
-            if len(divs) >= 3:
-                # 상품명 (LMS확인 링크 제거)
-                product_text = divs[2].text.strip()
-                data['product_name'] = product_text.replace('LMS확인', '').strip()
+    except Exception as e:
+        print(f"5-1. 데이터 추출 실패: {e}")
+        log_error(f"주문번호 {order_number} 데이터 추출 실패: {e}")
+        raise TransientSiteError(str(e))
+
+# ✅ 5-2. [HTTP 추출 엔진 (브라우저 렌더링 없이 검색 페이지 직접 파싱)]
+class _HtmlNode:
+    """검색 결과 행 파싱용 최소 DOM 노드"""
+    BLOCK_TAGS = {'div', 'p', 'br', 'li', 'tr', 'td', 'th', 'table', 'form'}
+
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+
+    def has_class(self, class_name):
+        return class_name in (self.attrs.get('class') or '').split()
+
+    def iter(self, tag):
+        """하위 요소를 문서 순서대로 순회 (Selenium find_elements와 동일한 순서)"""
+        for child in self.children:
+            if isinstance(child, _HtmlNode):
+                if child.tag == tag:
+                    yield child
+                yield from child.iter(tag)
+
+    def find(self, tag, class_name=None):
+        for node in self.iter(tag):
+            if class_name is None or node.has_class(class_name):
+                return node
+        return None
+
+    def text(self):
+        parts = []
+        for child in self.children:
+            if isinstance(child, _HtmlNode):
+                child_text = child.text()
+                parts.append(f" {child_text} " if child.tag in self.BLOCK_TAGS else child_text)
             else:
-                data['product_name'] = ""
-                
-        except Exception as e:
-            print(f"5-1-4. 숙소/객실/상품명 추출 실패: {e}")
-            data['hotel_name'] = ""
-            data['room_name'] = ""
-            data['product_name'] = ""
+                parts.append(child)
+        return re.sub(r'\s+', ' ', ''.join(parts)).strip()
+
+class OrderRowParser(HTMLParser):
+    """검색 결과 HTML에서 tr[data-order_num] 행만 트리로 수집"""
+    VOID_TAGS = {'input', 'br', 'img', 'hr', 'meta', 'link', 'col', 'source', 'wbr'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = {}
+        self._stack = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: (v if v is not None else '') for k, v in attrs}
+        if not self._stack:
+            if tag == 'tr' and 'data-order_num' in attrs:
+                node = _HtmlNode(tag, attrs)
+                self.rows.setdefault(attrs['data-order_num'].strip(), node)
+                self._stack = [node]
+            return
+        # 닫는 태그 없이 다음 행/셀이 시작되는 경우 처리 (중첩 테이블 제외)
+        if tag in ('tr', 'td', 'th') and not any(n.tag == 'table' for n in self._stack):
+            closing = ('tr',) if tag == 'tr' else ('td', 'th')
+            for idx in range(len(self._stack) - 1, -1, -1):
+                if self._stack[idx].tag in closing:
+                    del self._stack[idx:]
+                    break
+            if not self._stack:
+                self.handle_starttag(tag, list(attrs.items()))
+                return
+        node = _HtmlNode(tag, attrs)
+        self._stack[-1].children.append(node)
+        if tag not in self.VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        if self._stack:
+            self._stack[-1].children.append(_HtmlNode(tag, {k: (v if v is not None else '') for k, v in attrs}))
+
+    def handle_endtag(self, tag):
+        for idx in range(len(self._stack) - 1, -1, -1):
+            if self._stack[idx].tag == tag:
+                del self._stack[idx:]
+                return
+
+    def handle_data(self, data):
+        if self._stack:
+            self._stack[-1].children.append(data)
+
+def parse_order_rows(html):
+    """검색 결과 HTML → {주문번호: 행 노드}"""
+    parser = OrderRowParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+def extract_row_raw_data(order_row):
+    """행 노드에서 extract_reservation_data와 동일한 위치의 원본 값을 읽습니다."""
+    raw = {
+        'checkin': order_row.attrs.get('data-checkin', ''),
+        'checkout': order_row.attrs.get('data-checkout', '')
+    }
+
+    order_title = order_row.find('div', 'order_title')
+    divs = list(order_title.iter('div')) if order_title else []
+    raw['hotel_text'] = divs[0].text() if len(divs) >= 1 else ""
+    raw['room_text'] = divs[1].text() if len(divs) >= 2 else ""
+    raw['product_text'] = divs[2].text() if len(divs) >= 3 else ""
+
+    cells = list(order_row.iter('td'))
+    guest_divs = list(cells[13].iter('div')) if len(cells) > 13 else []
+    raw['guest_name'] = guest_divs[0].text() if len(guest_divs) >= 1 else ""
+    raw['guest_phone'] = guest_divs[1].text() if len(guest_divs) >= 2 else ""
+
+    room_count_div = cells[8].find('div') if len(cells) > 8 else None
+    raw['room_count'] = room_count_div.text() if room_count_div else ""
+
+    confirm_form = order_row.find('form', 'send_confirm')
+    confirm_input = confirm_form.find('input', 'confirm_input') if confirm_form else None
+    raw['book_no'] = confirm_input.attrs.get('value', '') if confirm_input else ""
+    return raw
+
+def get_extraction_config():
+    return config.get('extraction', {})
+
+def is_http_extraction_enabled():
+    return str(get_extraction_config().get('mode', 'browser')).lower() == 'http'
+
+def init_http_session(web_driver):
+    """Selenium 로그인 쿠키를 keep-alive 연결 풀 기반 HTTP 세션으로 옮깁니다."""
+    global http_session
+    session = requests.Session()
+    pool_size = max(4, get_worker_count())
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    try:
+        user_agent = web_driver.execute_script("return navigator.userAgent")
+    except Exception:
+        user_agent = None
+    session.headers.update({
+        'User-Agent': user_agent or 'Mozilla/5.0',
+        'Accept-Language': 'ko-KR,ko'
+    })
+    copy_cookies_to_session(session, web_driver.get_cookies())
+    http_session = session
+    print(f"HTTP 추출 세션 준비 완료 (연결 풀 {pool_size})")
+    return session
+
+def copy_cookies_to_session(session, cookies):
+    for cookie in cookies:
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+def is_login_page(response):
+    """세션 만료로 로그인 페이지가 반환되었는지 확인"""
+    return "login" in response.url.lower() or 'name="userPasswd"' in response.text
+
+def fetch_reservation_data_http(order_number):
+    """HTTP 세션으로 검색 페이지를 받아 예약 정보를 추출합니다. (실패 시 None → Chrome 대체)"""
+    if http_session is None:
+        return None
+    try:
+        print(f"4-2. HTTP 주문번호 조회: {order_number}")
+        timeout = float(get_extraction_config().get('http_timeout', 10))
+        response = http_session.get(build_orders_url(keyword=order_number), timeout=timeout)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TransientSiteError(f"HTTP {response.status_code}")
+        response.raise_for_status()
         
-        # 투숙자명, 연락처
-        try:
-            guest_cell = order_row.find_elements(By.TAG_NAME, "td")[13]  # 투숙자명 컬럼
-            guest_divs = guest_cell.find_elements(By.TAG_NAME, "div")
-            
-            if len(guest_divs) >= 1:
-                data['guest_name'] = guest_divs[0].text.strip()
-            else:
-                data['guest_name'] = ""
-            
-            if len(guest_divs) >= 2:
-                data['guest_phone'] = guest_divs[1].text.strip()
-            else:
-                data['guest_phone'] = ""
-                
-        except Exception as e:
-            print(f"5-1-5. 투숙자 정보 추출 실패: {e}")
-            data['guest_name'] = ""
-            data['guest_phone'] = ""
+        if is_login_page(response):
+            # 브라우저 세션의 최신 쿠키로 갱신 후 재시도
+            log_error(f"주문번호 {order_number} HTTP 조회 중 세션 만료 감지 - 쿠키 갱신")
+            copy_cookies_to_session(http_session, current_driver().get_cookies())
+            raise TransientSiteError("로그인 페이지 반환 (세션 만료)", kind="login")
         
-        # 객실수
-        try:
-            room_count_cell = order_row.find_elements(By.TAG_NAME, "td")[8]  # 객실수 컬럼
-            room_count_div = room_count_cell.find_element(By.TAG_NAME, "div")
-            data['room_count'] = room_count_div.text.strip()
-        except Exception as e:
-            print(f"5-1-6. 객실수 추출 실패: {e}")
-            data['room_count'] = ""
+        order_row = parse_order_rows(response.text).get(order_number)
+        if order_row is None:
+            print(f"4-2-1. HTTP 응답에서 주문번호 {order_number} 행을 찾을 수 없습니다.")
+            return None
         
-        # Book NO (컨펌번호)
+        data = build_reservation_data(extract_row_raw_data(order_row))
+        print(f"4-2-2. HTTP 추출 완료: {data}")
+        return data
+        
+    except TransientSiteError:
+        raise
+    except (requests.ConnectionError, requests.Timeout) as e:
+        print(f"4-2. HTTP 조회 실패: {e}")
+        raise TransientSiteError(str(e))
+    except Exception as e:
+        print(f"4-2. HTTP 조회 실패: {e}")
+        log_error(f"주문번호 {order_number} HTTP 조회 실패: {e}")
+        return None
+
+# ✅ 5-3. [일괄 조회 (기간 검색 스윕 → 주문번호 인덱스)]
+def get_batch_lookup_config():
+    return config.get('batch_lookup', {})
+
+def is_batch_lookup_enabled():
+    return bool(get_batch_lookup_config().get('enabled', False))
+
+def derive_sweep_window(cx_data_list):
+    """CX 시트의 요청날짜 범위에 여유 기간을 더해 검색 기간(startDate, endDate)을 산출합니다."""
+    dates = []
+    for cx_data in cx_data_list:
+        try:
+            dates.append(datetime.strptime(str(cx_data.get('request_date', '')), '%Y-%m-%d'))
+        except ValueError:
+            continue
+    if not dates:
+        return None
+    
+    batch_config = get_batch_lookup_config()
+    start_date = min(dates) - timedelta(days=int(batch_config.get('days_before', 30)))
+    end_date = max(dates) + timedelta(days=int(batch_config.get('days_after', 90)))
+    return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+
+def fetch_orders_page_html(url):
+    """검색 페이지 HTML 반환 (HTTP 세션 우선, 없으면 현재 브라우저)"""
+    if http_session is not None:
+        timeout = float(get_extraction_config().get('http_timeout', 10))
+        try:
+            response = http_session.get(url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise TransientSiteError(str(e))
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TransientSiteError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+        if is_login_page(response):
+            raise TransientSiteError("세션 만료 (로그인 페이지 반환)", kind="login")
+        return response.text
+    
+    web_driver = current_driver()
+    web_driver.get(url)
+    wait_for_page_ready(web_driver, "batch_page")
+    return web_driver.page_source
+
+def build_reservation_index(cx_data_list):
+    """기간 검색 결과를 큰 perPage로 넘기며 주문번호 → 예약 정보 인덱스를 만듭니다."""
+    wanted = {cx_data['order_number'] for cx_data in cx_data_list}
+    window = derive_sweep_window(cx_data_list)
+    if not window:
+        print("5-3. 요청날짜를 해석할 수 없어 일괄 조회를 건너뜁니다.")
+        return
+    
+    batch_config = get_batch_lookup_config()
+    per_page = int(batch_config.get('per_page', 500))
+    max_pages = int(batch_config.get('max_pages', 20))
+    start_date, end_date = window
+    seen = set()
+    print(f"5-3. 일괄 조회 시작: {start_date} ~ {end_date} (perPage={per_page}, 대상 {len(wanted)}건)")
+    
+    for page in range(1, max_pages + 1):
         try:
-            confirm_form = order_row.find_element(By.CSS_SELECTOR, "form.send_confirm")
-            confirm_input = confirm_form.find_element(By.CSS_SELECTOR, "input.confirm_input")
-            raw_book_no = confirm_input.get_attribute('value')
-            data['book_no'] = clean_book_no(raw_book_no)
+            url = build_orders_url(per_page=per_page, start_date=start_date, end_date=end_date, page=page)
+            rows = parse_order_rows(governed_call("일괄 조회", fetch_orders_page_html, url))
         except Exception as e:
-            print(f"5-1-7. Book NO 추출 실패: {e}")
-            data['book_no'] = ""
+            log_error(f"일괄 조회 {page}페이지 실패 (남은 주문은 개별 검색): {e}")
+            break
         
-        print(f"5-1-8. 추출 완료: {data}")
-        return data
+        new_rows = 0
+        for order_num, order_row in rows.items():
+            if order_num in seen:
+                continue
+            seen.add(order_num)
+            new_rows += 1
+            if order_num in wanted:
+                reservation_index[order_num] = build_reservation_data(extract_row_raw_data(order_row))
         
-    except Exception as e:
-        print(f"5-1. 데이터 추출 실패: {e}")
-        log_error(f"주문번호 {order_number} 데이터 추출 실패: {e}")
+        print(f"5-3-1. {page}페이지: {len(rows)}행, 누적 적중 {len(reservation_index)}/{len(wanted)}건")
+        
+        # 전부 찾았거나 마지막 페이지면 종료
+        if wanted.issubset(reservation_index.keys()) or len(rows) < per_page or new_rows == 0:
+            break
+    
+    missing = len(wanted) - len(reservation_index)
+    log_debug(f"일괄 조회 완료: 적중 {len(reservation_index)}건, 개별 검색 대체 {missing}건")
+
+def lookup_reservation_index(order_number):
+    """일괄 조회 인덱스에서 예약 정보 반환 (없으면 None)"""
+    data = reservation_index.get(order_number)
+    if data is None:
+        return None
+    print(f"5-3-2. 일괄 조회 인덱스 사용: {order_number}")
+    return dict(data)
+
+# ✅ 5-4. [예약 정보 캐시 (SQLite, 주문번호 기준)]
+class ReservationCache:
+    """extract_reservation_data 결과를 주문번호별로 디스크에 보관 (TTL 적용)"""
+
+    def __init__(self, db_path, ttl_hours=24, force_refresh=False):
+        self.ttl_seconds = float(ttl_hours) * 3600
+        self.force_refresh = force_refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reservations ("
+            "order_number TEXT PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _load(self, order_number):
+        if self.force_refresh:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, fetched_at FROM reservations WHERE order_number = ?", (order_number,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def contains(self, order_number):
+        """적중/미적중 집계 없이 유효한 캐시 존재 여부만 확인"""
+        return self._load(order_number) is not None
+
+    def get(self, order_number):
+        data = self._load(order_number)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def put(self, order_number, data):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reservations (order_number, data, fetched_at) VALUES (?, ?, ?)",
+                (order_number, json.dumps(data, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def init_reservation_cache():
+    """설정에 따라 예약 정보 캐시를 엽니다. (비활성화 시 None)
+    실행기(UI)가 FORCE_REFRESH=1을 넘기면 설정과 관계없이 이번 실행만 캐시를 무시하고 새로 조회합니다."""
+    global reservation_cache
+    cache_config = config.get('reservation_cache', {})
+    if not cache_config.get('enabled', False):
         return None
+    db_path = cache_config.get('path', 'cache/reservation_cache.db')
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(script_dir, db_path)
+    force_refresh = os.environ.get('FORCE_REFRESH') == '1' or bool(cache_config.get('force_refresh', False))
+    try:
+        reservation_cache = ReservationCache(
+            db_path,
+            ttl_hours=cache_config.get('ttl_hours', 24),
+            force_refresh=force_refresh
+        )
+        print(f"예약 정보 캐시 사용: {db_path} (TTL {cache_config.get('ttl_hours', 24)}시간)" + (" - 이번 실행은 새로 조회" if force_refresh else ""))
+    except Exception as e:
+        log_error(f"예약 정보 캐시 열기 실패 (캐시 없이 진행): {e}")
+        reservation_cache = None
+    return reservation_cache
+
+# ✅ 5-5. [체크포인트 저널 (실행 재개용)]
+class CheckpointJournal:
+    """주문별 진행 단계를 append-only JSONL로 기록 (fsync는 묶어서 수행)"""
+    STAGES = ('searched', 'extracted', 'excel_written', 'email_written')
+
+    def __init__(self, path, resume=False, fsync_every=20, fsync_interval=2.0):
+        self.path = path
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_interval = float(fsync_interval)
+        self.completed = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_fsync = time.monotonic()
+        if resume:
+            self._load()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        if resume and self._ends_with_partial_line():
+            self._file.write('\n')
+
+    def _ends_with_partial_line(self):
+        """크래시로 마지막 줄이 잘렸는지 확인 (이어 쓰기 전에 줄바꿈 보정)"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def _load(self):
+        """이전 실행 기록 로드 (마지막 줄이 잘린 경우 무시)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                key = (entry.get('row'), entry.get('order_number'))
+                self.completed.setdefault(key, {})[entry.get('stage')] = entry
+
+    def progress(self, row, order_number):
+        """해당 행이 도달한 단계별 기록 반환 {단계: 기록}"""
+        return self.completed.get((row, order_number), {})
+
+    def record(self, row, order_number, stage, **details):
+        entry = {'row': row, 'order_number': order_number, 'stage': stage,
+                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        entry.update(details)
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            # 프로세스 크래시 대비 매번 flush, 디스크 동기화(fsync)는 건수/시간 단위로 묶음 처리
+            self._file.flush()
+            self._pending += 1
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self._fsync()
+
+    def _fsync(self):
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_fsync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._fsync()
+                self._file.close()
+
+def init_checkpoint_journal():
+    """실행기(UI)가 지정한 저널 파일 또는 설정에 따라 체크포인트 저널을 엽니다."""
+    global checkpoint_journal
+    journal_config = config.get('journal', {})
+    journal_path = os.environ.get('JOURNAL_FILE_PATH')
+    if not journal_path:
+        if not journal_config.get('enabled', False):
+            return None
+        journal_path = os.path.join(script_dir, 'journals', f"cx_claim_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+    resume = os.environ.get('RESUME_JOURNAL') == '1'
+    try:
+        checkpoint_journal = CheckpointJournal(
+            journal_path,
+            resume=resume,
+            fsync_every=journal_config.get('fsync_every', 20),
+            fsync_interval=journal_config.get('fsync_interval', 2.0)
+        )
+        print(f"체크포인트 저널: {journal_path}" + (f" (재개: 기록 {len(checkpoint_journal.completed)}건)" if resume else ""))
+    except Exception as e:
+        log_error(f"체크포인트 저널 열기 실패 (저널 없이 진행): {e}")
+        checkpoint_journal = None
+    return checkpoint_journal
+
+def journal_record(row, order_number, stage, **details):
+    if checkpoint_journal:
+        checkpoint_journal.record(row, order_number, stage, **details)
+
+# ✅ 5-6. [요청 제어 (속도 제한 / 재시도 / 서킷 브레이커)]
+# 재시도 대기열로 보내 실행 끝에 다시 처리할 실패 상태
+RETRYABLE_STATUSES = {"검색실패", "데이터추출실패", "처리오류"}
+
+class TransientSiteError(Exception):
+    """재시도하면 회복될 수 있는 사이트 오류 (kind: error=응답/타임아웃 오류, login=로그인 페이지로 이동)"""
+
+    def __init__(self, message, kind="error"):
+        super().__init__(message)
+        self.kind = kind
+
+class TokenBucket:
+    """초당 rate개씩 토큰을 채우는 버킷 (모든 워커 공유, 토큰이 없으면 대기)"""
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 가져옵니다. 반환: 대기한 시간 (초)"""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class CircuitBreaker:
+    """짧은 시간 안에 사이트 오류/로그인 이동이 몰리면 모든 워커를 일정 시간 멈춤"""
+
+    def __init__(self, threshold, window_seconds, cooldown_seconds):
+        self.threshold = int(threshold)
+        self.window = float(window_seconds)
+        self.cooldown = float(cooldown_seconds)
+        self.trips = 0
+        self._failures = []
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait_if_open(self):
+        """차단 중이면 해제될 때까지 대기"""
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 1.0))
+
+    def record_failure(self, kind):
+        if self.threshold <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now < self._open_until:
+                return
+            self._failures = [t for t in self._failures if now - t <= self.window] + [now]
+            if len(self._failures) < self.threshold:
+                return
+            self._failures = []
+            self._open_until = now + self.cooldown
+            self.trips += 1
+        reason = "로그인 페이지 이동" if kind == "login" else "사이트 오류"
+        log_error(f"서킷 브레이커 작동: {self.window:.0f}초 내 {reason} {self.threshold}회 - 모든 워커 {self.cooldown:.0f}초 대기")
+
+def get_governance_config():
+    return config.get('request_governance', {})
+
+def init_request_governance():
+    """설정에 따라 속도 제한기와 서킷 브레이커를 준비합니다."""
+    global rate_limiter, circuit_breaker
+    governance = get_governance_config()
+    rate_limiter = TokenBucket(governance.get('rate_per_second', 5), governance.get('burst', 5))
+    circuit_breaker = CircuitBreaker(
+        governance.get('circuit_failure_threshold', 5),
+        governance.get('circuit_window', 30),
+        governance.get('circuit_cooldown', 60)
+    )
+    governance_stats['retries'] = 0
+
+def recover_login_session():
+    """로그인 페이지로 이동된 경우 현재 브라우저 재로그인 후 HTTP 세션 쿠키 갱신"""
+    web_driver = current_driver()
+    if web_driver is None:
+        return
+    if not is_logged_in(web_driver):
+        login_to_admin(web_driver)
+    if http_session is not None:
+        copy_cookies_to_session(http_session, web_driver.get_cookies())
+
+def governed_call(name, func, *args, rate_limited=True):
+    """서킷 브레이커 확인 → 속도 제한 → 실행. 일시적 오류는 지수 백오프로 재시도하고 모두 실패하면 예외를 그대로 올립니다."""
+    governance = get_governance_config()
+    max_retries = int(governance.get('max_retries', 3))
+    backoff_base = float(governance.get('backoff_base', 1.0))
+    backoff_max = float(governance.get('backoff_max', 30))
+    
+    for attempt in range(max_retries + 1):
+        if circuit_breaker:
+            circuit_breaker.wait_if_open()
+        if rate_limited and rate_limiter:
+            waited = rate_limiter.acquire()
+            if waited:
+                record_wait("rate_limit", waited)
+        try:
+            return func(*args)
+        except TransientSiteError as e:
+            if circuit_breaker:
+                circuit_breaker.record_failure(e.kind)
+            if attempt >= max_retries:
+                raise
+            # 지수 백오프 + 지터 (워커들이 동시에 재시도하지 않도록)
+            delay = min(backoff_max, backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+            log_error(f"{name} 일시적 오류 ({e}) - {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            with _log_lock:
+                governance_stats['retries'] += 1
+            _worker_context.retries = getattr(_worker_context, 'retries', 0) + 1
+            time.sleep(delay)
+            if e.kind == "login":
+                recover_login_session()
+
+def log_order_failure(order_number, status, timestamp):
+    """실패 결과 기록 (재시도 대기열로 넘어가는 실패는 최종 시도에서만 기록)"""
+    if getattr(_worker_context, 'defer_retryable', False) and status in RETRYABLE_STATUSES:
+        print(f"주문번호 {order_number} {status} - 재시도 대기열로 이동")
+        return
+    log_result(order_number, status, status, timestamp)
+
+# ✅ 5-7. [주문별 단계 소요 시간 지표 (JSONL)]
+METRIC_STAGES = ('cache_lookup', 'http_lookup', 'search', 'extract', 'output_queue', 'excel', 'excel_write', 'email_render', 'file_save', 'result_log')
+
+class OrderMetrics:
+    """주문(행)별 단계 소요 시간/결과/재시도 횟수/워커 ID를 실행별 JSONL 파일에 1줄씩 기록 (비동기 로그 기록기 사용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = []
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        with self._lock:
+            self.records.append(record)
+        log_writer.write(self.path, json.dumps(record, ensure_ascii=False))
+
+def init_order_metrics():
+    """실행별 지표 파일 열기 (logs/cx_claim_metrics_<실행ID>.jsonl)"""
+    global order_metrics
+    run_id = os.environ.get('EXECUTION_ID') or datetime.now().strftime('%Y%m%d_%H%M%S')
+    order_metrics = OrderMetrics(os.path.join(log_dir, f"cx_claim_metrics_{run_id}.jsonl"))
+    log_debug(f"단계별 지표 파일: {order_metrics.path}")
+
+@contextmanager
+def stage_timer(name):
+    """현재 워커가 처리 중인 주문의 단계 소요 시간을 누적 (처리 중인 주문이 없으면 측정만 생략)"""
+    current = getattr(_worker_context, 'order_metrics', None)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if current is not None:
+            current['stages'][name] = current['stages'].get(name, 0.0) + time.perf_counter() - started
+
+def set_order_source(source):
+    """예약 정보를 가져온 경로 기록 (cache, batch_index, http, browser, shared, journal)"""
+    current = getattr(_worker_context, 'order_metrics', None)
+    if current is not None:
+        current['source'] = source
+
+def begin_order_metrics(row, order_number):
+    _worker_context.retries = 0
+    _worker_context.order_metrics = {
+        'row': row,
+        'order_number': order_number,
+        'source': None,
+        'stages': {},
+        'started': time.perf_counter(),
+        'started_at': datetime.now().isoformat(timespec='milliseconds')
+    }
+
+def record_stage_time(name, seconds):
+    """다른 스레드에서 측정한 단계 소요 시간을 현재 주문 지표에 추가"""
+    current = getattr(_worker_context, 'order_metrics', None)
+    if current is not None:
+        current['stages'][name] = current['stages'].get(name, 0.0) + seconds
+
+def finish_order_metrics(status):
+    current = getattr(_worker_context, 'order_metrics', None)
+    _worker_context.order_metrics = None
+    if current is None or order_metrics is None:
+        return
+    order_metrics.write({
+        'row': current['row'],
+        'order_number': current['order_number'],
+        'worker_id': current_worker_id(),
+        'outcome': status,
+        'deferred_to_retry': getattr(_worker_context, 'defer_retryable', False) and status in RETRYABLE_STATUSES,
+        'retries': getattr(_worker_context, 'retries', 0),
+        'source': current['source'],
+        'started_at': current['started_at'],
+        'total_ms': round((time.perf_counter() - current['started']) * 1000, 1),
+        'stages_ms': {name: round(seconds * 1000, 1) for name, seconds in current['stages'].items()}
+    })
+
+def metric_percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(ratio * (len(ordered) - 1)))))]
+
+def report_stage_metrics():
+    """단계별 p50/p95/최대 소요 시간 요약 기록"""
+    if not order_metrics or not order_metrics.records:
+        return
+    records = order_metrics.records
+    for name in METRIC_STAGES + ('total',):
+        values = [r['total_ms'] if name == 'total' else r['stages_ms'][name]
+                  for r in records if name == 'total' or name in r['stages_ms']]
+        if values:
+            log_debug(f"단계 지표 [{name}] {len(values)}건, p50 {metric_percentile(values, 0.5):.1f}ms, "
+                      f"p95 {metric_percentile(values, 0.95):.1f}ms, 최대 {max(values):.1f}ms")
 
 # ✅ 6. [엑셀 파일 생성]
+# 클레임 엑셀 컬럼 (헤더 순서) → 예약 정보 키
+CLAIM_COLUMNS = [
+    ('숙소명', 'hotel_name'),
+    ('주문번호', 'order_number'),
+    ('투숙자명', 'guest_name'),
+    ('투숙자 연락처', 'guest_phone'),
+    ('체크인', 'checkin'),
+    ('체크아웃', 'checkout'),
+    ('박수', 'nights'),
+    ('객실수', 'room_count'),
+    ('객실명', 'room_name'),
+    ('상품명', 'product_name'),
+    ('Book NO', 'book_no')
+]
+
+def write_claim_workbook(excel_path, order_number, data):
+    """DataFrame 없이 openpyxl 쓰기 전용 모드로 헤더 1행 + 데이터 1행을 저장합니다."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    header_font = Font(bold=True)
+    header = []
+    for title, _ in CLAIM_COLUMNS:
+        cell = WriteOnlyCell(sheet, value=title)
+        cell.font = header_font
+        header.append(cell)
+    sheet.append(header)
+    sheet.append([order_number if key == 'order_number' else data.get(key, '') for _, key in CLAIM_COLUMNS])
+    write_claimed_file(excel_path, workbook.save)
+
+class ClaimWorkbookWriter:
+    """클레임 엑셀 저장을 작성 스레드 풀(내부 작업 큐)에서 처리하고 대기/저장 시간을 집계"""
+
+    def __init__(self, threads=1):
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(threads)), thread_name_prefix="claim-writer")
+        self.queue_waits = []
+        self.write_times = []
+        self._lock = threading.Lock()
+
+    def submit(self, excel_path, order_number, data):
+        """저장 작업을 넣고 Future 반환 (결과: 저장 소요 시간 초)"""
+        return self._executor.submit(self._write, excel_path, order_number, dict(data), time.perf_counter())
+
+    def _write(self, excel_path, order_number, data, submitted):
+        started = time.perf_counter()
+        write_claim_workbook(excel_path, order_number, data)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.queue_waits.append(started - submitted)
+            self.write_times.append(elapsed)
+        print(f"6-1-1. 엑셀 파일 저장 완료: {excel_path} ({elapsed * 1000:.1f}ms)")
+        return elapsed
+
+    def shutdown(self):
+        """남은 저장 작업(및 완료 콜백)이 모두 끝날 때까지 대기"""
+        self._executor.shutdown(wait=True)
+
+    def report(self):
+        if not self.write_times:
+            return
+        log_debug(f"엑셀 작성 [저장] {len(self.write_times)}건, p50 {metric_percentile(self.write_times, 0.5) * 1000:.1f}ms, "
+                  f"p95 {metric_percentile(self.write_times, 0.95) * 1000:.1f}ms, 최대 {max(self.write_times) * 1000:.1f}ms")
+        log_debug(f"엑셀 작성 [대기열] p50 {metric_percentile(self.queue_waits, 0.5) * 1000:.1f}ms, "
+                  f"p95 {metric_percentile(self.queue_waits, 0.95) * 1000:.1f}ms, 최대 {max(self.queue_waits) * 1000:.1f}ms")
+
+def init_claim_writer():
+    global claim_writer
+    claim_writer = ClaimWorkbookWriter(config.get('claim_writer', {}).get('threads', 1))
+
 def create_claim_excel(order_number, hotel_name, data):
-    """클레임 엑셀 파일을 생성합니다."""
+    """클레임 엑셀 파일명을 선점하고 저장을 작성 스레드에 넘깁니다. 반환: (엑셀 경로, Future) / 실패 시 (None, None)"""
+    excel_path = None
     try:
         print(f"6-1. 클레임 엑셀 파일 생성: {order_number}")
         
-        # 파일명 생성 (주문번호_숙소명_날짜 형식)
+        # 파일명 생성 (주문번호_숙소명_날짜_번호 형식, 워커 간 충돌 없이 .part 파일로 선점)
         clean_hotel_name = clean_filename(hotel_name)
-        excel_filename = f"{order_number}_{clean_hotel_name}_{today}_001.xlsx"
-        excel_path = os.path.join(claim_dir, excel_filename)
-        
-        # 중복 파일명 처리
-        index = 1
-        while os.path.exists(excel_path):
-            excel_filename = f"{order_number}_{clean_hotel_name}_{today}_{index:03}.xlsx"
-            excel_path = os.path.join(claim_dir, excel_filename)
-            index += 1
-        
-        # 데이터프레임 생성
-        df_data = {
-            '숙소명': [data.get('hotel_name', '')],
-            '주문번호': [order_number],
-            '투숙자명': [data.get('guest_name', '')],
-            '투숙자 연락처': [data.get('guest_phone', '')],
-            '체크인': [data.get('checkin', '')],
-            '체크아웃': [data.get('checkout', '')],
-            '박수': [data.get('nights', '')],
-            '객실수': [data.get('room_count', '')],
-            '객실명': [data.get('room_name', '')],
-            '상품명': [data.get('product_name', '')],
-            'Book NO': [data.get('book_no', '')]
-        }
-        
-        df = pd.DataFrame(df_data)
+        excel_path = filename_allocator.allocate(claim_dir, f"{order_number}_{clean_hotel_name}_{today}", ".xlsx", partial=True)
         
-        # 엑셀 파일 저장
-        df.to_excel(excel_path, index=False, engine='openpyxl')
-        print(f"6-1-1. 엑셀 파일 저장 완료: {excel_path}")
-        
-        return excel_path
+        # 작성 스레드가 없으면(단독 호출) 바로 저장
+        if claim_writer is None:
+            write_claim_workbook(excel_path, order_number, data)
+            print(f"6-1-1. 엑셀 파일 저장 완료: {excel_path}")
+            return excel_path, None
+        return excel_path, claim_writer.submit(excel_path, order_number, data)
         
     except Exception as e:
         print(f"6-1. 엑셀 파일 생성 실패: {e}")
         log_error(f"주문번호 {order_number} 엑셀 파일 생성 실패: {e}")
-        return None
+        if excel_path:
+            discard_claimed_file(excel_path)
+        return None, None
 
 # ✅ 7. [메일 텍스트 생성]
 def create_email_content(cx_data, web_data):
@@ -542,9 +1401,9 @@ def create_email_content(cx_data, web_data):
     try:
         print(f"7-1. 메일 내용 생성")
         
-        # 템플릿 가져오기
-        subject_template = config['email_template']['subject_template']
-        body_template = config['email_template']['body_template']
+        # 템플릿 가져오기 (실행 시작 시 컴파일된 결과 재사용)
+        subject_template = compile_template(config['email_template']['subject_template'])
+        body_template = compile_template(config['email_template']['body_template'])
         
         # 데이터 매핑
         template_data = {
@@ -562,19 +1421,13 @@ def create_email_content(cx_data, web_data):
             '객실수': web_data.get('room_count', ''),
             '객실명': web_data.get('room_name', ''),
             '상품명': web_data.get('product_name', ''),
-            '요청사유': cx_data.get('request_reason', '').replace('cx_list.xlsx_', ''),
-            '요청사항': cx_data.get('request_content', '').replace('cx_list.xlsx_', '')
+            '요청사유': cx_data.get('request_reason', ''),
+            '요청사항': cx_data.get('request_content', '')
         }
         
-        # 제목 생성
-        email_subject = subject_template
-        for key, value in template_data.items():
-            email_subject = email_subject.replace(f'{{{key}}}', str(value))
-        
-        # 본문 생성
-        email_body = body_template
-        for key, value in template_data.items():
-            email_body = email_body.replace(f'{{{key}}}', str(value))
+        # 제목/본문 생성
+        email_subject = subject_template.render(template_data)
+        email_body = body_template.render(template_data)
         
         print(f"7-1-1. 메일 제목: {email_subject}")
         print(f"7-1-2. 메일 본문 길이: {len(email_body)}자")
@@ -589,27 +1442,22 @@ def create_email_content(cx_data, web_data):
 # ✅ 8. [메일 텍스트 파일 저장]
 def save_email_file(email_subject, email_body, order_number, hotel_name):
     """메일 내용을 텍스트 파일로 저장합니다."""
+    txt_path = None
     try:
         print(f"8-1. 메일 텍스트 파일 저장")
         
-        # 파일명 생성
+        # 파일명 생성 (제목_번호 형식, 워커 간 충돌 없이 .part 파일로 선점)
         clean_subject = clean_filename(email_subject)
-        txt_filename = f"{clean_subject}_001.txt"
-        txt_path = os.path.join(result_dir, txt_filename)
-        
-        # 중복 파일명 처리
-        index = 1
-        while os.path.exists(txt_path):
-            txt_filename = f"{clean_subject}_{index:03}.txt"
-            txt_path = os.path.join(result_dir, txt_filename)
-            index += 1
+        txt_path = filename_allocator.allocate(result_dir, clean_subject, ".txt", partial=True)
         
         # 파일 내용 작성
         file_content = f"제목: {email_subject}\n\n{email_body}"
         
-        # 파일 저장
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(file_content)
+        # 파일 저장 (.part에 쓴 뒤 최종 파일명으로 교체)
+        def write_text(part_path):
+            with open(part_path, 'w', encoding='utf-8') as f:
+                f.write(file_content)
+        write_claimed_file(txt_path, write_text)
         
         print(f"8-1-1. 메일 텍스트 파일 저장 완료: {txt_path}")
         return txt_path
@@ -617,14 +1465,437 @@ def save_email_file(email_subject, email_body, order_number, hotel_name):
     except Exception as e:
         print(f"8-1. 메일 텍스트 파일 저장 실패: {e}")
         log_error(f"메일 텍스트 파일 저장 실패: {e}")
+        if txt_path:
+            discard_claimed_file(txt_path)
         return None
 
-# ✅ 9. [메인 처리 함수]
+# ✅ 9. [주문 1건 처리]
+def lookup_reservation(row, order_number):
+    """캐시 → 일괄 조회 인덱스 → HTTP → Chrome 순서로 예약 정보를 조회합니다. 반환: (예약 정보, 실패 상태)"""
+    # 0. 예약 정보 캐시 → 일괄 조회 인덱스 (없으면 개별 검색)
+    with stage_timer("cache_lookup"):
+        web_data = reservation_cache.get(order_number) if reservation_cache else None
+    if web_data is not None:
+        print(f"4-0. 캐시된 예약 정보 사용: {order_number}")
+        set_order_source("cache")
+        return web_data, None
+    web_data = lookup_reservation_index(order_number)
+    if web_data is not None:
+        set_order_source("batch_index")
+    
+    # 1~2. HTTP 추출 모드 (실패 시 Chrome 검색/추출로 대체)
+    if web_data is None and is_http_extraction_enabled():
+        set_order_source("http")
+        try:
+            with stage_timer("http_lookup"):
+                web_data = governed_call("HTTP 조회", fetch_reservation_data_http, order_number)
+        except TransientSiteError:
+            web_data = None
+    if web_data is None and is_http_extraction_enabled() and not get_extraction_config().get('browser_fallback', True):
+        return None, "데이터추출실패"
+    
+    if web_data is None:
+        set_order_source("browser")
+        # 1. 주문번호로 검색 (일시적 오류는 백오프 재시도)
+        try:
+            with stage_timer("search"):
+                governed_call("주문번호 검색", search_order_by_number, order_number)
+        except TransientSiteError:
+            return None, "검색실패"
+        journal_record(row, order_number, 'searched')
+        
+        # 2. 웹에서 데이터 추출
+        try:
+            with stage_timer("extract"):
+                web_data = governed_call("데이터 추출", extract_reservation_data, order_number, rate_limited=False)
+        except TransientSiteError:
+            return None, "데이터추출실패"
+        if not web_data:
+            return None, "데이터추출실패"
+    
+    if reservation_cache:
+        reservation_cache.put(order_number, web_data)
+    return web_data, None
+
+def process_single_order(i, total, cx_data, shared_lookup=None):
+    """주문 1건을 검색 → 추출 → 엑셀 → 메일 순서로 처리하고 결과 상태를 반환합니다.
+    shared_lookup: 같은 주문번호의 다른 행과 공유하는 조회 결과 (한 번만 조회)
+    출력 파이프라인 사용 시 조회까지만 처리하고 OUTPUT_PENDING 반환 (최종 결과는 출력 스레드에서 기록)"""
+    begin_order_metrics(i, cx_data['order_number'])
+    _worker_context.output_job = None
+    status = "처리오류"
+    try:
+        status = _process_single_order(i, total, cx_data, shared_lookup)
+        return status
+    finally:
+        job = _worker_context.output_job
+        _worker_context.output_job = None
+        if status == OUTPUT_PENDING and job is not None:
+            # 지표 측정은 출력 스레드에서 이어서 기록
+            job['metrics'] = _worker_context.order_metrics
+            job['retries'] = getattr(_worker_context, 'retries', 0)
+            _worker_context.order_metrics = None
+            output_pipeline.submit(job)
+        else:
+            finish_order_metrics(status)
+
+def _process_single_order(i, total, cx_data, shared_lookup):
+    order_number = cx_data['order_number']
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    worker_label = f"[워커 {current_worker_id()}] " if get_worker_count(total) > 1 else ""
+    progress = checkpoint_journal.progress(i, order_number) if checkpoint_journal else {}
+    
+    print(f"\n--- {worker_label}{i}/{total} 처리 시작: 주문번호 {order_number} ---")
+    progress_reporter.update(current_order=order_number)
+    
+    # 재개 모드: 이전 실행에서 완료된 주문은 건너뜀
+    if 'email_written' in progress:
+        print(f"--- {worker_label}{i}/{total} 이전 실행에서 완료됨: 건너뜀 ---")
+        log_result(order_number, progress['email_written'].get('subject', ''), "이전실행완료", timestamp)
+        return "이전실행완료"
+    
+    # 1~2. 예약 정보 조회 (이전 실행에서 추출된 데이터가 있으면 재사용)
+    web_data = progress.get('extracted', {}).get('data')
+    if web_data is not None:
+        set_order_source("journal")
+    else:
+        if shared_lookup is not None and 'result' in shared_lookup:
+            set_order_source("shared")
+            web_data, failure = shared_lookup['result']
+            shared_lookup['reused'] += 1
+            print(f"4-0. 같은 주문번호의 조회 결과 재사용: {order_number}")
+        else:
+            web_data, failure = lookup_reservation(i, order_number)
+            if shared_lookup is not None:
+                shared_lookup['result'] = (web_data, failure)
+        if failure:
+            log_order_failure(order_number, failure, timestamp)
+            return failure
+        journal_record(i, order_number, 'extracted', data=web_data)
+    
+    # 3~6. 파일 출력: 파이프라인 사용 시 출력 대기열에 넘기고 브라우저는 바로 다음 주문 진행
+    if output_pipeline is not None:
+        _worker_context.output_job = {
+            'row': i,
+            'total': total,
+            'cx_data': cx_data,
+            'web_data': web_data,
+            'progress': progress,
+            'timestamp': timestamp,
+            'worker_id': current_worker_id(),
+            'worker_label': worker_label
+        }
+        print(f"--- {worker_label}{i}/{total} 조회 완료: 출력 대기열로 전달 ---")
+        return OUTPUT_PENDING
+    return write_order_output(i, total, cx_data, web_data, progress, timestamp, worker_label)
+
+def write_order_output(i, total, cx_data, web_data, progress, timestamp, worker_label):
+    """조회된 예약 정보로 클레임 엑셀과 메일 파일을 만들고 결과를 기록합니다."""
+    order_number = cx_data['order_number']
+    
+    # 3. 엑셀 파일 생성 (이전 실행에서 생성된 파일이 있으면 재사용, 저장은 작성 스레드에서 메일 생성과 동시 진행)
+    excel_path = progress.get('excel_written', {}).get('path')
+    excel_future = None
+    if not excel_path or not os.path.exists(excel_path):
+        with stage_timer("excel"):
+            excel_path, excel_future = create_claim_excel(order_number, web_data.get('hotel_name', ''), web_data)
+        if not excel_path:
+            log_result(order_number, "엑셀생성실패", "엑셀생성실패", timestamp)
+            return "엑셀생성실패"
+        if excel_future is None:
+            journal_record(i, order_number, 'excel_written', path=excel_path)
+    
+    # 4. 메일 내용 생성
+    with stage_timer("email_render"):
+        email_subject, email_body = create_email_content(cx_data, web_data)
+    if not email_subject or not email_body:
+        log_result(order_number, "메일생성실패", "메일생성실패", timestamp)
+        return "메일생성실패"
+    
+    # 작성 스레드의 엑셀 저장 완료 확인 (엑셀 없이 메일 파일만 남지 않도록 메일 파일 저장 전에 확인)
+    if excel_future is not None:
+        try:
+            record_stage_time("excel_write", excel_future.result())
+        except Exception as e:
+            print(f"6-1. 엑셀 파일 생성 실패: {e}")
+            log_error(f"주문번호 {order_number} 엑셀 파일 생성 실패: {e}")
+            discard_claimed_file(excel_path)
+            log_result(order_number, "엑셀생성실패", "엑셀생성실패", timestamp)
+            return "엑셀생성실패"
+        journal_record(i, order_number, 'excel_written', path=excel_path)
+    
+    # 5. 메일 텍스트 파일 저장
+    with stage_timer("file_save"):
+        txt_path = save_email_file(email_subject, email_body, order_number, web_data.get('hotel_name', ''))
+    if not txt_path:
+        log_result(order_number, "파일저장실패", "파일저장실패", timestamp)
+        return "파일저장실패"
+    
+    journal_record(i, order_number, 'email_written', path=txt_path, subject=email_subject)
+    
+    # 6. 성공 로그 기록
+    log_result(order_number, email_subject, "성공", timestamp)
+    
+    print(f"--- {worker_label}{i}/{total} 처리 완료: 성공 ---")
+    return "성공"
+
+def process_order_group(rows, total):
+    """같은 주문번호의 행들을 예약 정보 1회 조회로 처리합니다. 반환: (행별 상태 목록, 절약한 조회 수)"""
+    shared_lookup = {'reused': 0}
+    statuses = []
+    for i, cx_data in rows:
+        try:
+            status = process_single_order(i, total, cx_data, shared_lookup)
+        except Exception as e:
+            status = "처리오류"
+            log_error(f"[워커 {current_worker_id()}] 주문번호 {cx_data.get('order_number', '')} 처리 중 오류: {e}")
+            log_order_failure(cx_data.get('order_number', ''), "처리오류", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        statuses.append(status)
+    return statuses, shared_lookup['reused']
+
+# ✅ 9-1. [조회/출력 단계 분리 파이프라인]
+# 조회를 마치고 출력 대기열로 넘긴 주문의 임시 상태 (출력 스레드에서 최종 결과로 기록)
+OUTPUT_PENDING = "출력대기"
+
+class OrderOutputPipeline:
+    """조회 단계(브라우저 워커)가 넘긴 주문을 출력 스레드가 엑셀/메일 파일로 작성
+    대기열 크기를 제한해 출력이 밀리면 조회 단계가 대기 (backpressure)"""
+
+    def __init__(self, threads=2, queue_size=20):
+        self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._threads = [
+            threading.Thread(target=self._run, name=f"order-output-{index}", daemon=True)
+            for index in range(max(1, int(threads)))
+        ]
+        self._lock = threading.Lock()
+        self.put_waits = []
+        self.max_depth = 0
+        self._closed = False
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, job):
+        """출력 작업 추가 (대기열이 가득 차면 빈 자리가 날 때까지 대기)"""
+        started = time.perf_counter()
+        job['queued'] = started
+        self._queue.put(job)
+        with self._lock:
+            self.put_waits.append(time.perf_counter() - started)
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            complete_order_output(job)
+
+    def close(self):
+        """남은 출력 작업을 모두 처리한 뒤 출력 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def report(self):
+        if not self.put_waits:
+            return
+        blocked = [wait for wait in self.put_waits if wait >= 0.001]
+        log_debug(f"출력 파이프라인: {len(self.put_waits)}건, 최대 대기열 {self.max_depth}건, "
+                  f"대기열 가득 참으로 조회 대기 {len(blocked)}회 (합계 {sum(blocked):.1f}초)")
+
+def complete_order_output(job):
+    """출력 스레드: 조회가 끝난 주문의 엑셀/메일 파일을 만들고 최종 결과를 기록합니다."""
+    order_number = job['cx_data'].get('order_number', '')
+    _worker_context.worker_id = job['worker_id']
+    _worker_context.order_metrics = job['metrics']
+    _worker_context.retries = job['retries']
+    _worker_context.defer_retryable = False
+    record_stage_time("output_queue", time.perf_counter() - job['queued'])
+    status = "처리오류"
+    try:
+        status = write_order_output(job['row'], job['total'], job['cx_data'], job['web_data'],
+                                    job['progress'], job['timestamp'], job['worker_label'])
+    except Exception as e:
+        log_error(f"[출력] 주문번호 {order_number} 처리 중 오류: {e}")
+        log_result(order_number, "처리오류", "처리오류", job['timestamp'])
+    finally:
+        finish_order_metrics(status)
+        count_status(status)
+
+def count_status(status):
+    """주문(행) 1건의 최종 결과 집계 + 진행 상황 전송"""
+    with _log_lock:
+        run_stats[status] = run_stats.get(status, 0) + 1
+    progress_reporter.record(status in ("성공", "이전실행완료"))
+
+def init_output_pipeline():
+    """출력 파이프라인 시작 (output_pipeline.enabled가 false면 조회 스레드에서 바로 출력)"""
+    global output_pipeline
+    pipeline_config = config.get('output_pipeline', {})
+    if pipeline_config.get('enabled', True):
+        output_pipeline = OrderOutputPipeline(pipeline_config.get('threads', 2), pipeline_config.get('queue_size', 20))
+        log_debug(f"출력 파이프라인 사용: 출력 스레드 {pipeline_config.get('threads', 2)}개, 대기열 최대 {pipeline_config.get('queue_size', 20)}건")
+
+# ✅ 10. [병렬 워커 풀]
+def get_worker_count(total_orders=None):
+    """설정된 워커 수 반환 (1 이상, 처리 건수 이하)"""
+    try:
+        count = int(config.get('worker_pool', {}).get('workers', 1))
+    except Exception:
+        count = 1
+    count = max(1, count)
+    if total_orders is not None:
+        count = min(count, max(1, total_orders))
+    return count
+
+def is_driver_alive(web_driver):
+    """드라이버 세션이 살아있는지 확인"""
+    try:
+        web_driver.current_url
+        return True
+    except Exception:
+        return False
+
+def share_login_session(web_driver, cookies):
+    """메인 드라이버의 로그인 쿠키를 다른 드라이버에 복사 (재로그인 생략)"""
+    try:
+        # 쿠키 도메인 설정을 위해 먼저 같은 사이트로 진입
+        web_driver.get(config['urls']['base_url'])
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry')}
+            try:
+                web_driver.add_cookie(cookie)
+            except Exception:
+                continue
+        web_driver.get(config['urls']['base_url'] + config['urls']['orders_page'])
+        return "login" not in web_driver.current_url.lower()
+    except Exception as e:
+        log_error(f"로그인 세션 공유 실패: {e}")
+        return False
+
+def start_worker_driver(worker_id, cookies):
+    """워커용 Chrome을 띄우고 로그인 상태로 만든 뒤 반환 (실패 시 None)"""
+    try:
+        web_driver = open_worker_browser(worker_id)
+    except Exception as e:
+        log_error(f"워커 {worker_id} Chrome 실행 실패: {e}")
+        return None
+    worker_drivers.append(web_driver)
+    if web_driver in attached_drivers and is_logged_in(web_driver):
+        print(f"워커 {worker_id}: 브라우저 풀 세션 사용 (로그인 유지)")
+        return web_driver
+    if cookies and share_login_session(web_driver, cookies):
+        print(f"워커 {worker_id}: 로그인 쿠키 공유 완료")
+        return web_driver
+    if login_to_admin(web_driver):
+        print(f"워커 {worker_id}: 개별 로그인 완료")
+        return web_driver
+    log_error(f"워커 {worker_id} 로그인 실패 - 워커에서 제외")
+    return None
+
+def restart_worker_driver(worker_id, web_driver):
+    """죽은 워커 드라이버를 정리하고 새 세션으로 교체"""
+    close_driver(web_driver)
+    if web_driver in attached_drivers:
+        # 죽은 풀 세션에 다시 연결하지 않도록 새 Chrome 실행
+        attached_drivers.remove(web_driver)
+        pooled_browser_addresses[worker_id] = ""
+    if web_driver in worker_drivers:
+        worker_drivers.remove(web_driver)
+    return start_worker_driver(worker_id, [])
+
+def run_worker(worker_id, drivers, order_queue, total, retry_queue=None):
+    """공유 큐에서 주문(같은 주문번호 행 묶음)을 꺼내 처리하는 워커 루프
+    drivers: 워커별 드라이버 목록 (재시작한 드라이버는 drivers[worker_id]에 반영해 재시도 단계에서도 사용)
+    retry_queue: 일시적 실패 행을 실행 끝에 다시 처리하도록 모아둘 큐 (None이면 바로 실패 기록)"""
+    web_driver = drivers[worker_id]
+    if web_driver is None or not is_driver_alive(web_driver):
+        # 이전 단계에서 세션이 죽었거나 재시작에 실패한 워커: 주문을 꺼내기 전에 복구
+        log_error(f"워커 {worker_id} 브라우저 세션 없음 - 재시작 시도")
+        web_driver = drivers[worker_id] = restart_worker_driver(worker_id, web_driver)
+        if web_driver is None:
+            log_error(f"워커 {worker_id} 재시작 실패 - 워커 종료")
+            return
+    _worker_context.driver = web_driver
+    _worker_context.worker_id = worker_id
+    _worker_context.defer_retryable = retry_queue is not None
+    
+    while not worker_stop_event.is_set():
+        try:
+            order_number, rows = order_queue.get_nowait()
+        except queue.Empty:
+            break
+        
+        statuses, reused = process_order_group(rows, total)
+        
+        retry_rows = []
+        if retry_queue is not None:
+            retry_rows = [row for row, status in zip(rows, statuses) if status in RETRYABLE_STATUSES]
+            if retry_rows:
+                retry_queue.put((order_number, retry_rows))
+        
+        for status in statuses:
+            if status != OUTPUT_PENDING and (retry_queue is None or status not in RETRYABLE_STATUSES):
+                count_status(status)
+        with _log_lock:
+            lookup_stats['saved'] += reused
+        
+        # 브라우저 세션이 죽은 경우 워커 자체 복구 (실패 시 남은 주문은 다른 워커가 처리)
+        if any(status not in ("성공", OUTPUT_PENDING) for status in statuses) and not is_driver_alive(web_driver):
+            log_error(f"워커 {worker_id} 브라우저 세션 종료 감지 - 재시작 시도")
+            web_driver = drivers[worker_id] = restart_worker_driver(worker_id, web_driver)
+            if web_driver is None:
+                log_error(f"워커 {worker_id} 재시작 실패 - 워커 종료")
+                break
+            _worker_context.driver = web_driver
+
+def run_workers(drivers, order_queue, total, retry_queue=None):
+    """드라이버마다 워커를 띄워 큐가 빌 때까지 처리 (워커 1개면 현재 스레드에서 실행)"""
+    if len(drivers) == 1:
+        run_worker(0, drivers, order_queue, total, retry_queue)
+        return
+    threads = [
+        threading.Thread(target=run_worker, args=(worker_id, drivers, order_queue, total, retry_queue), daemon=True)
+        for worker_id in range(len(drivers))
+    ]
+    worker_threads[:] = threads
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    worker_threads.clear()
+
+def stop_workers():
+    """워커에 중지 신호를 보내고 처리 중인 주문이 끝날 때까지 대기 (worker_pool.stop_timeout초)"""
+    worker_stop_event.set()
+    timeout = float(config.get('worker_pool', {}).get('stop_timeout', 30))
+    deadline = time.monotonic() + timeout
+    for thread in worker_threads:
+        thread.join(max(0, deadline - time.monotonic()))
+    running = [thread for thread in worker_threads if thread.is_alive()]
+    if running:
+        log_error(f"워커 {len(running)}개가 {timeout:g}초 안에 종료되지 않음 - 정리 단계 진행")
+    worker_threads.clear()
+
+# ✅ 11. [메인 처리 함수]
 def process_claim_requests():
     """클레임 요청을 처리합니다."""
     try:
         print("9-1. 클레임 요청 처리 시작...")
         
+        # 메일 템플릿 컴파일 (형식 오류/알 수 없는 변수는 조회 전에 중단)
+        try:
+            compile_template(config['email_template']['subject_template'])
+            compile_template(config['email_template']['body_template'])
+        except TemplateError as e:
+            print(f"9-1-1. 메일 템플릿 오류: {e}")
+            log_error(f"메일 템플릿 오류: {e}")
+            return
+        
         # 엑셀 파일 읽기
         cx_data_list = read_cx_excel_data(
             config['file_paths']['cx_excel'],
@@ -636,58 +1907,144 @@ def process_claim_requests():
             print("9-1-1. 처리할 데이터가 없습니다.")
             return
         
-        print(f"9-1-2. {len(cx_data_list)}개 데이터 처리 시작")
-        
-        # 각 데이터 처리
-        for i, cx_data in enumerate(cx_data_list, 1):
-            order_number = cx_data['order_number']
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            print(f"\n--- {i}/{len(cx_data_list)} 처리 시작: 주문번호 {order_number} ---")
-            
-            # 1. 주문번호로 검색
-            if not search_order_by_number(order_number):
-                log_result(order_number, "검색실패", "검색실패", timestamp)
-                continue
-            
-            # 2. 웹에서 데이터 추출
-            web_data = extract_reservation_data(order_number)
-            if not web_data:
-                log_result(order_number, "데이터추출실패", "데이터추출실패", timestamp)
-                continue
-            
-            # 3. 엑셀 파일 생성
-            excel_path = create_claim_excel(order_number, web_data.get('hotel_name', ''), web_data)
-            if not excel_path:
-                log_result(order_number, "엑셀생성실패", "엑셀생성실패", timestamp)
-                continue
-            
-            # 4. 메일 내용 생성
-            email_subject, email_body = create_email_content(cx_data, web_data)
-            if not email_subject or not email_body:
-                log_result(order_number, "메일생성실패", "메일생성실패", timestamp)
-                continue
-            
-            # 5. 메일 텍스트 파일 저장
-            txt_path = save_email_file(email_subject, email_body, order_number, web_data.get('hotel_name', ''))
-            if not txt_path:
-                log_result(order_number, "파일저장실패", "파일저장실패", timestamp)
-                continue
-            
-            # 6. 성공 로그 기록
-            log_result(order_number, email_subject, "성공", timestamp)
-            
-            print(f"--- {i}/{len(cx_data_list)} 처리 완료: 성공 ---")
+        total = len(cx_data_list)
+        order_groups = group_cx_data_by_order(cx_data_list)
+        worker_count = get_worker_count(len(order_groups))
+        print(f"9-1-2. {total}개 데이터 처리 시작 (고유 주문 {len(order_groups)}건, 워커 {worker_count}개)")
+        
+        # 공유 작업 큐 구성 (같은 주문번호의 행은 한 작업으로 묶어 예약 정보를 한 번만 조회)
+        order_queue = queue.Queue()
+        for order_group in order_groups:
+            order_queue.put(order_group)
+        lookup_stats['saved'] = 0
+        
+        # HTTP 추출 모드: 메인 드라이버의 로그인 쿠키로 HTTP 세션 구성
+        if is_http_extraction_enabled():
+            init_http_session(driver)
+        
+        # 요청 제어 준비 (속도 제한 / 서킷 브레이커)
+        init_request_governance()
+        
+        # 주문별 단계 지표 파일 열기
+        init_order_metrics()
+        
+        # 예약 정보 캐시 열기
+        init_reservation_cache()
+        
+        # 체크포인트 저널 열기 (재개 모드면 이전 기록 로드)
+        init_checkpoint_journal()
+        
+        # 일괄 조회 모드: 기간 검색으로 주문번호 인덱스 구성 (캐시/저널에 있는 주문 제외)
+        if is_batch_lookup_enabled():
+            uncached = [
+                cx for i, cx in enumerate(cx_data_list, 1)
+                if not (reservation_cache and reservation_cache.contains(cx['order_number']))
+                and not (checkpoint_journal and 'extracted' in checkpoint_journal.progress(i, cx['order_number']))
+            ]
+            if uncached:
+                build_reservation_index(uncached)
+        
+        # 워커 드라이버 준비 (메인 드라이버 = 워커 0)
+        drivers = [driver]
+        if worker_count > 1:
+            share_cookies = config.get('worker_pool', {}).get('share_login_cookies', True)
+            cookies = driver.get_cookies() if share_cookies else []
+            for worker_id in range(1, worker_count):
+                web_driver = start_worker_driver(worker_id, cookies)
+                if web_driver is not None:
+                    drivers.append(web_driver)
+            print(f"9-1-2-1. 가동 워커: {len(drivers)}개")
         
+        run_stats.clear()
+        init_claim_writer()
+        init_output_pipeline()
+        progress_reporter.update(total=total, stage="lookup")
+        retry_queue = queue.Queue() if get_governance_config().get('retry_failed_at_end', True) else None
+        run_workers(drivers, order_queue, total, retry_queue)
+        
+        # 재시도 대기열: 일시적 실패로 밀려난 주문을 실행 끝에 한 번 더 처리 (이번에는 실패를 그대로 기록)
+        retried = retry_queue.qsize() if retry_queue is not None else 0
+        if retried:
+            log_debug(f"재시도 대기열 처리 시작: {retried}건")
+            progress_reporter.update(stage="retry")
+            run_workers(drivers, retry_queue, total)
+        
+        # 출력 대기열에 남은 주문과 엑셀 저장 작업 완료 대기
+        progress_reporter.update(stage="finishing", current_order=None)
+        if output_pipeline:
+            output_pipeline.close()
+        claim_writer.shutdown()
+        
+        # 모든 워커가 중단되어 남은 주문 기록
+        for remaining_queue in (order_queue, retry_queue):
+            while remaining_queue is not None and not remaining_queue.empty():
+                order_number, rows = remaining_queue.get_nowait()
+                for _ in rows:
+                    log_result(order_number, "미처리", "미처리", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                    count_status("미처리")
+        
+        summary = ", ".join(f"{status} {count}건" for status, count in run_stats.items())
+        log_debug(f"처리 결과 요약: {summary}")
+        log_debug(f"중복 주문번호 병합: {total}개 행 / 고유 주문 {len(order_groups)}건, 절약한 예약 조회 {lookup_stats['saved']}건")
+        log_debug(f"요청 제어: 재시도 {governance_stats['retries']}회, 서킷 브레이커 작동 {circuit_breaker.trips if circuit_breaker else 0}회, 재시도 대기열 {retried}건")
+        report_wait_stats()
+        report_stage_metrics()
+        claim_writer.report()
+        if output_pipeline:
+            output_pipeline.report()
+        if reservation_cache:
+            log_debug(f"예약 정보 캐시: 적중 {reservation_cache.hits}건, 미적중 {reservation_cache.misses}건")
+        progress_reporter.update(stage="completed")
         print("9-1-3. 모든 데이터 처리 완료!")
         
     except Exception as e:
         print(f"9-1. 처리 중 오류 발생: {e}")
         log_error(f"메인 처리 중 오류: {e}")
 
-# ✅ 10. [메인 실행]
+# ✅ 12. [Chrome 드라이버 생성 / 브라우저 풀 연결]
+# 서버(main.py)의 브라우저 풀이 미리 로그인해 둔 Chrome 주소 (쉼표 구분, 워커 순서대로 사용)
+pooled_browser_addresses = [a.strip() for a in os.environ.get('BROWSER_POOL_ADDRESSES', '').split(',') if a.strip()]
+
+def open_worker_browser(worker_id):
+    """워커용 드라이버 생성 (브라우저 풀 세션이 있으면 연결, 없으면 새 Chrome 실행)"""
+    if worker_id < len(pooled_browser_addresses) and pooled_browser_addresses[worker_id]:
+        address = pooled_browser_addresses[worker_id]
+        try:
+            web_driver = create_chrome_driver(debugger_address=address, fast_profile=config.get('fast_profile'))
+            attached_drivers.append(web_driver)
+            return web_driver
+        except Exception as e:
+            log_error(f"브라우저 풀 세션 연결 실패 ({address}) - 새 Chrome 실행: {e}")
+    port_base = int(config.get('worker_pool', {}).get('debug_port_base', 9222))
+    return create_chrome_driver(port_base + worker_id, fast_profile=config.get('fast_profile'))
+
+def is_logged_in(web_driver):
+    """예약목록 페이지로 이동했을 때 로그인 페이지로 돌아가지 않으면 로그인 상태 (이동 후 현재 페이지는 예약목록)"""
+    try:
+        return admin_login.is_logged_in(web_driver, config, wait=timed_wait)
+    except Exception:
+        return False
+
+def close_driver(web_driver):
+    """드라이버 종료 (브라우저 풀 세션은 브라우저를 남겨두고 연결만 해제)"""
+    try:
+        if web_driver in attached_drivers:
+            web_driver.service.stop()
+        else:
+            web_driver.quit()
+    except Exception:
+        pass
+
+# ✅ 13. [로그인] (브라우저 풀과 같은 services/admin_login 흐름 사용, 대기 시간은 구간별로 기록)
+def login_to_admin(web_driver):
+    """관리자 사이트에 로그인합니다."""
+    return admin_login.login_to_admin(web_driver, config, wait=timed_wait, on_error=log_error)
+
+# ✅ 14. [메인 실행]
 def main():
     global main_window, driver
+    # 실행기의 중지 요청(SIGTERM) 시 남은 로그를 기록하고 아래 정리 단계(finally)를 거쳐 종료
+    signal.signal(signal.SIGTERM, handle_sigterm)
     try:
         # Lock 파일 확인
         if not check_lock_file():
@@ -702,159 +2059,23 @@ def main():
         # 실행 시작 로그
         log_start()
         
-        # Chrome 설정
+        # Chrome 설정 (브라우저 풀 세션이 있으면 연결)
+        progress_reporter.update(stage="login")
         print("Chrome 설정 중...")
-        options = Options()
-
-        # 서버 환경을 위한 헤드리스 모드 설정 (최신 크롬 권장 플래그)
-        options.add_argument('--headless=new')  # GUI 없이 실행
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-logging')
-        options.add_argument('--disable-web-security')
-        options.add_argument('--allow-running-insecure-content')
-        options.add_argument('--ignore-certificate-errors')
-        options.add_argument('--ignore-ssl-errors')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--remote-debugging-port=9222')
-        options.add_argument('--disable-background-timer-throttling')
-        options.add_argument('--disable-backgrounding-occluded-windows')
-        options.add_argument('--disable-renderer-backgrounding')
-
-        # 지역/UA 설정 및 간단 반봇 우회 플래그
-        options.add_argument('--lang=ko-KR')
-        options.add_argument('--accept-lang=ko-KR,ko')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36')
-        try:
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            options.add_experimental_option('useAutomationExtension', False)
-        except Exception:
-            pass
-
-        # Linux 환경에서 Chrome/ChromeDriver 경로 자동 감지 (우선순위: 사용자 홈 설치 → 시스템)
-        possible_chrome_bins = [
-            '/usr/bin/google-chrome',                 # 시스템 설치 우선
-            '/home/allmytour/bin/google-chrome',      # 사용자 홈 래퍼/바이너리
-            '/opt/google/chrome/chrome',
-            '/snap/bin/chromium'
-        ]
-        chrome_bin = next((p for p in possible_chrome_bins if os.path.exists(p)), None)
-        if chrome_bin:
-            options.binary_location = chrome_bin
-            print(f"Chrome binary: {chrome_bin}")
-        else:
-            print("경고: Chrome 실행 파일을 찾지 못했습니다. PATH 의존 실행을 시도합니다.")
-
-        possible_drivers = [
-            '/home/allmytour/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/usr/bin/chromedriver'
-        ]
-        driver_path = next((p for p in possible_drivers if os.path.exists(p)), None)
-        if driver_path:
-            print(f"ChromeDriver: {driver_path}")
-            service = Service(driver_path)
-        else:
-            print("경고: ChromeDriver 파일을 찾지 못했습니다. PATH 상의 chromedriver 사용을 시도합니다.")
-            service = Service()  # PATH 검색에 위임
-
-        print("독립 실행 모드: 헤드리스 모드")
-
-        driver = webdriver.Chrome(service=service, options=options)
+        driver = open_worker_browser(0)
         print("Chrome 설정 완료!")
         
-        # 헤드리스 모드에서는 창 크기 설정이 옵션에서 처리됨
-        # driver.maximize_window()  # 헤드리스 모드에서는 사용 불가
-        # driver.set_window_position(0, 0)  # 헤드리스 모드에서는 사용 불가
-        # driver.set_window_size(1920, 1080)  # 옵션에서 이미 설정됨
-        
-        # WebDriverWait 설정
-        wait = WebDriverWait(driver, 30)  # 30초 대기
-        
-        # 로그인
-        try:
-            print(f"로그인 페이지 접속: {config['login']['url']}")
-            # 페이지 로드 타임아웃 설정 (늘림)
-            try:
-                driver.set_page_load_timeout(60)
-            except Exception:
-                pass
-
-            # 1차 진입
-            try:
-                driver.get(config['login']['url'])
-            except TimeoutException:
-                print("페이지 로드 타임아웃 - 재시도 1회")
-                try:
-                    driver.get(config['login']['url'])
-                except TimeoutException:
-                    print("페이지 로드 타임아웃 - 현재 상태에서 진행 시도")
-
-            # about:blank 대응 - 명시적 로그인 경로로 재시도
-            if driver.current_url.strip().lower().startswith("about:blank"):
-                fallback_login = config['login']['url'].rstrip('/') + '/login'
-                print(f"about:blank 감지 → {fallback_login} 재진입")
-                try:
-                    driver.get(fallback_login)
-                except TimeoutException:
-                    print("fallback 경로도 타임아웃 - 요소 대기로 진행")
-
-            # 로그인 폼 요소 대기 (존재 + 클릭 가능)
-            user_id_field = wait.until(EC.element_to_be_clickable((By.NAME, "userId")))
-            password_field = wait.until(EC.element_to_be_clickable((By.NAME, "userPasswd")))
-            print("로그인 페이지 로드 완료")
-
-            # 로그인 폼 입력 (안전 입력 헬퍼 사용)
-            user_ok = type_safely(driver, (By.NAME, "userId"), config['login']['user_id'])
-            pw_ok = type_safely(driver, (By.NAME, "userPasswd"), config['login']['password'])
-            user_id_field = driver.find_element(By.NAME, "userId")
-            password_field = driver.find_element(By.NAME, "userPasswd")
-            if user_ok:
-                print("사용자 ID 입력 완료")
-            if pw_ok:
-                print("비밀번호 입력 완료")
-
-            # 로그인 버튼 클릭 (재조회 기반 3회 재시도 → 최종 Enter)
-            print("로그인 제출 시도 (form submit 우선)...")
-            submitted = submit_form_safely(driver, password_field)
-            if not submitted:
-                print("form submit 실패 → 버튼 클릭 시도")
-                clicked = click_safely(driver, [
-                    (By.CSS_SELECTOR, "input[type='submit']"),
-                    (By.CSS_SELECTOR, "button[type='submit']"),
-                    (By.XPATH, "//input[@type='submit' or contains(translate(@value,'login','LOGIN'),'LOGIN')]")
-                ], retries=3)
-                if not clicked:
-                    print("버튼 클릭 실패 → Enter 대체 제출")
-                    try:
-                        password_field.send_keys(Keys.ENTER)
-                    except Exception:
-                        pass
-
-            # 로그인 후 전환 대기 (URL/타이틀 변화 혹은 특정 요소 대기)
-            try:
-                wait.until(lambda d: "login" not in d.current_url.lower())
-            except TimeoutException:
-                pass
-
-            time.sleep(2)
-            print(f"로그인 후 페이지 제목: {driver.title}")
-            print("로그인 완료!")
-            
-        except Exception as e:
-            print(f"로그인 실패: {e}")
-            log_error(f"로그인 실패: {e}")
+        # 로그인 (브라우저 풀 세션이 이미 로그인 상태면 생략, 확인 과정에서 예약목록 페이지로 이동됨)
+        if driver in attached_drivers and is_logged_in(driver):
+            print("브라우저 풀 세션 로그인 유지 - 로그인/예약목록 이동 생략")
+        elif not login_to_admin(driver):
             return
-        
-        # 예약목록 페이지 이동
-        orders_url = config['urls']['base_url'] + config['urls']['orders_page']
-        print(f"예약목록 페이지 이동: {orders_url}")
-        driver.get(orders_url)
-        time.sleep(get_timing('page_load_wait', 2))
+        else:
+            # 예약목록 페이지 이동
+            orders_url = admin_login.get_orders_url(config)
+            print(f"예약목록 페이지 이동: {orders_url}")
+            driver.get(orders_url)
+            wait_for_page_ready(driver, "orders_page_ready")
         
         # 메인창 핸들 저장
         main_window = driver.current_window_handle
@@ -872,7 +2093,7 @@ def main():
             ts = datetime.now().strftime('%Y%m%d_%H%M%S')
             screenshot_path = os.path.join(result_dir, f"error_screenshot_{ts}.png")
             html_path = os.path.join(result_dir, f"error_page_{ts}.html")
-            if 'driver' in globals():
+            if driver is not None:
                 driver.save_screenshot(screenshot_path)
                 with open(html_path, 'w', encoding='utf-8') as f:
                     f.write(driver.page_source)
@@ -885,10 +2106,31 @@ def main():
         # Lock 파일 제거
         remove_lock_file()
         
+        # 워커 중지 (종료 신호로 중단된 경우 처리 중인 주문까지만 마치고 종료, 이후 출력/저널/브라우저 정리)
+        stop_workers()
+        
+        # 남은 출력/엑셀 저장 완료 대기 (출력 스레드가 저널에 기록하므로 저널보다 먼저)
+        if output_pipeline:
+            output_pipeline.close()
+        if claim_writer:
+            claim_writer.shutdown()
+        
+        # 예약 정보 캐시 닫기
+        if reservation_cache:
+            reservation_cache.close()
+        
+        # 체크포인트 저널 닫기 (남은 기록 fsync)
+        if checkpoint_journal:
+            checkpoint_journal.close()
+        
+        # 워커 브라우저 종료
+        for web_driver in worker_drivers:
+            close_driver(web_driver)
+        
         # 브라우저 종료
-        if 'driver' in globals():
+        if driver is not None:
             print("브라우저를 종료합니다.")
-            driver.quit()
+            close_driver(driver)
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import json
 import os
+import asyncio
 import shutil
 import zipfile
 from pathlib import Path
@@ -17,6 +18,7 @@ import time
 import subprocess
 import signal
 import psutil
+from typing import Optional
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -41,6 +43,9 @@ if frontend_path.exists():
 
 # 프로젝트 실행기 import
 from services.project_executor import get_project_executor
+from services.browser_pool import get_browser_pool
+from services.excel_manager import get_workbook_cache
+from services.cx_reader import build_cx_snapshot
 
 # 업로드 디렉토리 설정
 UPLOAD_DIR = Path(__file__).parent / "uploads"
@@ -69,6 +74,17 @@ execution_status = {
     "execution_id": None
 }
 
+# 서버 시작/종료 시 브라우저 풀 관리
+@app.on_event("startup")
+async def start_browser_pool():
+    """로그인된 Chrome 세션 풀 가동 (browser_pool.enabled 시)"""
+    threading.Thread(target=get_browser_pool().start, daemon=True).start()
+
+@app.on_event("shutdown")
+async def shutdown_browser_pool():
+    """브라우저 풀 세션 종료"""
+    get_browser_pool().shutdown()
+
 # 메인 페이지 라우트
 @app.get("/")
 async def read_root():
@@ -140,8 +156,9 @@ async def save_config(config_data: dict):
 
 # 프로젝트 시작 API
 @app.post("/api/start")
-async def start_project():
-    """프로젝트 시작"""
+async def start_project(resume: bool = False, resume_execution_id: Optional[str] = None, force_refresh: bool = False):
+    """프로젝트 시작 (resume=true 시 지정한 실행 또는 가장 최근 실행을 이어서 진행,
+    force_refresh=true 시 이번 실행만 예약 정보 캐시를 무시하고 새로 조회)"""
     global execution_status
     
     try:
@@ -163,8 +180,10 @@ async def start_project():
         with open(config_path, 'r', encoding='utf-8') as f:
             config_data = json.load(f)
         
-        # 프로젝트 시작
-        execution_id = executor.start_project(config_data)
+        # 프로젝트 시작 (재개 모드면 이전 실행 저널 사용)
+        if resume and not resume_execution_id:
+            resume_execution_id = "latest"
+        execution_id = executor.start_project(config_data, resume_execution_id if resume else None, force_refresh)
         
         # 실행 상태 업데이트
         execution_status.update({
@@ -228,12 +247,23 @@ async def get_status():
         executor_status = executor.get_status()
         
         if executor_status:
-            # 실행 중인 프로젝트가 있는 경우
+            # 실행 중인 프로젝트가 있는 경우 (RPA 진행 상황 채널 기준 진행률/예상 종료 시각)
+            progress_detail = executor_status.get("progress") or {}
+            progress = progress_detail.get("percent", 0) if executor_status["status"] == "running" else 100
+            execution_status.update({
+                "status": executor_status["status"],
+                "progress": progress,
+                "progress_detail": progress_detail,
+                "start_time": executor_status["start_time"],
+                "end_time": executor_status.get("end_time"),
+                "execution_id": executor_status["execution_id"]
+            })
             return {
                 "success": True,
                 "status": executor_status["status"],
                 "message": f"실행 중 - {executor_status['status']}",
-                "progress": 50 if executor_status["status"] == "running" else 100,
+                "progress": progress,
+                "progress_detail": progress_detail,
                 "start_time": executor_status["start_time"],
                 "end_time": executor_status.get("end_time"),
                 "execution_id": executor_status["execution_id"]
@@ -261,6 +291,49 @@ async def get_status():
             "execution_id": None
         }
 
+# 브라우저 풀 상태 API
+@app.get("/api/browser-pool")
+async def get_browser_pool_status():
+    """브라우저 풀 세션 상태"""
+    try:
+        return {"success": True, "browser_pool": get_browser_pool().get_status()}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+# 실행 로그 실시간 스트림 API (SSE)
+@app.get("/api/logs/stream")
+async def stream_execution_logs(tail: int = 100):
+    """가장 최근 실행의 RPA 출력을 Server-Sent Events로 전달 (처음 연결 시 최근 tail줄부터)"""
+    executor = get_project_executor()
+    
+    async def event_stream():
+        capture = executor.get_log_capture()
+        if capture is None:
+            yield "event: end\ndata: 실행 로그가 없습니다.\n\n"
+            return
+        
+        cursor = None
+        idle_polls = 0
+        while True:
+            lines, cursor = capture.lines_since(cursor, tail)
+            for line in lines:
+                yield f"data: {line}\n\n"
+            if not lines and capture.closed:
+                yield "event: end\ndata: 실행이 종료되었습니다.\n\n"
+                return
+            # 새 출력이 없어도 연결 유지용 주석을 15초마다 전송
+            idle_polls = 0 if lines else idle_polls + 1
+            if idle_polls >= 30:
+                idle_polls = 0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(0.5)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # 실행 이력 API
 @app.get("/api/history")
 async def get_execution_history():
@@ -417,6 +490,13 @@ def monitor_execution_completion(execution_id: str):
                 break
             time.sleep(5)  # 5초마다 확인
         
+        # 중단/실패한 실행은 재개(/api/start?resume=true)할 수 있도록 업로드/결과 파일 보존
+        final_status = next((item["status"] for item in reversed(executor.get_history(limit=20))
+                             if item["execution_id"] == execution_id), None)
+        if final_status in ["failed", "stopped"]:
+            print(f"실행이 완료되지 않아 파일 정리를 건너뜁니다 (재개 가능): {execution_id}")
+            return
+        
         # 실행 완료 후 30초 대기 (사용자가 결과를 다운로드할 시간 제공)
         time.sleep(30)
         
@@ -493,12 +573,30 @@ async def upload_cx_excel(file: UploadFile = File(...)):
         with open(config_path, 'w', encoding='utf-8') as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
         
+        # 새 파일 기준으로 다시 읽도록 파싱된 워크북 캐시 비우기
+        get_workbook_cache().invalidate()
+        
+        # 업로드 파일을 한 번만 파싱해 컬럼 단위 스냅샷 저장 (이후 미리보기/검증/RPA는 스냅샷에서 읽음)
+        snapshot = None
+        try:
+            snapshot_meta = await asyncio.to_thread(build_cx_snapshot, file_path)
+            snapshot = {
+                "rows": snapshot_meta["rows"],
+                "schema_fingerprint": snapshot_meta["fingerprint"]
+            }
+        except Exception as e:
+            print(f"스냅샷 생성 실패 (원본 파일에서 읽음): {e}")
+        
+        # 실행 시작 전에 브라우저 풀 로그인 세션 선제 준비
+        get_browser_pool().warm_up_async()
+        
         return {
             "success": True,
             "message": "파일이 성공적으로 업로드되었습니다.",
             "filename": new_filename,
             "file_size": len(file_content),
-            "upload_time": datetime.now().isoformat()
+            "upload_time": datetime.now().isoformat(),
+            "snapshot": snapshot
         }
         
     except Exception as e:
@@ -0,0 +1,187 @@
+# services/admin_login.py - 관리자 사이트 로그인/로그인 상태 확인 (RPA 스크립트와 브라우저 풀 공용)
+from typing import Callable, Dict
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# 로그인 폼 요소
+USER_ID_LOCATOR = (By.NAME, "userId")
+PASSWORD_LOCATOR = (By.NAME, "userPasswd")
+SUBMIT_LOCATORS = [
+    (By.CSS_SELECTOR, "input[type='submit']"),
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.XPATH, "//input[@type='submit' or contains(translate(@value,'login','LOGIN'),'LOGIN')]")
+]
+
+def default_wait(name, driver, condition, timeout, poll_frequency=0.1):
+    """대기 시간 기록 없이 condition 대기 (RPA는 구간별 대기 시간을 기록하는 timed_wait을 넘김)"""
+    return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+
+def get_timing(config: Dict, name: str, default_seconds: float) -> float:
+    try:
+        return float(config.get('timing', {}).get(name, default_seconds))
+    except Exception:
+        return float(default_seconds)
+
+def is_login_url(url: str) -> bool:
+    return "login" in (url or "").lower()
+
+def get_orders_url(config: Dict) -> str:
+    urls = config.get('urls', {})
+    return urls.get('base_url', '') + urls.get('orders_page', '/orders')
+
+# ===== Selenium 헬퍼 (서버 안정화용) =====
+
+def wait_for_presence(driver, locator, timeout=30):
+    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+def wait_for_page_ready(driver, name="page_ready", timeout=10, wait: Callable = default_wait) -> bool:
+    """document.readyState == 'complete' 대기 (시간 초과 시 False)"""
+    try:
+        wait(name, driver, lambda d: d.execute_script("return document.readyState") == "complete", timeout)
+        return True
+    except TimeoutException:
+        return False
+
+def type_safely(driver, locator, text, clear=True, timeout=30, on_error: Callable = print) -> bool:
+    element = wait_for_presence(driver, locator, timeout)
+    try:
+        if clear:
+            element.clear()
+        element.send_keys(text)
+        return True
+    except StaleElementReferenceException:
+        element = wait_for_presence(driver, locator, timeout)
+        if clear:
+            element.clear()
+        element.send_keys(text)
+        return True
+    except Exception as e:
+        on_error(f"입력 실패 {locator}: {e}")
+        return False
+
+def click_safely(driver, locators, retries=3, scroll=True, click_wait=3, wait: Callable = default_wait) -> bool:
+    def find_first(d):
+        for by, sel in locators:
+            elems = d.find_elements(by, sel)
+            if elems:
+                return elems[0]
+        return False
+
+    for attempt in range(retries):
+        try:
+            # 매 시도마다 새로 조회 (요소가 나타나는 즉시 진행)
+            el = wait("click", driver, find_first, click_wait)
+            if scroll:
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
+            # JS 클릭(레이어 가림 회피)
+            driver.execute_script("arguments[0].click();", el)
+            return True
+        except TimeoutException:
+            return False
+        except StaleElementReferenceException:
+            continue
+        except Exception:
+            continue
+    return False
+
+def submit_form_safely(driver, from_element, on_error: Callable = print) -> bool:
+    try:
+        form = from_element.find_element(By.XPATH, "ancestor::form")
+        driver.execute_script("arguments[0].submit()", form)
+        return True
+    except Exception:
+        try:
+            from_element.send_keys(Keys.ENTER)
+            return True
+        except Exception as e:
+            on_error(f"폼 제출 실패: {e}")
+            return False
+
+# ===== 로그인 =====
+
+def is_logged_in(driver, config: Dict, wait: Callable = default_wait) -> bool:
+    """예약목록 페이지로 이동했을 때 로그인 페이지로 돌아가지 않으면 로그인 상태
+    (이동 후 현재 페이지는 예약목록, 브라우저 응답 없음 등의 오류는 호출한 쪽으로 전달)"""
+    driver.get(get_orders_url(config))
+    wait_for_page_ready(driver, "orders_page_ready", get_timing(config, 'page_ready_wait', 10), wait)
+    return not is_login_url(driver.current_url)
+
+def login_to_admin(driver, config: Dict, wait: Callable = default_wait, on_error: Callable = print) -> bool:
+    """관리자 사이트에 로그인합니다. (config: login/timing 설정, wait: 대기 함수, on_error: 오류 기록 함수)"""
+    login_config = config.get('login', {})
+    login_url = login_config.get('url', '')
+    try:
+        print(f"로그인 페이지 접속: {login_url}")
+        # 페이지 로드 타임아웃 설정 (늘림)
+        try:
+            driver.set_page_load_timeout(60)
+        except Exception:
+            pass
+
+        # 1차 진입
+        try:
+            driver.get(login_url)
+        except TimeoutException:
+            print("페이지 로드 타임아웃 - 재시도 1회")
+            try:
+                driver.get(login_url)
+            except TimeoutException:
+                print("페이지 로드 타임아웃 - 현재 상태에서 진행 시도")
+
+        # about:blank 대응 - 명시적 로그인 경로로 재시도
+        if driver.current_url.strip().lower().startswith("about:blank"):
+            fallback_login = login_url.rstrip('/') + '/login'
+            print(f"about:blank 감지 → {fallback_login} 재진입")
+            try:
+                driver.get(fallback_login)
+            except TimeoutException:
+                print("fallback 경로도 타임아웃 - 요소 대기로 진행")
+
+        # 로그인 폼 요소 대기 (존재 + 클릭 가능)
+        login_wait = get_timing(config, 'login_wait', 30)
+        wait("login_form", driver, EC.element_to_be_clickable(USER_ID_LOCATOR), login_wait)
+        wait("login_form", driver, EC.element_to_be_clickable(PASSWORD_LOCATOR), login_wait)
+        print("로그인 페이지 로드 완료")
+
+        # 로그인 폼 입력 (안전 입력 헬퍼 사용)
+        user_ok = type_safely(driver, USER_ID_LOCATOR, login_config.get('user_id', ''), on_error=on_error)
+        pw_ok = type_safely(driver, PASSWORD_LOCATOR, login_config.get('password', ''), on_error=on_error)
+        password_field = driver.find_element(*PASSWORD_LOCATOR)
+        if user_ok:
+            print("사용자 ID 입력 완료")
+        if pw_ok:
+            print("비밀번호 입력 완료")
+
+        # 로그인 버튼 클릭 (재조회 기반 3회 재시도 → 최종 Enter)
+        print("로그인 제출 시도 (form submit 우선)...")
+        submitted = submit_form_safely(driver, password_field, on_error=on_error)
+        if not submitted:
+            print("form submit 실패 → 버튼 클릭 시도")
+            clicked = click_safely(driver, SUBMIT_LOCATORS, retries=3,
+                                   click_wait=get_timing(config, 'click_wait', 3), wait=wait)
+            if not clicked:
+                print("버튼 클릭 실패 → Enter 대체 제출")
+                try:
+                    password_field.send_keys(Keys.ENTER)
+                except Exception:
+                    pass
+
+        # 로그인 후 전환 대기 (URL 변화 → 전환된 페이지 로드 완료)
+        try:
+            wait("login_redirect", driver, lambda d: not is_login_url(d.current_url), login_wait)
+        except TimeoutException:
+            pass
+        wait_for_page_ready(driver, "login_page_ready", get_timing(config, 'page_ready_wait', 10), wait)
+
+        print(f"로그인 후 페이지 제목: {driver.title}")
+        print("로그인 완료!")
+        return True
+
+    except Exception as e:
+        print(f"로그인 실패: {e}")
+        on_error(f"로그인 실패: {e}")
+        return False
@@ -0,0 +1,231 @@
+# services/browser_pool.py - 로그인된 헤드리스 Chrome 세션 풀 (실행 간 재사용)
+import os
+import json
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .admin_login import is_logged_in, is_login_url, login_to_admin
+from .chrome_setup import create_chrome_driver
+
+class BrowserPool:
+    """서버가 떠 있는 동안 로그인된 Chrome 세션을 유지하고 실행(RPA 프로세스)에 빌려주는 풀"""
+
+    def __init__(self):
+        self.sessions: List[Dict] = []
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_thread = None
+
+    def load_config(self) -> Dict:
+        """설정 파일 로드 (환경별 설정 파일 우선)"""
+        project_root = Path(__file__).parent.parent
+        environment = os.getenv('ENVIRONMENT', 'local')
+        config_path = project_root / "config" / f"{environment}.json"
+        if not config_path.exists():
+            config_path = project_root / "cx_claim_config.json"
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"브라우저 풀 설정 로드 실패: {e}")
+            return {}
+
+    def get_pool_config(self, config: Optional[Dict] = None) -> Dict:
+        return (config if config is not None else self.load_config()).get('browser_pool', {})
+
+    def is_enabled(self) -> bool:
+        return bool(self.get_pool_config().get('enabled', False))
+
+    # ===== 수명 관리 =====
+
+    def start(self) -> bool:
+        """풀 가동 (세션 준비 + 주기적 상태 점검 스레드 시작)"""
+        if not self.is_enabled():
+            return False
+
+        self.warm_up_async()
+        if self._health_thread is None:
+            self._health_thread = threading.Thread(target=self._health_loop, daemon=True)
+            self._health_thread.start()
+        print("브라우저 풀 가동")
+        return True
+
+    def shutdown(self):
+        """모든 세션 종료"""
+        self._stop_event.set()
+        with self._lock:
+            sessions, self.sessions = self.sessions, []
+        for session in sessions:
+            self._close_session(session)
+
+    def warm_up_async(self):
+        """로그인 세션을 백그라운드에서 미리 준비 (Excel 업로드 직후 선제 로그인용)"""
+        if self.is_enabled():
+            threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self):
+        """설정된 개수만큼 로그인된 세션 확보"""
+        with self._warm_lock:
+            config = self.load_config()
+            pool_config = self.get_pool_config(config)
+            size = int(pool_config.get('size', 1))
+            port_base = int(pool_config.get('port_base', 9300))
+
+            for index in range(size):
+                with self._lock:
+                    session = next((s for s in self.sessions if s["index"] == index), None)
+                    if session is not None and session["state"] != "idle":
+                        continue
+                    if session is not None:
+                        session["state"] = "checking"
+
+                if session is None:
+                    session = self._launch_session(index, port_base + index, config.get('fast_profile'))
+                    if session is None:
+                        continue
+
+                if not session["logged_in"]:
+                    self._login(session, config)
+                self._set_state(session, "idle")
+
+    # ===== 실행에 세션 대여 =====
+
+    def acquire(self, count: int, execution_id: str) -> List[str]:
+        """로그인된 유휴 세션을 최대 count개 대여하고 디버깅 주소 목록을 반환"""
+        with self._lock:
+            available = [s for s in self.sessions if s["state"] == "idle" and s["logged_in"]]
+            leased = available[:max(0, count)]
+            for session in leased:
+                session["state"] = "busy"
+                session["execution_id"] = execution_id
+
+        if leased:
+            print(f"브라우저 풀 세션 대여: {len(leased)}개 (실행 ID: {execution_id})")
+        return [session["address"] for session in leased]
+
+    def release(self, execution_id: str):
+        """실행이 끝난 세션 반납 (로그인 상태는 다음 점검에서 재확인)"""
+        released = False
+        with self._lock:
+            for session in self.sessions:
+                if session["execution_id"] == execution_id:
+                    session["state"] = "idle"
+                    session["execution_id"] = None
+                    session["logged_in"] = False
+                    released = True
+        if released:
+            print(f"브라우저 풀 세션 반납 (실행 ID: {execution_id})")
+            threading.Thread(target=self.health_check, daemon=True).start()
+
+    def get_status(self) -> Dict:
+        """풀 상태 요약"""
+        with self._lock:
+            sessions = [{
+                "index": s["index"],
+                "address": s["address"],
+                "state": s["state"],
+                "logged_in": s["logged_in"],
+                "execution_id": s["execution_id"],
+                "last_check": s["last_check"].isoformat() if s["last_check"] else None
+            } for s in self.sessions]
+        return {"enabled": self.is_enabled(), "sessions": sessions}
+
+    # ===== 상태 점검 =====
+
+    def _health_loop(self):
+        interval = float(self.get_pool_config().get('health_check_interval', 60))
+        while not self._stop_event.wait(interval):
+            self.health_check()
+
+    def health_check(self):
+        """유휴 세션의 생존/로그인 상태 확인 후 만료 시 재로그인, 죽은 세션은 교체"""
+        config = self.load_config()
+        with self._lock:
+            targets = [s for s in self.sessions if s["state"] == "idle"]
+            for session in targets:
+                session["state"] = "checking"
+
+        for session in targets:
+            try:
+                session["logged_in"] = self._is_logged_in(session, config)
+                if not session["logged_in"]:
+                    print(f"브라우저 풀 세션 {session['index']} 로그인 만료 - 재로그인")
+                    self._login(session, config)
+                session["last_check"] = datetime.now()
+                self._set_state(session, "idle")
+            except Exception as e:
+                print(f"브라우저 풀 세션 {session['index']} 응답 없음 - 교체: {e}")
+                with self._lock:
+                    if session in self.sessions:
+                        self.sessions.remove(session)
+                self._close_session(session)
+
+        # 교체된 세션 보충
+        self.warm_up()
+
+    # ===== 세션 생성/로그인 =====
+
+    def _set_state(self, session: Dict, state: str):
+        with self._lock:
+            session["state"] = state
+
+    def _launch_session(self, index: int, port: int, fast_profile: Optional[Dict] = None) -> Optional[Dict]:
+        user_data_dir = tempfile.mkdtemp(prefix=f"cx_claim_pool_{index}_")
+        try:
+            driver = create_chrome_driver(debug_port=port, user_data_dir=user_data_dir, fast_profile=fast_profile)
+        except Exception as e:
+            print(f"브라우저 풀 세션 {index} 실행 실패: {e}")
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            return None
+
+        session = {
+            "index": index,
+            "address": f"127.0.0.1:{port}",
+            "driver": driver,
+            "user_data_dir": user_data_dir,
+            "state": "checking",
+            "logged_in": False,
+            "execution_id": None,
+            "last_check": None
+        }
+        with self._lock:
+            self.sessions.append(session)
+        return session
+
+    def _login(self, session: Dict, config: Dict) -> bool:
+        """관리자 사이트 로그인 (RPA와 같은 services/admin_login 흐름)"""
+        driver = session["driver"]
+        try:
+            session["logged_in"] = login_to_admin(driver, config) and not is_login_url(driver.current_url)
+        except Exception as e:
+            print(f"브라우저 풀 세션 {session['index']} 로그인 중 오류: {e}")
+            session["logged_in"] = False
+        if session["logged_in"]:
+            session["last_check"] = datetime.now()
+            print(f"브라우저 풀 세션 {session['index']} 로그인 완료")
+        else:
+            print(f"브라우저 풀 세션 {session['index']} 로그인 실패")
+        return session["logged_in"]
+
+    def _is_logged_in(self, session: Dict, config: Dict) -> bool:
+        """예약목록 페이지로 이동했을 때 로그인 페이지로 돌아가지 않으면 로그인 상태 (응답 없음은 예외로 전달)"""
+        return is_logged_in(session["driver"], config)
+
+    def _close_session(self, session: Dict):
+        try:
+            session["driver"].quit()
+        except Exception:
+            pass
+        shutil.rmtree(session["user_data_dir"], ignore_errors=True)
+
+# 전역 인스턴스
+browser_pool = BrowserPool()
+
+def get_browser_pool() -> BrowserPool:
+    """브라우저 풀 인스턴스 반환"""
+    return browser_pool
@@ -0,0 +1,146 @@
+# services/chrome_setup.py - Chrome 드라이버 생성 (RPA 스크립트와 브라우저 풀 공용)
+import os
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+# Linux 환경에서 Chrome/ChromeDriver 경로 자동 감지 (우선순위: 사용자 홈 설치 → 시스템)
+POSSIBLE_CHROME_BINS = [
+    '/usr/bin/google-chrome',                 # 시스템 설치 우선
+    '/home/allmytour/bin/google-chrome',      # 사용자 홈 래퍼/바이너리
+    '/opt/google/chrome/chrome',
+    '/snap/bin/chromium'
+]
+
+POSSIBLE_DRIVERS = [
+    '/home/allmytour/bin/chromedriver',
+    '/usr/local/bin/chromedriver',
+    '/usr/bin/chromedriver'
+]
+
+# 빠른 로딩 프로필: 리소스 유형별 차단 URL 패턴 (CDP Network.setBlockedURLs)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheet': ['*.css'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.ogg', '*.wav']
+}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36'
+
+def is_fast_profile_enabled(fast_profile):
+    return bool(fast_profile and fast_profile.get('enabled', False))
+
+def get_blocked_url_patterns(fast_profile):
+    """차단 목록 = 리소스 유형별 패턴 + block_url_patterns - allow_url_patterns"""
+    patterns = []
+    for resource_type in fast_profile.get('block_resource_types', []):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(str(resource_type).lower(), []))
+    patterns.extend(fast_profile.get('block_url_patterns', []))
+    allowed = set(fast_profile.get('allow_url_patterns', []))
+    return [p for p in dict.fromkeys(patterns) if p not in allowed]
+
+def get_disk_cache_dir(fast_profile):
+    """영구 디스크 캐시 경로 (상대 경로는 프로젝트 루트 기준)"""
+    cache_dir = fast_profile.get('disk_cache_dir')
+    if not cache_dir:
+        return None
+    if not os.path.isabs(cache_dir):
+        cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def build_chrome_options(debug_port=9222, user_data_dir=None, debugger_address=None, fast_profile=None):
+    """헤드리스 Chrome 옵션 생성 (debugger_address 지정 시 실행 중인 Chrome에 연결)"""
+    options = Options()
+
+    # 빠른 로딩 프로필: DOMContentLoaded 시점에 제어 반환 (연결 모드에도 적용되는 세션 옵션)
+    if is_fast_profile_enabled(fast_profile):
+        options.page_load_strategy = fast_profile.get('page_load_strategy', 'eager')
+
+    # 이미 떠 있는 Chrome(브라우저 풀)에 연결하는 경우 실행 플래그는 적용되지 않음
+    if debugger_address:
+        options.debugger_address = debugger_address
+        return options
+
+    # 서버 환경을 위한 헤드리스 모드 설정 (최신 크롬 권장 플래그)
+    options.add_argument('--headless=new')  # GUI 없이 실행
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-logging')
+    options.add_argument('--disable-web-security')
+    options.add_argument('--allow-running-insecure-content')
+    options.add_argument('--ignore-certificate-errors')
+    options.add_argument('--ignore-ssl-errors')
+    options.add_argument('--disable-features=VizDisplayCompositor')
+    options.add_argument(f'--remote-debugging-port={debug_port}')
+    options.add_argument('--disable-background-timer-throttling')
+    options.add_argument('--disable-backgrounding-occluded-windows')
+    options.add_argument('--disable-renderer-backgrounding')
+    if user_data_dir:
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+
+    # 빠른 로딩 프로필: 영구 디스크 캐시 + 이미지 로딩 비활성화
+    if is_fast_profile_enabled(fast_profile):
+        cache_dir = get_disk_cache_dir(fast_profile)
+        if cache_dir:
+            options.add_argument(f'--disk-cache-dir={cache_dir}')
+        if 'image' in [str(t).lower() for t in fast_profile.get('block_resource_types', [])]:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    # 지역/UA 설정 및 간단 반봇 우회 플래그
+    options.add_argument('--lang=ko-KR')
+    options.add_argument('--accept-lang=ko-KR,ko')
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    try:
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        options.add_experimental_option('useAutomationExtension', False)
+    except Exception:
+        pass
+
+    chrome_bin = next((p for p in POSSIBLE_CHROME_BINS if os.path.exists(p)), None)
+    if chrome_bin:
+        options.binary_location = chrome_bin
+        print(f"Chrome binary: {chrome_bin}")
+    else:
+        print("경고: Chrome 실행 파일을 찾지 못했습니다. PATH 의존 실행을 시도합니다.")
+
+    return options
+
+def build_chrome_service():
+    """ChromeDriver 서비스 생성 (설치 경로 자동 감지, 없으면 PATH 검색)"""
+    driver_path = next((p for p in POSSIBLE_DRIVERS if os.path.exists(p)), None)
+    if driver_path:
+        print(f"ChromeDriver: {driver_path}")
+        return Service(driver_path)
+    print("경고: ChromeDriver 파일을 찾지 못했습니다. PATH 상의 chromedriver 사용을 시도합니다.")
+    return Service()  # PATH 검색에 위임
+
+def apply_fast_profile(driver, fast_profile):
+    """CDP로 차단 URL 패턴 적용 (이미지/폰트/CSS/추적 스크립트 등)"""
+    blocked = get_blocked_url_patterns(fast_profile)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+        print(f"빠른 로딩 프로필 적용: 차단 패턴 {len(blocked)}개, 로딩 전략 {fast_profile.get('page_load_strategy', 'eager')}")
+    except Exception as e:
+        print(f"빠른 로딩 프로필 CDP 적용 실패 (기본 로딩으로 진행): {e}")
+
+def create_chrome_driver(debug_port=9222, user_data_dir=None, debugger_address=None, fast_profile=None):
+    """헤드리스 Chrome 드라이버를 생성합니다. (워커별로 디버깅 포트 분리)"""
+    options = build_chrome_options(debug_port, user_data_dir, debugger_address, fast_profile)
+    service = build_chrome_service()
+    if debugger_address:
+        print(f"실행 중인 Chrome 연결: {debugger_address}")
+    else:
+        print("독립 실행 모드: 헤드리스 모드")
+
+    # 헤드리스 모드에서는 창 크기 설정이 옵션에서 처리됨
+    driver = webdriver.Chrome(service=service, options=options)
+    if is_fast_profile_enabled(fast_profile):
+        apply_fast_profile(driver, fast_profile)
+    return driver
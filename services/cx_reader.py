@@ -0,0 +1,268 @@
+# services/cx_reader.py - CX 리스트 파일 읽기 (필요한 컬럼만, 청크 단위 스트리밍)
+import codecs
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from .cx_snapshot import load_snapshot, write_snapshot
+
+# CX 리스트 컬럼 → 처리 데이터 키
+CX_COLUMNS = {
+    'NO': 'no',
+    '요청날짜': 'request_date',
+    '담당자': 'manager',
+    '주문번호': 'order_number',
+    '고객명': 'customer_name',
+    '요청분류': 'request_category',
+    '요청사유': 'request_reason',
+    '요청사항': 'request_content'
+}
+
+# 파일 검증 시 반드시 있어야 하는 컬럼
+REQUIRED_COLUMNS = ['주문번호', '고객명', '요청분류', '요청사유', '요청사항', '담당자']
+
+# 한 번에 메모리에 올리는 행 수
+DEFAULT_CHUNK_SIZE = 1000
+
+# 요청날짜 해석 형식 (순서대로 시도)
+DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y']
+
+# CX 툴이 요청사유/요청사항 앞에 붙이는 파일명 접두어 (읽을 때 제거)
+CX_FILE_PREFIX = 'cx_list.xlsx_'
+PREFIXED_KEYS = ('request_reason', 'request_content')
+
+# openpyxl 읽기 전용 모드로 스트리밍할 수 있는 형식
+STREAMING_EXTENSIONS = ('.xlsx', '.xlsm')
+
+# CSV 형식 (시트 구분 없음)
+CSV_EXTENSIONS = ('.csv',)
+
+# CSV 인코딩 후보: BOM이 있으면 utf-8-sig, UTF-8로 전부 해석되면 utf-8, 아니면 cp949 (한글 Windows Excel 저장 형식)
+CSV_FALLBACK_ENCODING = 'cp949'
+
+# CSV에서 숫자로 읽는 컬럼 (나머지는 문자열 그대로 유지: 주문번호 앞자리 0, 날짜 형식 등 보존)
+CSV_NUMERIC_COLUMNS = ('NO',)
+
+class CXSheetError(ValueError):
+    """CX 리스트 형식 오류 (시트/필수 컬럼 없음)"""
+
+def _select_columns(header: List, columns: List[str], required: List[str]) -> Dict[str, int]:
+    """헤더에서 읽을 컬럼 위치 찾기 (필수 컬럼이 없으면 CXSheetError)"""
+    header = [str(name) if name is not None else "" for name in header]
+    missing = [name for name in required if name not in header]
+    if missing:
+        raise CXSheetError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return {name: header.index(name) for name in columns if name in header}
+
+def _make_frame(rows: List[list], names: List[str], row_numbers: List[int]) -> pd.DataFrame:
+    """셀 값을 그대로 유지한 청크 (빈 칸이 있어도 정수 주문번호가 float64로 바뀌지 않도록 object 컬럼 사용)"""
+    return pd.DataFrame(rows, columns=names, index=row_numbers, dtype=object)
+
+def _iter_xlsx_frames(path: Path, sheet_name: str, columns: List[str], required: List[str],
+                      chunk_size: int, start_row: int, end_row: Optional[int]) -> Iterator[pd.DataFrame]:
+    """openpyxl 읽기 전용 모드로 필요한 컬럼만 행 단위로 읽어 chunk_size행씩 반환 (인덱스 = 엑셀 행 번호)"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(str(path), read_only=True, data_only=True)
+    try:
+        if sheet_name not in workbook.sheetnames:
+            raise CXSheetError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        sheet = workbook[sheet_name]
+        # 내보내기 도구가 기록한 <dimension> 값이 실제보다 작으면 그 뒤 행이 누락되므로 무시하고 끝까지 읽음
+        sheet.reset_dimensions()
+        header = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        positions = _select_columns(list(header), columns, required)
+        names = list(positions)
+        max_col = max(positions.values()) + 1 if positions else 1
+
+        chunk, row_numbers = [], []
+        rows = sheet.iter_rows(min_row=start_row, max_row=end_row, max_col=max_col, values_only=True)
+        for row_number, values in enumerate(rows, start=start_row):
+            if not any(value is not None for value in values):
+                continue
+            chunk.append([values[positions[name]] if positions[name] < len(values) else None for name in names])
+            row_numbers.append(row_number)
+            if len(chunk) >= chunk_size:
+                yield _make_frame(chunk, names, row_numbers)
+                chunk, row_numbers = [], []
+        if chunk:
+            yield _make_frame(chunk, names, row_numbers)
+    finally:
+        workbook.close()
+
+def _iter_pandas_frames(path: Path, sheet_name: str, columns: List[str], required: List[str],
+                        chunk_size: int, start_row: int, end_row: Optional[int]) -> Iterator[pd.DataFrame]:
+    """스트리밍 미지원 형식(.xls): 필요한 컬럼/행 범위만 읽은 뒤 chunk_size행씩 반환 (인덱스 = 엑셀 행 번호)"""
+    header = list(pd.read_excel(path, sheet_name=sheet_name, nrows=0).columns)
+    names = list(_select_columns(header, columns, required))
+    df = pd.read_excel(
+        path, sheet_name=sheet_name, usecols=lambda name: name in names,
+        skiprows=range(1, start_row - 1), nrows=(end_row - start_row + 1) if end_row else None
+    )
+    df.index = df.index + start_row
+    df = df.dropna(how='all')
+    for offset in range(0, len(df), chunk_size):
+        yield df.iloc[offset:offset + chunk_size]
+
+def detect_csv_encoding(path, block_size: int = 1024 * 1024) -> str:
+    """CSV 파일 인코딩 판별 (utf-8-sig / utf-8 / cp949)"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        block = f.read(block_size)
+        if block.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        try:
+            while block:
+                decoder.decode(block)
+                block = f.read(block_size)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return CSV_FALLBACK_ENCODING
+    return 'utf-8'
+
+def _iter_csv_frames(path: Path, sheet_name: str, columns: List[str], required: List[str],
+                     chunk_size: int, start_row: int, end_row: Optional[int]) -> Iterator[pd.DataFrame]:
+    """CSV: 인코딩을 판별해 필요한 컬럼/행 범위만 chunk_size행씩 파싱 (인덱스 = 파일 행 번호, sheet_name은 무시)"""
+    encoding = detect_csv_encoding(path)
+    header = list(pd.read_csv(path, encoding=encoding, nrows=0).columns)
+    names = list(_select_columns(header, columns, required))
+    text_names = [name for name in names if name not in CSV_NUMERIC_COLUMNS]
+    reader = pd.read_csv(
+        path, encoding=encoding, usecols=lambda name: name in names, dtype={name: str for name in text_names},
+        skiprows=range(1, start_row - 1), nrows=(end_row - start_row + 1) if end_row else None,
+        skip_blank_lines=False, chunksize=chunk_size
+    )
+    with reader:
+        for df in reader:
+            # 빈 줄도 행 번호에 포함되도록 읽은 뒤 제외
+            df.index = df.index + start_row
+            df = df.dropna(how='all')
+            if not df.empty:
+                # 빈 칸은 엑셀 읽기와 같이 None으로 통일
+                df = df[names]
+                df[text_names] = df[text_names].astype(object).where(df[text_names].notna(), None)
+                yield df
+
+def _iter_snapshot_frames(df: pd.DataFrame, columns: List[str], required: List[str],
+                          chunk_size: int, start_row: int, end_row: Optional[int]) -> Iterator[pd.DataFrame]:
+    """스냅샷에서 복원한 DataFrame을 원본과 같은 컬럼/행 범위로 잘라 chunk_size행씩 반환"""
+    names = list(_select_columns(list(df.columns), columns, required))
+    rows = (df.index >= start_row) & ((df.index <= end_row) if end_row is not None else True)
+    df = df.loc[rows, names]
+    for offset in range(0, len(df), chunk_size):
+        yield df.iloc[offset:offset + chunk_size]
+
+def iter_cx_frames(path, sheet_name: str = "list", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   start_row: Optional[int] = None, end_row: Optional[int] = None,
+                   columns: Optional[List[str]] = None, required: Optional[List[str]] = None,
+                   use_snapshot: bool = True) -> Iterator[pd.DataFrame]:
+    """CX 리스트를 필요한 컬럼만 chunk_size행 단위 DataFrame으로 읽기 (인덱스 = 엑셀 행 번호)
+    start_row/end_row: 엑셀(CSV는 파일) 행 번호 (1행은 헤더, 데이터는 2행부터), columns: 읽을 컬럼 (기본: CX_COLUMNS)
+    .xlsx/.xlsm은 읽기 전용 스트리밍, .csv는 인코딩 자동 판별 후 청크 파싱, 그 외(.xls)는 pandas로 읽음
+    원본과 일치하는 스냅샷이 있으면 원본 대신 스냅샷에서 읽음"""
+    path = Path(path)
+    columns = list(columns or CX_COLUMNS)
+    required = list(REQUIRED_COLUMNS if required is None else required)
+    start_row = max(2, int(start_row or 2))
+    if end_row is not None and int(end_row) < start_row:
+        return
+    chunk_size = max(1, int(chunk_size))
+    end_row = int(end_row) if end_row is not None else None
+
+    snapshot = load_snapshot(path, sheet_name) if use_snapshot else None
+    if snapshot is not None:
+        yield from _iter_snapshot_frames(snapshot, columns, required, chunk_size, start_row, end_row)
+        return
+    suffix = path.suffix.lower()
+    if suffix in CSV_EXTENSIONS:
+        reader = _iter_csv_frames
+    elif suffix in STREAMING_EXTENSIONS:
+        reader = _iter_xlsx_frames
+    else:
+        reader = _iter_pandas_frames
+    yield from reader(path, sheet_name, columns, required, chunk_size, start_row, end_row)
+
+def read_cx_frame(path, sheet_name: str = "list", nrows: Optional[int] = None, **options) -> pd.DataFrame:
+    """CX 리스트를 하나의 DataFrame으로 읽기 (nrows 지정 시 앞쪽 N행만 읽고 나머지는 건드리지 않음)"""
+    end_row = options.pop('end_row', None)
+    if nrows is not None:
+        end_row = max(2, int(options.get('start_row') or 2)) + int(nrows) - 1
+    frames = list(iter_cx_frames(path, sheet_name, end_row=end_row, **options))
+    if not frames:
+        columns = list(options.get('columns') or CX_COLUMNS)
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+def build_cx_snapshot(path, sheet_name: str = "list") -> Dict:
+    """원본을 한 번 읽어 CX 리스트 컬럼 전체를 스냅샷으로 저장 (이후 읽기는 스냅샷 사용), 메타 정보 반환"""
+    df = read_cx_frame(path, sheet_name, required=[], use_snapshot=False)
+    return write_snapshot(path, df, sheet_name)
+
+def normalize_request_dates(values: pd.Series) -> pd.Series:
+    """요청날짜 컬럼을 YYYY-MM-DD 문자열로 일괄 변환 (날짜 객체 또는 DATE_FORMATS 형식 문자열, 해석 불가 값은 원래 문자열 유지)"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime('%Y-%m-%d').fillna("")
+
+    result = pd.Series("", index=values.index, dtype=object)
+    remaining = values.notna() & (values.astype(str) != "")
+    for fmt in DATE_FORMATS:
+        if not remaining.any():
+            break
+        # 날짜 객체는 형식과 무관하게 첫 번째 시도에서 변환됨
+        parsed = pd.to_datetime(values.where(remaining), format=fmt, errors='coerce')
+        matched = remaining & parsed.notna()
+        result[matched] = parsed[matched].dt.strftime('%Y-%m-%d')
+        remaining &= ~matched
+    result[remaining] = values[remaining].astype(str)
+    return result
+
+def _integral_floats_to_int(values: pd.Series) -> pd.Series:
+    """정수 값인 실수(366543.0)를 정수로 변환 (빈 칸이 섞여 float64로 읽힌 숫자 컬럼도 "366543"이 되도록)"""
+    if pd.api.types.is_float_dtype(values):
+        integral = values.notna() & (values % 1 == 0)
+    elif values.dtype == object:
+        integral = values.map(lambda value: isinstance(value, float) and value.is_integer())
+    else:
+        return values.astype(object)
+    values = values.astype(object)
+    if integral.any():
+        values[integral] = values[integral].map(int)
+    return values
+
+def _to_text(values: pd.Series) -> pd.Series:
+    """빈 값은 "", 나머지는 앞뒤 공백을 제거한 문자열로 변환"""
+    values = values.astype(object)
+    return values.where(values.notna(), "").astype(str).str.strip()
+
+def normalize_cx_frame(df: pd.DataFrame) -> List[Dict]:
+    """DataFrame 청크를 처리 데이터(dict) 목록으로 변환 (컬럼 단위 일괄 처리, 주문번호가 없는 행 제외)"""
+    order_numbers = _to_text(_integral_floats_to_int(df['주문번호']))
+    valid = (order_numbers != "") & (order_numbers != 'nan')
+    if not valid.any():
+        return []
+    df = df[valid]
+
+    columns = {}
+    for column, key in CX_COLUMNS.items():
+        if key == 'order_number':
+            values = order_numbers[valid]
+        elif key == 'request_date':
+            values = normalize_request_dates(df[column])
+        elif key == 'no':
+            values = _integral_floats_to_int(df[column])
+            values = values.where(values.notna(), "")
+        else:
+            values = _to_text(df[column])
+            if key in PREFIXED_KEYS:
+                values = values.str.replace(CX_FILE_PREFIX, "", regex=False)
+        columns[key] = values.tolist()
+
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+def iter_cx_records(path, sheet_name: str = "list", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    start_row: Optional[int] = None, end_row: Optional[int] = None) -> Iterator[List[Dict]]:
+    """검증된 처리 데이터(dict)를 청크 단위로 반환 (CX_COLUMNS 전체 필요)"""
+    for df in iter_cx_frames(path, sheet_name, chunk_size, start_row, end_row, required=list(CX_COLUMNS)):
+        yield normalize_cx_frame(df)
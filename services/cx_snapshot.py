@@ -0,0 +1,145 @@
+# services/cx_snapshot.py - 업로드된 CX 리스트의 컬럼 단위 스냅샷 (NumPy .npz, 원본 파일 옆에 저장)
+import os
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# 원본 파일명 뒤에 붙는 스냅샷 확장자 (예: cx_list_20240101_120000.xlsx.snapshot.npz)
+SNAPSHOT_SUFFIX = '.snapshot.npz'
+
+# 저장 형식이 바뀌면 올려서 이전 스냅샷을 무시
+SNAPSHOT_VERSION = 2
+
+# 숫자/빈 칸이 섞인 object 컬럼의 값 종류 (number 컬럼)
+NUMBER_MISSING, NUMBER_INT, NUMBER_FLOAT = 0, 1, 2
+
+# 텍스트 컬럼을 하나의 UTF-8 바이트열로 이을 때 쓰는 구분자 (엑셀 셀에는 들어갈 수 없는 문자)
+TEXT_SEPARATOR = '\x00'
+
+def snapshot_path(source_path) -> Path:
+    """원본 파일에 대응하는 스냅샷 경로"""
+    source_path = Path(source_path)
+    return source_path.with_name(source_path.name + SNAPSHOT_SUFFIX)
+
+def schema_fingerprint(columns) -> str:
+    """컬럼 이름/종류 목록의 지문 (같은 구조의 파일이면 같은 값)"""
+    payload = json.dumps([[column['name'], column['kind']] for column in columns], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def _source_stat(source_path: Path) -> Dict:
+    stat = source_path.stat()
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+def _is_fresh(meta: Dict, source_path: Path) -> bool:
+    """스냅샷이 현재 형식이고 원본 파일이 그 뒤로 바뀌지 않았는지"""
+    stat = _source_stat(source_path)
+    return meta.get("version") == SNAPSHOT_VERSION and all(meta.get(key) == value for key, value in stat.items())
+
+def _encode_column(values: pd.Series):
+    """컬럼 하나를 (종류, 배열 목록)으로 변환: datetime/numeric은 그대로,
+    셀 값이 정수/실수뿐인 object 컬럼은 값 종류를 함께 저장(정수 주문번호 유지), 나머지는 텍스트 + 빈 값 마스크"""
+    inferred = pd.api.types.infer_dtype(values, skipna=True) if values.dtype == object else None
+    if inferred in ('datetime', 'datetime64', 'date'):
+        values = pd.to_datetime(values, errors='coerce')
+    elif inferred in ('integer', 'floating', 'mixed-integer-float'):
+        missing = values.isna().to_numpy()
+        is_int = values.map(lambda value: isinstance(value, (int, np.integer)) and not isinstance(value, bool)).to_numpy()
+        kinds = np.where(missing, NUMBER_MISSING, np.where(is_int, NUMBER_INT, NUMBER_FLOAT)).astype(np.uint8)
+        ints = np.array([value if kind == NUMBER_INT else 0 for value, kind in zip(values.tolist(), kinds)], dtype=np.int64)
+        floats = np.array([value if kind == NUMBER_FLOAT else 0.0 for value, kind in zip(values.tolist(), kinds)], dtype=np.float64)
+        return 'number', [kinds, ints, floats]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return 'datetime', [values.to_numpy(dtype='datetime64[ns]')]
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return 'numeric', [values.to_numpy()]
+
+    missing = values.isna().to_numpy()
+    # 문자열과 섞인 정수 값 실수(366543.0)는 원본 정규화 결과와 같도록 정수 문자열로 저장
+    values = values.astype(object).map(lambda value: int(value) if isinstance(value, float) and value.is_integer() else value)
+    texts = values.where(~missing, "").astype(str).str.replace(TEXT_SEPARATOR, "", regex=False)
+    blob = np.frombuffer(TEXT_SEPARATOR.join(texts.tolist()).encode('utf-8'), dtype=np.uint8)
+    return 'text', [blob, missing]
+
+def _decode_column(kind: str, arrays, rows: int) -> np.ndarray:
+    if kind == 'number':
+        kinds, ints, floats = arrays
+        values = np.full(rows, None, dtype=object)
+        for code, source in ((NUMBER_INT, ints), (NUMBER_FLOAT, floats)):
+            positions = np.flatnonzero(kinds == code)
+            values[positions] = source[positions].tolist()
+        return values
+    if kind != 'text':
+        return arrays[0]
+    blob, missing = arrays
+    values = np.array(blob.tobytes().decode('utf-8').split(TEXT_SEPARATOR) if rows else [], dtype=object)
+    values[missing] = None
+    return values
+
+def write_snapshot(source_path, df: pd.DataFrame, sheet_name: str) -> Dict:
+    """DataFrame(인덱스 = 엑셀 행 번호)을 원본 옆 스냅샷으로 저장하고 메타 정보 반환"""
+    source_path = Path(source_path)
+    arrays = {'rows': df.index.to_numpy(dtype='int64')}
+    columns = []
+    for position, name in enumerate(df.columns):
+        kind, encoded = _encode_column(df[name])
+        for part, array in enumerate(encoded):
+            arrays[f'c{position}_{part}'] = array
+        columns.append({"name": str(name), "kind": kind})
+
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "sheet_name": sheet_name,
+        "rows": len(df),
+        "columns": columns,
+        "fingerprint": schema_fingerprint(columns),
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+        **_source_stat(source_path)
+    }
+    arrays['meta'] = np.array(json.dumps(meta, ensure_ascii=False))
+
+    target = snapshot_path(source_path)
+    temp = target.with_name(target.name + '.tmp')
+    with open(temp, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temp, target)
+    return meta
+
+def read_snapshot_meta(source_path) -> Optional[Dict]:
+    """원본과 일치하는 스냅샷의 메타 정보 (없거나 원본이 바뀌었으면 None)"""
+    source_path = Path(source_path)
+    target = snapshot_path(source_path)
+    if not target.exists() or not source_path.exists():
+        return None
+    try:
+        with np.load(target, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+    except Exception:
+        return None
+    return meta if _is_fresh(meta, source_path) else None
+
+def load_snapshot(source_path, sheet_name: str) -> Optional[pd.DataFrame]:
+    """스냅샷에서 DataFrame 복원 (인덱스 = 엑셀 행 번호). 없거나 오래된/다른 시트의 스냅샷이면 None"""
+    source_path = Path(source_path)
+    target = snapshot_path(source_path)
+    if not target.exists() or not source_path.exists():
+        return None
+    try:
+        with np.load(target, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get("sheet_name") != sheet_name or not _is_fresh(meta, source_path):
+                return None
+            index = data['rows']
+            parts = {}
+            for position, column in enumerate(meta["columns"]):
+                count = {'text': 2, 'number': 3}.get(column["kind"], 1)
+                arrays = [data[f'c{position}_{part}'] for part in range(count)]
+                parts[column["name"]] = _decode_column(column["kind"], arrays, meta["rows"])
+    except Exception as e:
+        print(f"스냅샷 읽기 실패 (원본 파일 사용): {e}")
+        return None
+    return pd.DataFrame(parts, index=pd.Index(index), columns=[column["name"] for column in meta["columns"]])
@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from .template_engine import TEMPLATE_VARIABLES, TemplateError, compile_template, extract_variables
+
 class EmailManager:
     def __init__(self):
         self.config_path = Path(__file__).parent.parent / "cx_claim_config.json"
@@ -66,9 +68,9 @@ class EmailManager:
         try:
             from .excel_manager import ExcelManager
             
-            # Excel 데이터 가져오기
+            # Excel 첫 번째 데이터 행만 읽기
             excel_manager = ExcelManager()
-            excel_df = excel_manager.read_excel_data()
+            excel_df = excel_manager.read_excel_rows(1, 1)
             
             if excel_df is None or excel_df.empty:
                 return {
@@ -105,15 +107,19 @@ class EmailManager:
             subject_template = template_data.get('subject_template') or templates.get('subject_template', '')
             body_template = template_data.get('body_template') or templates.get('body_template', '')
             
-            # 제목 생성
-            preview_subject = subject_template
-            for key, value in sample_data.items():
-                preview_subject = preview_subject.replace(f'{{{key}}}', str(value))
+            # 템플릿 컴파일 (형식 오류/알 수 없는 변수 검사)
+            try:
+                compiled_subject = compile_template(subject_template)
+                compiled_body = compile_template(body_template)
+            except TemplateError as e:
+                return {
+                    "success": False,
+                    "error": f"템플릿 오류: {e}"
+                }
             
-            # 본문 생성
-            preview_body = body_template
-            for key, value in sample_data.items():
-                preview_body = preview_body.replace(f'{{{key}}}', str(value))
+            # 제목/본문 생성
+            preview_subject = compiled_subject.render(sample_data)
+            preview_body = compiled_body.render(sample_data)
             
             return {
                 "success": True,
@@ -137,48 +143,37 @@ class EmailManager:
             subject_template = templates.get('subject_template', '')
             body_template = templates.get('body_template', '')
             
-            # 템플릿에서 변수 추출
-            import re
-            variables = set()
-            
-            # {변수명} 패턴 찾기
-            pattern = r'\{([^}]+)\}'
-            variables.update(re.findall(pattern, subject_template))
-            variables.update(re.findall(pattern, body_template))
-            
-            # 변수 설명 매핑
-            variable_descriptions = {
-                '체크인': '체크인 날짜 (YYYY-MM-DD)',
-                '체크아웃': '체크아웃 날짜 (YYYY-MM-DD)',
-                '숙소': '숙소명',
-                '투숙자': '투숙자명',
-                'Book NO': '예약 컨펌번호',
-                '요청날짜': '클레임 요청 날짜',
-                '담당자': '담당자명',
-                '요청분류': '요청 분류',
-                '투숙자명': '투숙자명 (투숙자와 동일)',
-                '투숙자 연락처': '투숙자 연락처',
-                '박수': '박수 (예: 2박)',
-                '객실수': '객실 수',
-                '객실명': '객실명',
-                '상품명': '상품명',
-                '요청사유': '요청 사유',
-                '요청사항': '요청 사항'
-            }
+            # 템플릿에서 변수 추출 (저장된 템플릿에 알 수 없는 변수가 있어도 목록은 반환)
+            variables = set(extract_variables(subject_template))
+            variables.update(extract_variables(body_template))
             
             variable_list = []
             for var in sorted(variables):
                 variable_list.append({
                     "name": var,
-                    "description": variable_descriptions.get(var, "설명 없음"),
+                    "description": TEMPLATE_VARIABLES.get(var, "설명 없음"),
                     "example": self.get_variable_example(var)
                 })
             
-            return {
+            result = {
                 "success": True,
                 "variables": variable_list
             }
             
+            # 형식 오류/알 수 없는 변수는 경고로 함께 전달 (실행 전 템플릿 검증에서는 오류)
+            unknown_variables = [var for var in sorted(variables) if var not in TEMPLATE_VARIABLES]
+            warnings = []
+            for template in (subject_template, body_template):
+                try:
+                    compile_template(template)
+                except TemplateError as e:
+                    if str(e) not in warnings:
+                        warnings.append(str(e))
+            if unknown_variables or warnings:
+                result["unknown_variables"] = unknown_variables
+                result["warning"] = " / ".join(warnings)
+            return result
+            
         except Exception as e:
             return {
                 "success": False,
@@ -217,9 +212,14 @@ class EmailManager:
                     "message": "템플릿이 비어있습니다."
                 }
             
-            # 변수 형식 검사
-            import re
-            variables = re.findall(r'\{([^}]+)\}', template_text)
+            # 변수 형식/중괄호 짝/알 수 없는 변수 검사
+            try:
+                variables = compile_template(template_text).placeholders
+            except TemplateError as e:
+                return {
+                    "valid": False,
+                    "message": str(e)
+                }
             
             if not variables:
                 return {
@@ -227,16 +227,6 @@ class EmailManager:
                     "message": "템플릿이 유효합니다. (변수 없음)"
                 }
             
-            # 중괄호 짝 검사
-            open_count = template_text.count('{')
-            close_count = template_text.count('}')
-            
-            if open_count != close_count:
-                return {
-                    "valid": False,
-                    "message": "중괄호가 올바르지 않습니다."
-                }
-            
             return {
                 "valid": True,
                 "message": f"템플릿이 유효합니다. ({len(variables)}개 변수 사용)",
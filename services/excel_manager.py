@@ -1,10 +1,73 @@
 # services/excel_manager.py - Excel 데이터 관리
 import pandas as pd
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 import json
 
+from .cx_reader import read_cx_frame
+from .cx_snapshot import read_snapshot_meta
+
+# 파싱된 워크북 캐시 최대 개수 (파일/시트 단위)
+WORKBOOK_CACHE_SIZE = 4
+
+class WorkbookCache:
+    """파싱한 DataFrame을 (경로, 수정 시각, 크기, 시트) 기준으로 보관하는 프로세스 공용 LRU 캐시
+    파일 내용이 바뀌면 수정 시각/크기가 달라져 자동으로 다시 파싱합니다."""
+
+    def __init__(self, max_entries=WORKBOOK_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _make_key(self, path, sheet_name):
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return (str(resolved), stat.st_mtime_ns, stat.st_size, sheet_name)
+
+    def get(self, path, sheet_name, loader):
+        """캐시된 DataFrame 반환, 없으면 loader(path, sheet_name)로 파싱 후 저장
+        반환된 DataFrame은 다른 호출과 공유되므로 수정하지 말 것"""
+        key = self._make_key(path, sheet_name)
+        with self._lock:
+            df = self._entries.get(key)
+            if df is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return df
+            self.misses += 1
+
+        df = loader(path, sheet_name)
+        with self._lock:
+            # 같은 파일의 이전 버전은 제거
+            for stale in [k for k in self._entries if k[0] == key[0] and k[3] == sheet_name]:
+                del self._entries[stale]
+            self._entries[key] = df
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return df
+
+    def invalidate(self, path=None):
+        """캐시 비우기 (path 지정 시 해당 파일만)"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            resolved = str(Path(path).resolve())
+            for key in [k for k in self._entries if k[0] == resolved]:
+                del self._entries[key]
+
+# 전역 인스턴스
+workbook_cache = WorkbookCache()
+
+def get_workbook_cache() -> WorkbookCache:
+    """워크북 캐시 인스턴스 반환"""
+    return workbook_cache
+
 class ExcelManager:
     def __init__(self):
         self.config_path = Path(__file__).parent.parent / "cx_claim_config.json"
@@ -57,15 +120,35 @@ class ExcelManager:
         return Path(excel_path)
     
     def read_excel_data(self, sheet_name="list"):
-        """Excel 파일에서 데이터 읽기"""
+        """Excel 파일에서 데이터 읽기 (변경되지 않은 파일은 캐시된 결과 재사용, 반환값은 수정하지 말 것)"""
         try:
             excel_path = self.get_excel_file_path()
             
             if not excel_path.exists():
                 raise FileNotFoundError(f"Excel 파일을 찾을 수 없습니다: {excel_path}")
             
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
-            return df
+            return workbook_cache.get(excel_path, sheet_name, self._parse_excel)
+            
+        except Exception as e:
+            print(f"Excel 파일 읽기 실패: {e}")
+            return None
+    
+    def _parse_excel(self, excel_path, sheet_name):
+        # CX 리스트 컬럼만 읽기 전용 스트리밍으로 읽음 (필수 컬럼 검사는 validate_excel_file에서)
+        return read_cx_frame(excel_path, sheet_name, required=[])
+    
+    def read_excel_rows(self, start_row=1, end_row=None, sheet_name="list"):
+        """데이터 start_row~end_row행만 읽기 (1부터 시작, 헤더 제외). 나머지 행은 읽지 않음"""
+        try:
+            excel_path = self.get_excel_file_path()
+            
+            if not excel_path.exists():
+                raise FileNotFoundError(f"Excel 파일을 찾을 수 없습니다: {excel_path}")
+            
+            return read_cx_frame(
+                excel_path, sheet_name, required=[],
+                start_row=max(1, start_row) + 1, end_row=end_row + 1 if end_row is not None else None
+            )
             
         except Exception as e:
             print(f"Excel 파일 읽기 실패: {e}")
@@ -91,10 +174,12 @@ class ExcelManager:
             # 오늘 처리 대상 수 (요청날짜가 오늘인 것)
             today = datetime.now().strftime('%Y-%m-%d')
             today_count = 0
+            request_dates = None
             if '요청날짜' in df.columns:
                 try:
-                    df['요청날짜'] = pd.to_datetime(df['요청날짜']).dt.strftime('%Y-%m-%d')
-                    today_count = len(df[df['요청날짜'] == today])
+                    # 캐시된 DataFrame은 그대로 두고 변환 결과만 사용
+                    request_dates = pd.to_datetime(df['요청날짜']).dt.strftime('%Y-%m-%d')
+                    today_count = int((request_dates == today).sum())
                 except:
                     today_count = 0
             
@@ -112,7 +197,9 @@ class ExcelManager:
             
             # 샘플 데이터 (최대 limit개)
             sample_data = []
-            sample_df = df.head(limit)
+            sample_df = df.head(limit).copy()
+            if request_dates is not None:
+                sample_df['요청날짜'] = request_dates.head(limit)
             
             for index, row in sample_df.iterrows():
                 sample_data.append({
@@ -149,17 +236,12 @@ class ExcelManager:
     def get_test_mode_data(self, start_row=2, end_row=5):
         """테스트 모드 데이터 반환"""
         try:
-            df = self.read_excel_data()
+            # 테스트 모드 범위의 행만 읽음 (행 번호는 1부터 시작)
+            test_df = self.read_excel_rows(start_row, end_row)
             
-            if df is None or df.empty:
+            if test_df is None or test_df.empty:
                 return []
             
-            # 테스트 모드 적용 (행 번호는 1부터 시작하므로 -1)
-            start_idx = max(0, start_row - 1)
-            end_idx = min(len(df), end_row)
-            
-            test_df = df.iloc[start_idx:end_idx]
-            
             test_data = []
             for index, row in test_df.iterrows():
                 test_data.append({
@@ -215,11 +297,13 @@ class ExcelManager:
                     "message": "처리할 데이터가 없습니다."
                 }
             
+            snapshot_meta = read_snapshot_meta(excel_path)
             return {
                 "valid": True,
                 "message": f"Excel 파일이 유효합니다. (총 {len(df)}개 행)",
                 "row_count": len(df),
-                "columns": list(df.columns)
+                "columns": list(df.columns),
+                "schema_fingerprint": snapshot_meta["fingerprint"] if snapshot_meta else None
             }
             
         except Exception as e:
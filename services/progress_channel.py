@@ -0,0 +1,143 @@
+# services/progress_channel.py - RPA 실시간 진행 상황 채널 (로컬 TCP 소켓, JSON 한 줄씩)
+import json
+import time
+import socket
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+# 처리 속도(이동 평균) 계산에 사용하는 최근 완료 건수
+RATE_WINDOW = 20
+
+class ProgressReporter:
+    """RPA 쪽: 전체/완료/실패 건수와 현재 주문/단계를 실행기에 전송 (연결 실패 시 전송만 생략)"""
+
+    def __init__(self, address: Optional[str]):
+        self._sock = None
+        self._lock = threading.Lock()
+        self.state = {"total": 0, "done": 0, "failed": 0, "current_order": None, "stage": "starting"}
+        if address:
+            try:
+                host, port = address.rsplit(':', 1)
+                self._sock = socket.create_connection((host, int(port)), timeout=5)
+            except Exception as e:
+                print(f"진행 상황 채널 연결 실패 (전송 생략): {e}")
+                self._sock = None
+
+    def update(self, **fields):
+        """상태 갱신 후 전송 (total, stage, current_order 등)"""
+        with self._lock:
+            self.state.update(fields)
+            self._send()
+
+    def record(self, success: bool):
+        """주문(행) 1건의 최종 결과 반영"""
+        with self._lock:
+            self.state["done"] += 1
+            if not success:
+                self.state["failed"] += 1
+            self._send()
+
+    def _send(self):
+        if self._sock is None:
+            return
+        message = dict(self.state, timestamp=time.time())
+        try:
+            self._sock.sendall((json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8'))
+        except OSError:
+            # 실행기가 연결을 닫은 경우 이후 전송 생략
+            self.close_socket()
+
+    def close_socket(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def close(self):
+        with self._lock:
+            self.close_socket()
+
+class ProgressListener:
+    """실행기 쪽: RPA 프로세스의 진행 상황을 받아 최신 상태와 예상 종료 시각을 제공"""
+
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self.state: Dict = {"total": 0, "done": 0, "failed": 0, "current_order": None, "stage": "waiting"}
+        self.updated_at: Optional[datetime] = None
+        self._completions = deque(maxlen=RATE_WINDOW + 1)
+
+    def start(self) -> str:
+        """수신 소켓을 열고 RPA에 넘길 주소(host:port) 반환"""
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        threading.Thread(target=self._accept, daemon=True).start()
+        host, port = self._server.getsockname()
+        return f"{host}:{port}"
+
+    def _accept(self):
+        try:
+            connection, _ = self._server.accept()
+        except OSError:
+            return
+        with connection, connection.makefile('r', encoding='utf-8', errors='replace') as stream:
+            for line in stream:
+                try:
+                    self._apply(json.loads(line))
+                except ValueError:
+                    continue
+                if self._closed.is_set():
+                    break
+
+    def _apply(self, message: Dict):
+        now = time.monotonic()
+        with self._lock:
+            # 처리 시작(전체 건수 확정) 시점을 기준점으로, 이후 완료 건수가 늘 때마다 기록
+            if (message.get("total") and not self._completions) or message.get("done", 0) > self.state.get("done", 0):
+                self._completions.append((now, message.get("done", 0)))
+            self.state = {key: message.get(key) for key in ("total", "done", "failed", "current_order", "stage")}
+            self.updated_at = datetime.now()
+
+    def rate_per_second(self) -> float:
+        """최근 완료 건수 기준 이동 평균 처리 속도 (건/초)"""
+        with self._lock:
+            samples = list(self._completions)
+        if len(samples) < 2:
+            return 0.0
+        (first_time, first_done), (last_time, last_done) = samples[0], samples[-1]
+        elapsed = last_time - first_time
+        return (last_done - first_done) / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict:
+        """현재 진행 상황 (진행률, 처리 속도, 예상 남은 시간/종료 시각 포함)"""
+        with self._lock:
+            state = dict(self.state)
+            updated_at = self.updated_at
+        total = state.get("total") or 0
+        done = state.get("done") or 0
+        rate = self.rate_per_second()
+        remaining = max(0, total - done)
+        eta_seconds = remaining / rate if rate > 0 and remaining else (0 if total and not remaining else None)
+        state.update({
+            "percent": round(done / total * 100, 1) if total else 0,
+            "rate_per_minute": round(rate * 60, 2),
+            "eta_seconds": round(eta_seconds) if eta_seconds is not None else None,
+            "eta": (datetime.now() + timedelta(seconds=eta_seconds)).isoformat(timespec='seconds') if eta_seconds is not None else None,
+            "updated_at": updated_at.isoformat(timespec='seconds') if updated_at else None
+        })
+        return state
+
+    def close(self):
+        self._closed.set()
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
@@ -4,6 +4,7 @@ import json
 import uuid
 import time
 import threading
+import shutil
 import subprocess
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -12,6 +13,9 @@ from pathlib import Path
 # 서비스 매니저들 import
 from .email_manager import EmailManager
 from .excel_manager import ExcelManager
+from .browser_pool import get_browser_pool
+from .progress_channel import ProgressListener
+from .run_log import RunLogCapture
 
 class CXClaimExecutor:
     """CX 클레임처리 프로젝트 실행 관리자 v2.0"""
@@ -23,13 +27,18 @@ class CXClaimExecutor:
         self.script_path = Path(__file__).parent.parent / "cxlist_rpa_v2.1.py"
         self.config_path = Path(__file__).parent.parent / "cx_claim_config.json"
         self.temp_configs_dir = Path(__file__).parent.parent / "temp_configs"
+        self.journals_dir = Path(__file__).parent.parent / "journals"
+        self.logs_dir = Path(__file__).parent.parent / "logs"
+        # 가장 최근 실행의 출력 수집기 (/api/logs/stream)
+        self.log_capture = None
         
         # 서비스 매니저들 초기화
         self.email_manager = EmailManager()
         self.excel_manager = ExcelManager()
         
-        # temp_configs 디렉토리 생성
+        # temp_configs / journals 디렉토리 생성
         self.temp_configs_dir.mkdir(exist_ok=True)
+        self.journals_dir.mkdir(exist_ok=True)
         
         print("CX 클레임처리 실행기 v2.0 초기화 완료")
         print(f"스크립트 경로: {self.script_path}")
@@ -47,34 +56,68 @@ class CXClaimExecutor:
             
         return True
     
-    def start_project(self, config_data: Dict) -> str:
-        """프로젝트 시작"""
+    def start_project(self, config_data: Dict, resume_execution_id: Optional[str] = None, force_refresh: bool = False) -> str:
+        """프로젝트 시작 (resume_execution_id 지정 시 해당 실행의 저널을 이어서 완료된 주문은 건너뜀,
+        force_refresh 시 이번 실행만 예약 정보 캐시를 무시하고 새로 조회)"""
         if not self.can_start_project():
             raise Exception("프로젝트 시작 불가: 이미 실행 중이거나 스크립트 파일이 없습니다")
         
         try:
             execution_id = str(uuid.uuid4())
             temp_config_path = self._create_runtime_config(config_data, execution_id)
+            journal_path = self._get_journal_path(execution_id)
+            
+            # 재개 모드: 이전 실행 저널을 새 실행 저널로 복사 후 이어서 기록
+            if resume_execution_id:
+                source_journal = self._find_resume_journal(resume_execution_id)
+                if source_journal is None:
+                    raise Exception(f"재개할 실행 기록(저널)을 찾을 수 없습니다: {resume_execution_id}")
+                shutil.copyfile(source_journal, journal_path)
+                print(f"실행 재개: {source_journal.name} → {journal_path.name}")
             
             # 환경변수 설정
             env = os.environ.copy()
             env['CONFIG_FILE_PATH'] = str(temp_config_path)
+            env['JOURNAL_FILE_PATH'] = str(journal_path)
+            env['RESUME_JOURNAL'] = '1' if resume_execution_id else '0'
+            env['FORCE_REFRESH'] = '1' if force_refresh else '0'
             env['EXECUTION_MODE'] = 'web_interface'  # 웹 인터페이스에서 실행
             env['EXECUTION_ID'] = execution_id
             env['PYTHONUNBUFFERED'] = '1'  # Python 출력 버퍼링 비활성화
             env['PYTHONIOENCODING'] = 'utf-8'  # 인코딩 설정
             env['PYTHONLEGACYWINDOWSSTDIO'] = '1'  # Windows에서 인코딩 문제 해결
             
+            # 진행 상황 채널: RPA가 전체/완료/실패 건수와 현재 주문/단계를 전송
+            progress_listener = ProgressListener()
+            env['PROGRESS_ADDRESS'] = progress_listener.start()
+            
+            # 브라우저 풀: 로그인된 Chrome 세션을 빌려 실행 직후 바로 주문 처리 시작
+            browser_pool = get_browser_pool()
+            if browser_pool.is_enabled():
+                worker_count = config_data.get('worker_pool', {}).get('workers', 1)
+                addresses = browser_pool.acquire(max(1, int(worker_count)), execution_id)
+                if addresses:
+                    env['BROWSER_POOL_ADDRESSES'] = ','.join(addresses)
+            
             print(f"프로젝트 시작: CX 클레임처리")
             print(f"실행 ID: {execution_id}")
             print(f"스크립트 경로: {self.script_path}")
             print(f"임시 설정 파일: {temp_config_path}")
             
+            # 출력 수집기: 최근 N줄은 메모리, 전체는 logs/cx_claim_run_<실행ID>.log (용량 초과 시 순환)
+            run_log_config = config_data.get('run_log', {})
+            log_capture = RunLogCapture(
+                self.logs_dir / f"cx_claim_run_{execution_id}.log",
+                buffer_lines=run_log_config.get('buffer_lines', 2000),
+                max_bytes=run_log_config.get('max_bytes', 10 * 1024 * 1024),
+                backup_count=run_log_config.get('backup_count', 5)
+            )
+            
             # 프로세스 시작
             process = subprocess.Popen(
                 ["python", "-u", str(self.script_path)],  # -u 플래그로 버퍼링 비활성화
                 stdout=subprocess.PIPE,  # 출력 캡처
-                stderr=subprocess.PIPE,  # 에러 캡처
+                stderr=subprocess.STDOUT,  # 에러도 같은 스트림으로 (순서 유지)
                 text=True,
                 encoding='utf-8',  # 명시적 인코딩 설정
                 errors='replace',  # 인코딩 오류 시 대체 문자 사용
@@ -90,24 +133,28 @@ class CXClaimExecutor:
                 "process": process,
                 "start_time": datetime.now(),
                 "status": "running",
-                "config": config_data
+                "config": config_data,
+                "progress": progress_listener
             }
             
             self.running_process = execution_info
             self.current_execution_id = execution_id
+            self.log_capture = log_capture
             
             # 실행 이력에 추가
             self.execution_history.append({
                 "execution_id": execution_id,
                 "start_time": execution_info["start_time"],
                 "status": "running",
-                "config": config_data
+                "config": config_data,
+                "resumed_from": resume_execution_id,
+                "force_refresh": force_refresh
             })
             
             # 모니터링 스레드 시작
             monitor_thread = threading.Thread(
                 target=self._monitor_execution,
-                args=(execution_id, process),
+                args=(execution_id, process, log_capture),
                 daemon=False
             )
             monitor_thread.start()
@@ -117,6 +164,12 @@ class CXClaimExecutor:
             
         except Exception as e:
             print(f"프로젝트 시작 실패: {e}")
+            if 'progress_listener' in locals():
+                progress_listener.close()
+            if 'log_capture' in locals():
+                log_capture.close()
+            if 'execution_id' in locals():
+                get_browser_pool().release(execution_id)
             raise e
     
     def stop_project(self, force: bool = False) -> bool:
@@ -144,16 +197,21 @@ class CXClaimExecutor:
                         print("프로젝트 강제 중지 (타임아웃): CX 클레임처리")
             
             # 실행 이력 업데이트 (실행 ID를 미리 저장한 값 사용)
+            final_progress = self._close_progress(self.running_process)
             for history_item in reversed(self.execution_history):
                 if history_item["execution_id"] == execution_id and history_item["status"] == "running":
                     history_item["status"] = "stopped"
                     history_item["end_time"] = datetime.now()
+                    history_item["progress"] = final_progress
                     break
             
             # 실행 중인 프로젝트에서 제거
             self.running_process = None
             self.current_execution_id = None
             
+            # 대여한 브라우저 풀 세션 반납
+            get_browser_pool().release(execution_id)
+            
             return True
             
         except Exception as e:
@@ -179,6 +237,7 @@ class CXClaimExecutor:
                 # 실행 시간 계산
                 duration = info["end_time"] - info["start_time"]
                 duration_str = str(duration).split('.')[0]
+                final_progress = self._close_progress(info)
                 
                 # 실행 이력 업데이트
                 for history_item in reversed(self.execution_history):
@@ -187,14 +246,16 @@ class CXClaimExecutor:
                         history_item["end_time"] = info["end_time"]
                         history_item["return_code"] = return_code
                         history_item["duration"] = duration_str
+                        history_item["progress"] = final_progress
                         break
                 
                 # 실행 중인 프로젝트에서 제거
                 self.running_process = None
                 self.current_execution_id = None
                 
-                # 임시 설정 파일 정리
+                # 임시 설정 파일 정리 및 브라우저 풀 세션 반납
                 self._cleanup_temp_config(info["execution_id"])
+                get_browser_pool().release(info["execution_id"])
                 
                 return {
                     "execution_id": info["execution_id"],
@@ -202,7 +263,8 @@ class CXClaimExecutor:
                     "end_time": info["end_time"].isoformat(),
                     "status": info["status"],
                     "duration": duration_str,
-                    "return_code": return_code
+                    "return_code": return_code,
+                    "progress": final_progress
                 }
             else:
                 # 프로세스가 아직 실행 중
@@ -210,7 +272,8 @@ class CXClaimExecutor:
                     "execution_id": info["execution_id"],
                     "start_time": info["start_time"].isoformat(),
                     "status": "running",
-                    "duration": str(datetime.now() - info["start_time"]).split('.')[0]
+                    "duration": str(datetime.now() - info["start_time"]).split('.')[0],
+                    "progress": info["progress"].snapshot() if info.get("progress") else None
                 }
         
         return None
@@ -219,27 +282,23 @@ class CXClaimExecutor:
         """실행 이력 반환"""
         return self.execution_history[-limit:]
     
-    def _monitor_execution(self, execution_id: str, process: subprocess.Popen):
-        """실행 상태 모니터링"""
+    def get_log_capture(self) -> Optional[RunLogCapture]:
+        """가장 최근 실행의 출력 수집기 반환 (실행 종료 후에도 다음 실행 전까지 유지)"""
+        return self.log_capture
+    
+    def _monitor_execution(self, execution_id: str, process: subprocess.Popen, log_capture: RunLogCapture):
+        """실행 상태 모니터링 (출력은 전체를 모아두지 않고 한 줄씩 수집기로 전달)"""
         try:
             print(f"모니터링 시작: {execution_id}")
             
-            # 프로세스 완료까지 대기 (더 안전한 방식)
             try:
-                # 프로세스가 정상적으로 완료될 때까지 대기
-                stdout, stderr = process.communicate(timeout=None)  # 무제한 대기
-                return_code = process.returncode
+                # 프로세스가 끝날 때까지 출력을 한 줄씩 읽음 (장시간 실행에도 메모리 일정)
+                for line in process.stdout:
+                    log_capture.append(line)
+                return_code = process.wait()
                 
-                print(f"프로세스 완료: {execution_id}, 반환 코드: {return_code}")
-                if stdout:
-                    print(f"stdout: {stdout}")
-                if stderr:
-                    print(f"stderr: {stderr}")
+                print(f"프로세스 완료: {execution_id}, 반환 코드: {return_code} (출력 로그: {log_capture.log_path})")
                     
-            except subprocess.TimeoutExpired:
-                print(f"프로세스 타임아웃: {execution_id}")
-                process.kill()
-                return_code = -1
             except UnicodeDecodeError as e:
                 print(f"인코딩 오류 (무시): {e}")
                 # 인코딩 오류는 무시하고 프로세스 반환 코드 사용
@@ -249,10 +308,12 @@ class CXClaimExecutor:
                 return_code = -1
             
             # 프로세스 완료 시 상태 업데이트
+            log_capture.close()
             self._update_project_status_from_monitor(execution_id, return_code)
             
         except Exception as e:
             print(f"모니터링 오류 ({execution_id}): {e}")
+            log_capture.close()
             self._update_project_status_from_monitor(execution_id, -1)
     
     def _update_project_status_from_monitor(self, execution_id: str, return_code: int):
@@ -269,6 +330,7 @@ class CXClaimExecutor:
                 # 실행 시간 계산
                 duration = self.running_process["end_time"] - self.running_process["start_time"]
                 duration_str = str(duration).split('.')[0]
+                final_progress = self._close_progress(self.running_process)
                 
                 # 실행 이력 업데이트
                 for history_item in reversed(self.execution_history):
@@ -277,20 +339,31 @@ class CXClaimExecutor:
                         history_item["end_time"] = self.running_process["end_time"]
                         history_item["return_code"] = return_code
                         history_item["duration"] = duration_str
+                        history_item["progress"] = final_progress
                         break
                 
                 # 실행 중인 프로젝트에서 제거
                 self.running_process = None
                 self.current_execution_id = None
                 
-                # 임시 설정 파일 정리
+                # 임시 설정 파일 정리 및 브라우저 풀 세션 반납
                 self._cleanup_temp_config(execution_id)
+                get_browser_pool().release(execution_id)
                 
                 print(f"모니터링 완료: CX 클레임처리 -> {self.running_process['status'] if self.running_process else 'completed'}")
                 
         except Exception as e:
             print(f"상태 업데이트 실패 ({execution_id}): {e}")
     
+    def _close_progress(self, info: Dict) -> Optional[Dict]:
+        """진행 상황 수신 종료 후 마지막 진행 상황 반환"""
+        listener = info.get("progress")
+        if listener is None:
+            return None
+        final_progress = listener.snapshot()
+        listener.close()
+        return final_progress
+    
     def _create_runtime_config(self, config_data: Dict, execution_id: str) -> str:
         """런타임 설정 파일 생성"""
         try:
@@ -314,6 +387,19 @@ class CXClaimExecutor:
             print(f"런타임 설정 파일 생성 실패: {e}")
             raise e
     
+    def _get_journal_path(self, execution_id: str) -> Path:
+        """실행별 체크포인트 저널 경로"""
+        return self.journals_dir / f"cx_claim_{execution_id}.jsonl"
+    
+    def _find_resume_journal(self, execution_id: str) -> Optional[Path]:
+        """재개할 저널 파일 찾기 ("latest"면 가장 최근 저널)"""
+        if execution_id == "latest":
+            journals = sorted(self.journals_dir.glob("cx_claim_*.jsonl"), key=lambda p: p.stat().st_mtime)
+            return journals[-1] if journals else None
+        
+        journal_path = self._get_journal_path(execution_id)
+        return journal_path if journal_path.exists() else None
+    
     def _convert_path_for_server(self, file_path: str) -> str:
         """Windows 경로를 서버 경로로 변환"""
         if not file_path:
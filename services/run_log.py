@@ -0,0 +1,52 @@
+# services/run_log.py - RPA 프로세스 출력 스트리밍 수집 (메모리 링 버퍼 + 용량 제한 로그 파일)
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+class RunLogCapture:
+    """실행 중인 RPA의 stdout을 한 줄씩 받아 최근 N줄만 메모리에 두고 전체는 순환 로그 파일에 기록"""
+
+    def __init__(self, log_path: Path, buffer_lines: int = 2000, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        self.log_path = Path(log_path)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lines = deque(maxlen=max(1, int(buffer_lines)))
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._handler = RotatingFileHandler(
+            str(self.log_path), maxBytes=int(max_bytes), backupCount=int(backup_count), encoding='utf-8'
+        )
+        self._handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def append(self, line: str):
+        """출력 1줄 추가 (줄바꿈 제거 후 저장)"""
+        line = line.rstrip('\r\n')
+        with self._lock:
+            self._sequence += 1
+            self._lines.append((self._sequence, line))
+            if not self._closed:
+                self._handler.emit(logging.makeLogRecord({'msg': line}))
+
+    def lines_since(self, cursor: Optional[int] = None, tail: int = 100) -> Tuple[List[str], int]:
+        """cursor 이후의 줄과 새 cursor 반환 (cursor가 없으면 최근 tail줄부터, 버퍼에서 밀려난 줄은 생략)"""
+        with self._lock:
+            if cursor is None:
+                entries = list(self._lines)[-tail:] if tail > 0 else []
+            else:
+                entries = [(sequence, line) for sequence, line in self._lines if sequence > cursor]
+            return [line for _, line in entries], self._sequence
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        """프로세스 종료 후 파일 닫기 (메모리 버퍼는 다음 실행 전까지 조회 가능)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._handler.close()
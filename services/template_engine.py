@@ -0,0 +1,108 @@
+# services/template_engine.py - 메일 템플릿 컴파일/렌더링 ({변수} 치환)
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# 사용 가능한 템플릿 변수 → 설명
+TEMPLATE_VARIABLES = {
+    '체크인': '체크인 날짜 (YYYY-MM-DD)',
+    '체크아웃': '체크아웃 날짜 (YYYY-MM-DD)',
+    '숙소': '숙소명',
+    '투숙자': '투숙자명',
+    'Book NO': '예약 컨펌번호',
+    '요청날짜': '클레임 요청 날짜',
+    '담당자': '담당자명',
+    '요청분류': '요청 분류',
+    '투숙자명': '투숙자명 (투숙자와 동일)',
+    '투숙자 연락처': '투숙자 연락처',
+    '박수': '박수 (예: 2박)',
+    '객실수': '객실 수',
+    '객실명': '객실명',
+    '상품명': '상품명',
+    '요청사유': '요청 사유',
+    '요청사항': '요청 사항'
+}
+
+# {변수명} 패턴
+PLACEHOLDER_PATTERN = re.compile(r'\{([^{}]*)\}')
+
+# 컴파일 결과 캐시 최대 개수 (템플릿 해시 기준)
+CACHE_SIZE = 64
+
+class TemplateError(ValueError):
+    """템플릿 형식 오류 (중괄호 짝 불일치, 알 수 없는 변수 등)"""
+
+class CompiledTemplate:
+    """{변수} 위치를 미리 분리해 둔 템플릿. 렌더링은 조각을 한 번에 join"""
+
+    def __init__(self, text: str, segments: List[Tuple[str, Optional[str]]]):
+        self.text = text
+        # (앞쪽 고정 문자열, 변수명 또는 None) 목록
+        self.segments = segments
+        # 등장 순서대로의 변수 목록 (중복 포함)
+        self.placeholders = [name for _, name in segments if name is not None]
+        self.variables = sorted(set(self.placeholders))
+
+    def render(self, values: Dict) -> str:
+        parts = []
+        for literal, name in self.segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(str(values.get(name, '')))
+        return ''.join(parts)
+
+_cache: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def parse_template(text: str) -> List[Tuple[str, Optional[str]]]:
+    """템플릿을 (고정 문자열, 변수명) 조각으로 분리하고 형식/변수를 검사합니다."""
+    segments = []
+    unknown = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(text):
+        literal = text[position:match.start()]
+        if '{' in literal or '}' in literal:
+            raise TemplateError("중괄호가 올바르지 않습니다.")
+        name = match.group(1)
+        if not name.strip():
+            raise TemplateError("비어있는 변수({})가 있습니다.")
+        if name not in TEMPLATE_VARIABLES and name not in unknown:
+            unknown.append(name)
+        segments.append((literal, name))
+        position = match.end()
+
+    tail = text[position:]
+    if '{' in tail or '}' in tail:
+        raise TemplateError("중괄호가 올바르지 않습니다.")
+    if unknown:
+        raise TemplateError(f"알 수 없는 변수: {', '.join('{' + name + '}' for name in unknown)}")
+    if tail or not segments:
+        segments.append((tail, None))
+    return segments
+
+def compile_template(text: str) -> CompiledTemplate:
+    """템플릿 컴파일 (같은 내용은 캐시된 결과 재사용). 형식 오류 시 TemplateError"""
+    text = text or ''
+    key = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    compiled = CompiledTemplate(text, parse_template(text))
+    with _cache_lock:
+        _cache[key] = compiled
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+def extract_variables(text: str) -> List[str]:
+    """템플릿에 쓰인 {변수} 이름 목록 (형식 검사 없이 추출, 알 수 없는 변수도 포함)"""
+    return sorted({name for name in PLACEHOLDER_PATTERN.findall(text or '') if name.strip()})
+
+def render_template(text: str, values: Dict) -> str:
+    """템플릿 렌더링 (컴파일 결과 캐시 사용)"""
+    return compile_template(text).render(values)
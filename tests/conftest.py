@@ -0,0 +1,34 @@
+# tests/conftest.py - 프로젝트 루트를 import 경로에 추가 (services 패키지 사용), RPA 스크립트 로드 fixture
+import sys
+import json
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+@pytest.fixture
+def rpa(tmp_path, monkeypatch):
+    """임시 디렉토리를 쓰는 설정으로 RPA 스크립트를 모듈로 로드"""
+    pytest.importorskip("selenium")
+    pytest.importorskip("requests")
+    with open(PROJECT_ROOT / "cx_claim_config.json", encoding="utf-8") as f:
+        config = json.load(f)
+    config["file_paths"].update({
+        "logs_dir": str(tmp_path / "logs"),
+        "results_dir": str(tmp_path / "results"),
+        "claim_list_dir": str(tmp_path / "claim_list")
+    })
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setenv("CONFIG_FILE_PATH", str(config_path))
+    monkeypatch.delenv("PROGRESS_ADDRESS", raising=False)
+    monkeypatch.delenv("BROWSER_POOL_ADDRESSES", raising=False)
+
+    spec = importlib.util.spec_from_file_location("cxlist_rpa", PROJECT_ROOT / "cxlist_rpa_v2.1.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    module.log_writer.close()
@@ -0,0 +1,77 @@
+# tests/test_cx_reader.py - CX 리스트 읽기 (xlsx 스트리밍, 스냅샷, 주문번호 정규화)
+import re
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+from services.cx_reader import build_cx_snapshot, iter_cx_records, read_cx_frame
+from services.cx_snapshot import snapshot_path
+
+HEADER = ['NO', '요청날짜', '담당자', '주문번호', '고객명', '요청분류', '요청사유', '요청사항']
+
+def write_cx_xlsx(path, rows):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "list"
+    sheet.append(HEADER)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+def make_row(no, order_number):
+    return [no, '2024-01-15', '김담당', order_number, f'고객{no}', '객실변경', '고객 요청', '객실 변경 요청']
+
+def read_records(path, **options):
+    return [record for chunk in iter_cx_records(path, **options) for record in chunk]
+
+def test_stale_dimension_tag_does_not_drop_rows(tmp_path):
+    """<dimension ref>가 실제 범위보다 작게 기록된 파일도 끝까지 읽어야 함"""
+    source = tmp_path / "source.xlsx"
+    write_cx_xlsx(source, [make_row(no, f"AMT{no:04d}") for no in range(1, 11)])
+
+    # 시트 XML의 dimension을 2행까지로 잘못 기록
+    stale = tmp_path / "stale.xlsx"
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(stale, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                data, count = re.subn(rb'<dimension ref="[^"]+"', b'<dimension ref="A1:H2"', data)
+                assert count == 1
+            dst.writestr(item, data)
+
+    records = read_records(stale)
+    assert [record['order_number'] for record in records] == [f"AMT{no:04d}" for no in range(1, 11)]
+
+@pytest.mark.parametrize("chunk_size", [2, 3, 1000])
+def test_numeric_order_numbers_are_independent_of_blank_cells(tmp_path, chunk_size):
+    """같은 청크에 빈 주문번호가 있어도 숫자 주문번호는 "366543.0"이 아니라 "366543"으로 읽어야 함"""
+    path = tmp_path / "numeric.xlsx"
+    write_cx_xlsx(path, [
+        make_row(1, 366543),
+        make_row(2, None),
+        make_row(3, 366544),
+        make_row(4, 366545),
+        make_row(5, 'AMT0005')
+    ])
+
+    expected = ['366543', '366544', '366545', 'AMT0005']
+    records = read_records(path, chunk_size=chunk_size)
+    assert [record['order_number'] for record in records] == expected
+    assert [record['no'] for record in records] == [1, 3, 4, 5]
+
+    # 스냅샷에서 읽어도 같은 결과
+    build_cx_snapshot(path)
+    assert snapshot_path(path).exists()
+    assert read_records(path, chunk_size=chunk_size) == records
+
+def test_snapshot_matches_source_frame(tmp_path):
+    path = tmp_path / "cx.xlsx"
+    write_cx_xlsx(path, [make_row(no, None if no == 3 else 1000 + no) for no in range(1, 8)])
+
+    source = read_cx_frame(path, required=[], use_snapshot=False)
+    build_cx_snapshot(path)
+    snapshot = read_cx_frame(path, required=[])
+    assert snapshot.index.tolist() == source.index.tolist()
+    assert snapshot['주문번호'].tolist() == source['주문번호'].tolist()
+    assert read_cx_frame(path, required=[], start_row=4, end_row=5).index.tolist() == [4, 5]
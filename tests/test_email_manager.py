@@ -0,0 +1,23 @@
+# tests/test_email_manager.py - 템플릿 변수 목록 API 동작 확인
+from services.email_manager import EmailManager
+
+def make_manager(subject, body):
+    manager = EmailManager()
+    manager.config = {"email_template": {"subject_template": subject, "body_template": body}}
+    return manager
+
+def test_template_variables_lists_known_variables():
+    result = make_manager("[{숙소}] 요청", "{체크인} ~ {체크아웃}").get_template_variables()
+    assert result["success"] is True
+    assert [v["name"] for v in result["variables"]] == ["숙소", "체크아웃", "체크인"]
+    assert "warning" not in result
+
+def test_template_variables_keeps_unknown_variables_with_warning():
+    """저장된 템플릿에 알 수 없는 변수가 있어도 목록을 반환하고 경고만 추가"""
+    result = make_manager("[{숙소}] 요청", "{없는변수} 안내").get_template_variables()
+    assert result["success"] is True
+    variables = {v["name"]: v for v in result["variables"]}
+    assert variables["없는변수"]["description"] == "설명 없음"
+    assert "숙소" in variables
+    assert result["unknown_variables"] == ["없는변수"]
+    assert "없는변수" in result["warning"]
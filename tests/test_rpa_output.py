@@ -0,0 +1,71 @@
+# tests/test_rpa_output.py - 주문 출력 단계(클레임 엑셀/메일 파일) 실패 처리 확인
+import os
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("requests")
+
+CX_DATA = {"order_number": "AMT0001", "request_date": "2024-01-15", "manager": "김담당",
+           "request_category": "객실변경", "request_reason": "고객 요청", "request_content": "객실 변경 요청"}
+WEB_DATA = {"hotel_name": "테스트호텔", "guest_name": "홍길동", "checkin": "2024-02-01", "checkout": "2024-02-02"}
+
+def write_output(rpa):
+    return rpa.write_order_output(1, 1, CX_DATA, WEB_DATA, {}, "2024-01-15 10:00:00", "")
+
+def test_failed_workbook_write_leaves_no_mail_file(rpa, monkeypatch):
+    """작성 스레드의 엑셀 저장이 실패하면 메일 파일을 만들지 않아야 함"""
+    def failing_write(excel_path, order_number, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rpa, "write_claim_workbook", failing_write)
+    rpa.init_claim_writer()
+    try:
+        assert write_output(rpa) == "엑셀생성실패"
+    finally:
+        rpa.claim_writer.shutdown()
+    assert not any("테스트호텔" in name for name in os.listdir(rpa.result_dir))
+
+def test_successful_output_writes_workbook_and_mail(rpa):
+    rpa.init_claim_writer()
+    try:
+        assert write_output(rpa) == "성공"
+    finally:
+        rpa.claim_writer.shutdown()
+    workbooks = os.listdir(rpa.claim_dir)
+    assert len(workbooks) == 1 and os.path.getsize(os.path.join(rpa.claim_dir, workbooks[0])) > 0
+
+def test_failed_workbook_write_releases_claimed_name(rpa, monkeypatch):
+    """저장 실패 시 선점한 파일(.part)을 지우고 최종 파일명에는 빈 파일을 남기지 않아야 함"""
+    save = rpa.Workbook.save
+
+    def failing_save(workbook, path):
+        save(workbook, path)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rpa.Workbook, "save", failing_save)
+    rpa.init_claim_writer()
+    try:
+        assert write_output(rpa) == "엑셀생성실패"
+    finally:
+        rpa.claim_writer.shutdown()
+    assert os.listdir(rpa.claim_dir) == []
+
+def test_claimed_numbers_skip_in_progress_files(rpa):
+    """작성 중(.part)인 번호와 완성된 번호 모두 건너뛰고 다음 번호를 선점"""
+    directory = os.path.join(rpa.claim_dir, "alloc")
+    os.makedirs(directory)
+    open(os.path.join(directory, "A_001.xlsx"), "w").close()
+    open(os.path.join(directory, "A_002.xlsx.part"), "w").close()
+
+    allocator = rpa.FilenameAllocator()
+    path = allocator.allocate(directory, "A", ".xlsx", partial=True)
+    assert os.path.basename(path) == "A_003.xlsx"
+    assert not os.path.exists(path) and os.path.exists(path + ".part")
+
+    def write(part_path):
+        with open(part_path, "w") as f:
+            f.write("done")
+
+    rpa.write_claimed_file(path, write)
+    assert sorted(os.listdir(directory)) == ["A_001.xlsx", "A_002.xlsx.part", "A_003.xlsx"]
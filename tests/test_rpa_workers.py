@@ -0,0 +1,116 @@
+# tests/test_rpa_workers.py - 워커 브라우저 세션 재시작, 재시도 단계, 종료 시 워커 중지 처리 확인
+import queue
+import threading
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("requests")
+
+class FakeDriver:
+    """current_url 접근으로 생존 여부를 판단하는 가짜 드라이버"""
+
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return "https://admin.example.com/orders"
+
+    def quit(self):
+        self.alive = False
+
+def test_restarted_driver_is_used_in_retry_pass(rpa, monkeypatch):
+    """주문 처리 중 브라우저가 죽으면 재시작한 드라이버로 재시도 단계의 주문도 성공해야 함"""
+    original = FakeDriver("original")
+    restarted = []
+
+    def fake_start_worker_driver(worker_id, cookies):
+        web_driver = FakeDriver(f"restarted-{len(restarted)}")
+        restarted.append(web_driver)
+        return web_driver
+
+    def fake_process_order_group(rows, total):
+        web_driver = rpa.current_driver()
+        order_number = rows[0][1]["order_number"]
+        if order_number == "A" and web_driver is original:
+            # 첫 주문 처리 중 브라우저 종료 → 일시적 실패
+            original.alive = False
+            return ["검색실패"] * len(rows), 0
+        if not web_driver.alive:
+            return ["검색실패"] * len(rows), 0
+        return ["성공"] * len(rows), 0
+
+    monkeypatch.setattr(rpa, "start_worker_driver", fake_start_worker_driver)
+    monkeypatch.setattr(rpa, "process_order_group", fake_process_order_group)
+    monkeypatch.setattr(rpa, "output_pipeline", None)
+    rpa.run_stats.clear()
+
+    order_queue = queue.Queue()
+    for order_number in ("A", "B"):
+        order_queue.put((order_number, [(1, {"order_number": order_number})]))
+    retry_queue = queue.Queue()
+    drivers = [original]
+
+    rpa.run_workers(drivers, order_queue, 2, retry_queue)
+    assert drivers == restarted[:1]
+    assert retry_queue.qsize() == 1
+
+    rpa.run_workers(drivers, retry_queue, 2)
+    assert rpa.run_stats == {"성공": 2}
+    assert len(restarted) == 1
+
+def test_dead_driver_is_restarted_before_retry_pass(rpa, monkeypatch):
+    """재시도 단계 시작 시 죽어 있는 드라이버는 주문을 꺼내기 전에 교체"""
+    dead = FakeDriver("dead")
+    dead.alive = False
+    replacement = FakeDriver("replacement")
+
+    monkeypatch.setattr(rpa, "start_worker_driver", lambda worker_id, cookies: replacement)
+    monkeypatch.setattr(rpa, "process_order_group",
+                        lambda rows, total: (["성공" if rpa.current_driver().alive else "검색실패"] * len(rows), 0))
+    monkeypatch.setattr(rpa, "output_pipeline", None)
+    rpa.run_stats.clear()
+
+    retry_queue = queue.Queue()
+    retry_queue.put(("A", [(1, {"order_number": "A"})]))
+    drivers = [dead]
+
+    rpa.run_workers(drivers, retry_queue, 1)
+    assert drivers == [replacement]
+    assert rpa.run_stats == {"성공": 1}
+
+def test_stop_workers_waits_for_in_flight_orders(rpa, monkeypatch):
+    """중지 신호 후 워커는 처리 중인 주문만 마치고 다음 주문을 꺼내지 않으며, stop_workers는 그때까지 대기"""
+    started = threading.Semaphore(0)
+    release = threading.Event()
+    processed = []
+
+    def blocking_process_order_group(rows, total):
+        started.release()
+        release.wait(5)
+        processed.append(rows[0][1]["order_number"])
+        return ["성공"] * len(rows), 0
+
+    monkeypatch.setattr(rpa, "process_order_group", blocking_process_order_group)
+    monkeypatch.setattr(rpa, "output_pipeline", None)
+
+    order_queue = queue.Queue()
+    for order_number in ("A", "B", "C", "D", "E"):
+        order_queue.put((order_number, [(1, {"order_number": order_number})]))
+    drivers = [FakeDriver("first"), FakeDriver("second")]
+
+    # 메인 스레드가 종료 신호로 run_workers의 join에서 빠져나간 상황
+    runner = threading.Thread(target=rpa.run_workers, args=(drivers, order_queue, 5), daemon=True)
+    runner.start()
+    assert started.acquire(timeout=5) and started.acquire(timeout=5)
+    workers = list(rpa.worker_threads)
+
+    threading.Timer(0.2, release.set).start()
+    rpa.stop_workers()
+    assert not any(thread.is_alive() for thread in workers)
+    assert sorted(processed) == ["A", "B"]
+    assert order_queue.qsize() == 3